@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Numba CSV Formatting Kernel
+
+Formats a 2-D float array as comma-separated "%.4f" text into a byte
+buffer without going through the interpreter per value. Used by the CSV
+exporter when numba is installed; the functions are plain Python
+otherwise and are not called on the export path.
+
+Author: DIY Tensile Tester Project
+Version: 2.0.0
+"""
+
+import math
+import numpy as np
+
+# Try to import optional dependencies
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Widest value emitted: sign, 15 integer digits, point, 4 decimals
+_MAX_VALUE_BYTES = 21
+
+# Values are scaled by 1e4 in float64, which stays exact below 2**53
+MAX_EXACT_VALUE = 2.0 ** 53 / 1e4
+
+
+def _product_error(a, b):
+    """Rounding error of a * b (Dekker's two-product), so a*b + err is exact."""
+    p = a * b
+    c = 134217729.0 * a  # 2**27 + 1
+    ah = c - (c - a)
+    al = a - ah
+    c = 134217729.0 * b
+    bh = c - (c - b)
+    bl = b - bh
+    return al * bl - (((p - ah * bh) - al * bh) - ah * bl)
+
+
+def _write_fixed4(out, pos, x):
+    """Write x as "%.4f" at out[pos:], return the new position."""
+    ax = abs(x)
+    hi = ax * 10000.0
+    base = math.floor(hi)
+    if hi - base == 0.5:
+        # The rounded product sits on a tie; the exact one decides
+        err = _product_error(ax, 10000.0)
+        if err > 0:
+            scaled = base + 1.0
+        elif err < 0:
+            scaled = base
+        else:
+            scaled = np.rint(hi)
+    else:
+        scaled = np.rint(hi)
+    if math.copysign(1.0, x) < 0:
+        out[pos] = 45  # '-'
+        pos += 1
+    v = np.int64(scaled)
+    ipart = v // 10000
+    frac = v % 10000
+
+    # Integer digits, least significant first, then reversed in place
+    start = pos
+    while True:
+        out[pos] = 48 + ipart % 10
+        pos += 1
+        ipart //= 10
+        if ipart == 0:
+            break
+    end = pos - 1
+    while start < end:
+        tmp = out[start]
+        out[start] = out[end]
+        out[end] = tmp
+        start += 1
+        end -= 1
+
+    out[pos] = 46  # '.'
+    out[pos + 1] = 48 + frac // 1000
+    out[pos + 2] = 48 + (frac // 100) % 10
+    out[pos + 3] = 48 + (frac // 10) % 10
+    out[pos + 4] = 48 + frac % 10
+    return pos + 5
+
+
+def format_rows(data):
+    """
+    Format rows of finite values as CSV bytes ("%.4f", ",", "\\n").
+
+    Values must satisfy abs(x) < MAX_EXACT_VALUE (about 9e11); output
+    then matches printf byte for byte.
+    """
+    n, k = data.shape
+    out = np.empty(n * (k * (_MAX_VALUE_BYTES + 1)), dtype=np.uint8)
+    pos = 0
+    for i in range(n):
+        for j in range(k):
+            if j:
+                out[pos] = 44  # ','
+                pos += 1
+            pos = _write_fixed4(out, pos, data[i, j])
+        out[pos] = 10  # '\n'
+        pos += 1
+    return out[:pos]
+
+
+if HAS_NUMBA:
+    _product_error = njit(cache=True)(_product_error)
+    _write_fixed4 = njit(cache=True)(_write_fixed4)
+    format_rows = njit(cache=True)(format_rows)
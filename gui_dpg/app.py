@@ -224,13 +224,13 @@ def export_data(format_type: str = "csv", file_path: str = None):
     # Calculate properties for export
     analyzer = ResultsAnalyzer()
     test_data = TestData(
-        times=list(state.times),
-        forces=list(state.forces),
-        extensions=list(state.extensions),
-        stresses=list(state.stresses),
-        strains=list(state.strains),
-        true_stresses=list(state.true_stresses),
-        true_strains=list(state.true_strains)
+        times=state.times,
+        forces=state.forces,
+        extensions=state.extensions,
+        stresses=state.stresses,
+        strains=state.strains,
+        true_stresses=state.true_stresses,
+        true_strains=state.true_strains
     )
     properties = analyzer.analyze(test_data, config)
     
@@ -797,15 +797,15 @@ def show_results():
         results_window = ResultsWindow()
         results_window.on_export = on_results_export
     
-    # Create test data container with COPIES of the data
+    # Create test data container (converted to array copies of the data)
     test_data = TestData(
-        times=list(state.times),
-        forces=list(state.forces),
-        extensions=list(state.extensions),
-        stresses=list(state.stresses),
-        strains=list(state.strains),
-        true_stresses=list(state.true_stresses),
-        true_strains=list(state.true_strains)
+        times=state.times,
+        forces=state.forces,
+        extensions=state.extensions,
+        stresses=state.stresses,
+        strains=state.strains,
+        true_stresses=state.true_stresses,
+        true_strains=state.true_strains
     )
     
     print(f"[show_results] Passing {len(test_data.forces)} data points to ResultsWindow")
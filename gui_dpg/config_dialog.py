@@ -12,15 +12,25 @@ Version: 2.0.0
 import dearpygui.dearpygui as dpg
 from typing import Callable, Optional
 from datetime import datetime
+from enum import Enum
+from functools import lru_cache, partial
 import json
 import os
 
+# Try to import optional dependencies
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from models import (
     TestConfiguration, TestMetadata, SpecimenConfig, MachineConfig,
     TestControlConfig, DataAcquisitionConfig, TerminationCriteria,
     TestStandard, MaterialType, ControlMode, ExtensometerType,
     LoadCellRange
 )
+from config_marshal import field_tables, compile_marshallers
 
 # Color scheme
 COLORS = {
@@ -33,27 +43,399 @@ COLORS = {
     'header': (100, 181, 246),
 }
 
+# Specimen type presets offered in the Specimen tab
+_SPECIMEN_TYPES = (
+    "Type 1A (ISO 527)", "Type 1B (ISO 527)", "Type V (ASTM D638)",
+    "Type I (ASTM D638)", "Round Bar", "Custom",
+)
+
+# Preset dimensions in mm: (gauge, thickness, width, parallel, total, grip)
+_SPECIMEN_PRESETS = {
+    "Type 1A (ISO 527)": (50, 4, 10, 80, 150, 115),
+    "Type 1B (ISO 527)": (50, 4, 10, 60, 150, 115),
+    "Type V (ASTM D638)": (7.62, 3.2, 3.18, 9.53, 63.5, 25.4),
+    "Type I (ASTM D638)": (50, 3.2, 13, 57, 165, 115),
+}
+
+@lru_cache(maxsize=64)
+def _fmt_area(thickness: float, width: float) -> str:
+    """W × T area text, cached since typing often revisits the same values."""
+    return f"{thickness * width:.2f}"
+
+
+# Shared, never mutated, kwargs for layout nodes without options
+_NO_OPTIONS: dict = {}
+
+
+# ============== Dialog Layout ==============
+#
+# Declarative description of every tab. Each node is a tuple whose first
+# element selects a builder in ConfigDialog._BUILDERS; the remaining elements
+# are passed to it. Input nodes carry their UI tag and the "section.attr"
+# path of the config field they edit. Callbacks are given by method name.
+
+_LAYOUT = (
+    ("tab", "Identification", (
+        ("spacer", 10),
+        ("section", "Test Standard"),
+        ("row", (
+            ("label", "Standard:"),
+            ("combo", "cfg_test_standard", "metadata.test_standard", TestStandard, 250),
+        )),
+        ("spacer", 10),
+        ("section", "Sample Identification"),
+        ("text_row", "Test ID:", "cfg_test_id", "metadata.test_id", "Auto-generated if empty"),
+        ("text_row", "Sample ID:", "cfg_sample_id", "metadata.sample_id", "e.g., PLA-001"),
+        ("text_row", "Batch ID:", "cfg_batch_id", "metadata.batch_id", ""),
+        ("text_row", "Lot Number:", "cfg_lot_number", "metadata.lot_number", ""),
+        ("spacer", 10),
+        ("section", "Material Information"),
+        ("row", (
+            ("label", "Material Type:"),
+            ("combo", "cfg_material_type", "metadata.material_type", MaterialType, 200),
+        )),
+        ("text_row", "Material Name:", "cfg_material_name", "metadata.material_name", "e.g., PLA"),
+        ("text_row", "Material Grade:", "cfg_material_grade", "metadata.material_grade", "e.g., eSUN PLA+"),
+        ("spacer", 10),
+        ("section", "Personnel & Project"),
+        ("text_row", "Operator:", "cfg_operator", "metadata.operator_name", ""),
+        ("text_row", "Customer:", "cfg_customer", "metadata.customer_name", ""),
+        ("text_row", "Project:", "cfg_project", "metadata.project_name", ""),
+        ("spacer", 10),
+        ("section", "Environment Conditions"),
+        ("row", (
+            ("label", "Temperature:"),
+            ("float", "cfg_temperature", "metadata.temperature", 100, 0.5),
+            ("label", "°C"),
+            ("hspace", 30),
+            ("label", "Humidity:"),
+            ("float", "cfg_humidity", "metadata.humidity", 100, 1.0),
+            ("label", "% RH"),
+        )),
+        ("spacer", 10),
+        ("section", "Notes"),
+        ("notes", "cfg_notes", "metadata.notes"),
+    )),
+    ("tab", "Specimen", (
+        ("spacer", 10),
+        ("section", "Specimen Type"),
+        ("row", (
+            ("label", "Specimen Type:"),
+            ("combo", "cfg_specimen_type", "specimen.specimen_type", _SPECIMEN_TYPES, 200,
+             {"callback": "_on_specimen_type_changed"}),
+        )),
+        ("spacer", 15),
+        ("section", "Primary Dimensions"),
+        ("table", (150, 150, 50, None), (
+            (("label", "Gauge Length:"),
+             ("float", "cfg_gauge_length", "specimen.gauge_length", 120, 1.0,
+              {"callback": "_on_dimension_changed"}),
+             ("label", "mm"),
+             ("label", "(Lo - measurement length)")),
+            (("label", "Thickness:"),
+             ("float", "cfg_thickness", "specimen.thickness", 120, 0.1,
+              {"callback": "_on_dimension_changed"}),
+             ("label", "mm"),
+             ("label", "")),
+            (("label", "Width:"),
+             ("float", "cfg_width", "specimen.width", 120, 0.1,
+              {"callback": "_on_dimension_changed"}),
+             ("label", "mm"),
+             ("label", "")),
+        )),
+        ("spacer", 10),
+        ("section", "Cross-Sectional Area"),
+        ("row", (
+            ("check", "Manual entry", "cfg_cross_section_manual", "specimen.cross_section_manual",
+             {"callback": "_on_cross_section_mode_changed"}),
+        )),
+        ("row", (
+            ("label", "Area:"),
+            ("float", "cfg_cross_section", "specimen.cross_section_area", 120, 0.1,
+             {"enabled": "specimen.cross_section_manual"}),
+            ("label", "mm²"),
+            ("label", "(W × T = "),
+            ("area",),
+            ("label", " mm²)"),
+        )),
+        ("spacer", 15),
+        ("section", "Secondary Dimensions"),
+        ("table", (150, 150, 50, None), (
+            (("label", "Parallel Length:"),
+             ("float", "cfg_parallel_length", "specimen.parallel_length", 120, 1.0),
+             ("label", "mm"),
+             ("label", "(constant cross-section)")),
+            (("label", "Total Length:"),
+             ("float", "cfg_total_length", "specimen.total_length", 120, 1.0),
+             ("label", "mm"),
+             ("label", "")),
+            (("label", "Grip Distance:"),
+             ("float", "cfg_grip_distance", "specimen.grip_distance", 120, 1.0),
+             ("label", "mm"),
+             ("label", "(between grips)")),
+        )),
+    )),
+    ("tab", "Machine", (
+        ("spacer", 10),
+        ("section", "Load Cell"),
+        ("table", (150, None), (
+            (("label", "Capacity:"),
+             ("combo", "cfg_load_cell_range", "machine.load_cell_range", LoadCellRange, 150)),
+            (("label", "Serial Number:"),
+             ("text", "cfg_load_cell_serial", "machine.load_cell_serial", 200)),
+            (("label", "Calibration Date:"),
+             ("text", "cfg_calibration_date", "machine.load_cell_calibration_date", 150)),
+        )),
+        ("spacer", 15),
+        ("section", "Extensometer"),
+        ("table", (150, None), (
+            (("label", "Type:"),
+             ("combo", "cfg_extensometer_type", "machine.extensometer_type", ExtensometerType, 200)),
+            (("label", "Gauge Length:"),
+             ("row", (
+                 ("float", "cfg_extensometer_gauge", "machine.extensometer_gauge", 100, 5.0),
+                 ("label", "mm"),
+             ))),
+        )),
+        ("spacer", 15),
+        ("section", "Travel Limits"),
+        ("row", (
+            ("label", "Upper Limit:"),
+            ("float", "cfg_upper_limit", "machine.upper_limit", 100, 5.0),
+            ("label", "mm"),
+            ("hspace", 30),
+            ("label", "Lower Limit:"),
+            ("float", "cfg_lower_limit", "machine.lower_limit", 100, 1.0),
+            ("label", "mm"),
+        )),
+        ("spacer", 15),
+        ("section", "Safety Limits"),
+        ("row", (
+            ("label", "Max Force:"),
+            ("float", "cfg_force_limit", "machine.force_limit", 100, 10.0),
+            ("label", "N"),
+            ("hspace", 30),
+            ("label", "Max Extension:"),
+            ("float", "cfg_extension_limit", "machine.extension_limit", 100, 5.0),
+            ("label", "mm"),
+        )),
+        ("spacer", 10),
+        ("check", "Emergency Stop Enabled", "cfg_emergency_enabled", "machine.emergency_stop_enabled"),
+        ("spacer", 15),
+        ("section", "Zeroing on Test Start"),
+        ("check", "Zero force (tare load cell)", "cfg_zero_force", "machine.zero_force_on_start"),
+        ("check", "Zero extension (reset position)", "cfg_zero_extension", "machine.zero_extension_on_start"),
+        ("check", "Zero extensometer", "cfg_zero_extensometer", "machine.zero_extensometer_on_start"),
+    )),
+    ("tab", "Control", (
+        ("spacer", 10),
+        ("section", "Control Mode"),
+        ("row", (
+            ("label", "Mode:"),
+            ("combo", "cfg_control_mode", "control.control_mode", ControlMode, 200,
+             {"callback": "_on_control_mode_changed"}),
+        )),
+        ("spacer", 15),
+        ("section", "Speed Settings"),
+        ("table", (150, 150, None), (
+            (("label", "Test Speed:"),
+             ("float", "cfg_test_speed", "control.test_speed", 100, 0.5),
+             ("label", "mm/min")),
+            (("label", "Strain Rate:"),
+             ("float", "cfg_strain_rate", "control.strain_rate", 100, 0.0001, {"format": "%.4f"}),
+             ("label", "1/s")),
+            (("label", "Load Rate:"),
+             ("float", "cfg_load_rate", "control.load_rate", 100, 1.0),
+             ("label", "N/s")),
+        )),
+        ("spacer", 15),
+        ("section", "Preload"),
+        ("check", "Enable preload", "cfg_preload_enabled", "control.preload_enabled"),
+        ("row", (
+            ("label", "Preload:"),
+            ("float", "cfg_preload_value", "control.preload_value", 100, 0.1),
+            ("label", "N"),
+            ("hspace", 30),
+            ("label", "Speed:"),
+            ("float", "cfg_preload_speed", "control.preload_speed", 100, 1.0),
+            ("label", "mm/min"),
+        )),
+        ("spacer", 15),
+        ("section", "Hold Settings"),
+        ("check", "Enable hold at load", "cfg_hold_enabled", "control.hold_enabled"),
+        ("row", (
+            ("label", "Hold at:"),
+            ("float", "cfg_hold_at_load", "control.hold_at_load", 100, 10.0),
+            ("label", "N"),
+            ("hspace", 30),
+            ("label", "Duration:"),
+            ("float", "cfg_hold_duration", "control.hold_duration", 100, 1.0),
+            ("label", "s"),
+        )),
+        ("spacer", 15),
+        ("section", "Return to Start"),
+        ("check", "Return after test", "cfg_return_enabled", "control.return_enabled"),
+        ("row", (
+            ("label", "Return Speed:"),
+            ("float", "cfg_return_speed", "control.return_speed", 100, 5.0),
+            ("label", "mm/min"),
+        )),
+    )),
+    ("tab", "Acquisition", (
+        ("spacer", 10),
+        ("section", "Sampling Rate"),
+        ("row", (
+            ("label", "Base Rate:"),
+            ("float", "cfg_sampling_rate", "acquisition.sampling_rate", 100, 1.0),
+            ("label", "Hz"),
+        )),
+        ("spacer", 5),
+        ("check", "Enable event-based high-speed sampling", "cfg_event_sampling",
+         "acquisition.event_sampling_enabled"),
+        ("row", (
+            ("label", "Event Rate:"),
+            ("float", "cfg_event_rate", "acquisition.event_sampling_rate", 100, 10.0),
+            ("label", "Hz (during yield, break)"),
+        )),
+        ("spacer", 15),
+        ("section", "Data Filtering"),
+        ("check", "Enable digital filter", "cfg_digital_filter", "acquisition.digital_filter_enabled"),
+        ("row", (
+            ("label", "Cutoff Frequency:"),
+            ("float", "cfg_filter_cutoff", "acquisition.filter_cutoff", 100, 1.0),
+            ("label", "Hz"),
+        )),
+        ("spacer", 5),
+        ("check", "Enable median filter (noise reduction)", "cfg_median_filter",
+         "acquisition.median_filter_enabled"),
+        ("row", (
+            ("label", "Window Size:"),
+            ("int", "cfg_median_window", "acquisition.median_filter_window", 100, 2,
+             {"min_value": 3, "max_value": 11}),
+            ("label", "samples"),
+        )),
+        ("spacer", 15),
+        ("section", "Recording Channels"),
+        ("row", (
+            ("check", "Force", None, None, {"default_value": True, "enabled": False}),
+            ("check", "Extension", None, None, {"default_value": True, "enabled": False}),
+            ("check", "Time", None, None, {"default_value": True, "enabled": False}),
+        )),
+        ("row", (
+            ("check", "Strain", "cfg_record_strain", "acquisition.record_strain"),
+            ("check", "Temperature", "cfg_record_temp", "acquisition.record_temperature"),
+            ("check", "Video", "cfg_record_video", "acquisition.record_video"),
+        )),
+        ("spacer", 15),
+        ("section", "Real-time Calculations"),
+        ("check", "Calculate true stress/strain (large deformation)", "cfg_true_values",
+         "acquisition.calculate_true_values"),
+    )),
+    ("tab", "Termination", (
+        ("spacer", 10),
+        ("section", "Break Detection"),
+        ("check", "Enable automatic break detection", "cfg_break_detection",
+         "termination.break_detection_enabled"),
+        ("row", (
+            ("label", "Force Drop:"),
+            ("float", "cfg_break_drop", "termination.break_force_drop", 100, 5.0),
+            ("label", "% from peak"),
+        )),
+        ("row", (
+            ("label", "Min Force After Break:"),
+            ("float", "cfg_break_threshold", "termination.break_force_threshold", 100, 0.1),
+            ("label", "N"),
+        )),
+        ("spacer", 15),
+        ("section", "Safety Limits (Test will stop if exceeded)"),
+        ("row", (
+            ("label", "Maximum Force:"),
+            ("float", "cfg_term_max_force", "termination.max_force", 100, 10.0),
+            ("label", "N"),
+            ("hspace", 30),
+            ("label", "Maximum Extension:"),
+            ("float", "cfg_term_max_ext", "termination.max_extension", 100, 5.0),
+            ("label", "mm"),
+        )),
+        ("row", (
+            ("label", "Maximum Strain:"),
+            ("float", "cfg_term_max_strain", "termination.max_strain", 100, 10.0),
+            ("label", "%"),
+            ("hspace", 30),
+            ("label", "Maximum Time:"),
+            ("float", "cfg_term_max_time", "termination.max_time", 100, 60.0),
+            ("label", "s"),
+        )),
+        ("spacer", 15),
+        ("section", "Post-Break Actions"),
+        ("check", "Stop test at break", "cfg_stop_at_break", "termination.stop_at_break"),
+        ("check", "Return to start after break", "cfg_return_after_break", "termination.return_after_break"),
+    )),
+)
+
+# UI <-> config field tables derived from the layout, one pair per tab
+_TAB_FIELDS = tuple(field_tables(tab[2]) for tab in _LAYOUT)
+
+# Combo display value -> enum member, per enum combo tag
+_ENUM_MAPS = {
+    tag: {e.value: e for e in enum_cls}
+    for _, enum_fields in _TAB_FIELDS
+    for tag, _, _, enum_cls in enum_fields
+}
+
+# Generated (read, write) marshallers per tab, see config_marshal
+_TAB_MARSHALLERS = tuple(
+    compile_marshallers(field_map, enum_fields, _ENUM_MAPS)
+    for field_map, enum_fields in _TAB_FIELDS
+)
+
 
 class ConfigDialog:
     """Professional multi-tab configuration dialog."""
     
     def __init__(self):
+        # Serialized form of the config for saving, reused until it changes
+        self._cached_dict: Optional[dict] = None
+        self._config_dirty = True
         self.config = TestConfiguration()
         self.on_config_applied: Optional[Callable[[TestConfiguration], None]] = None
         self.window_tag = "config_dialog_window"
+        # Last thickness/width seen and area text shown, to skip no-op updates
+        self._last_dims = (None, None)
+        self._last_calc_str = None
+        # Indices into _LAYOUT of tabs whose widgets exist
+        self._built_tabs = set()
+        # Set by input callbacks; _read_config is skipped while the UI and
+        # config are known to agree
+        self._ui_dirty = True
         
+    @property
+    def config(self) -> TestConfiguration:
+        return self._config
+    
+    @config.setter
+    def config(self, config: TestConfiguration):
+        self._config = config
+        self._config_dirty = True
+        self._ui_dirty = True
+    
     def show(self):
         """Show the configuration dialog."""
-        if dpg.does_item_exist(self.window_tag):
-            dpg.show_item(self.window_tag)
-            return
-        
-        self._create_dialog()
+        # The owner may have edited the shared config while we were hidden
+        self._config_dirty = True
+        self._ui_dirty = True
+        if not dpg.does_item_exist(self.window_tag):
+            self._create_dialog()
+
+        # The window is built once and only toggled afterwards; modal is
+        # re-enabled here because hide() drops it to release the backdrop.
+        dpg.configure_item(self.window_tag, modal=True)
         dpg.show_item(self.window_tag)
-    
+
     def hide(self):
         """Hide the configuration dialog."""
         if dpg.does_item_exist(self.window_tag):
+            dpg.configure_item(self.window_tag, modal=False)
             dpg.hide_item(self.window_tag)
     
     def _create_dialog(self):
@@ -68,14 +450,12 @@ class ConfigDialog:
             no_collapse=True,
             pos=(162, 25)
         ):
-            # Tab bar
-            with dpg.tab_bar(tag="config_tabs"):
-                self._create_metadata_tab()
-                self._create_specimen_tab()
-                self._create_machine_tab()
-                self._create_control_tab()
-                self._create_acquisition_tab()
-                self._create_termination_tab()
+            # Tab bar - only the first tab is populated up front, the rest
+            # are built the first time they are selected
+            with dpg.tab_bar(tag="config_tabs", callback=self._on_tab_changed):
+                for i, (_, label, _) in enumerate(_LAYOUT):
+                    dpg.add_tab(label=label, tag=f"config_tab_{i}")
+            self._build_tab(0)
             
             dpg.add_spacer(height=10)
             dpg.add_separator()
@@ -91,657 +471,201 @@ class ConfigDialog:
                 dpg.add_button(label="Save...", width=80, callback=self._on_save)
                 dpg.add_button(label="Reset", width=80, callback=self._on_reset)
     
-    # ============== Tab Creation ==============
+    # ============== Layout Builders ==============
     
-    def _create_metadata_tab(self):
-        """Create metadata/identification tab."""
-        with dpg.tab(label="Identification"):
-            dpg.add_spacer(height=10)
-            
-            # Test Standard selection
-            self._section_header("Test Standard")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Standard:", color=COLORS['text_dim'])
-                dpg.add_combo(
-                    items=[e.value for e in TestStandard],
-                    default_value=self.config.metadata.test_standard.value,
-                    width=250,
-                    tag="cfg_test_standard"
-                )
-            
-            dpg.add_spacer(height=10)
-            
-            # Sample Identification
-            self._section_header("Sample Identification")
-            self._input_row("Test ID:", "cfg_test_id", self.config.metadata.test_id, "Auto-generated if empty")
-            self._input_row("Sample ID:", "cfg_sample_id", self.config.metadata.sample_id, "e.g., PLA-001")
-            self._input_row("Batch ID:", "cfg_batch_id", self.config.metadata.batch_id, "")
-            self._input_row("Lot Number:", "cfg_lot_number", self.config.metadata.lot_number, "")
-            
-            dpg.add_spacer(height=10)
-            
-            # Material Information
-            self._section_header("Material Information")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Material Type:", color=COLORS['text_dim'])
-                dpg.add_combo(
-                    items=[e.value for e in MaterialType],
-                    default_value=self.config.metadata.material_type.value,
-                    width=200,
-                    tag="cfg_material_type"
-                )
-            self._input_row("Material Name:", "cfg_material_name", self.config.metadata.material_name, "e.g., PLA")
-            self._input_row("Material Grade:", "cfg_material_grade", self.config.metadata.material_grade, "e.g., eSUN PLA+")
-            
-            dpg.add_spacer(height=10)
-            
-            # Personnel
-            self._section_header("Personnel & Project")
-            self._input_row("Operator:", "cfg_operator", self.config.metadata.operator_name, "")
-            self._input_row("Customer:", "cfg_customer", self.config.metadata.customer_name, "")
-            self._input_row("Project:", "cfg_project", self.config.metadata.project_name, "")
-            
-            dpg.add_spacer(height=10)
-            
-            # Environment
-            self._section_header("Environment Conditions")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Temperature:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.metadata.temperature,
-                    width=100, tag="cfg_temperature", step=0.5
-                )
-                dpg.add_text("°C", color=COLORS['text_dim'])
-                dpg.add_spacer(width=30)
-                dpg.add_text("Humidity:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.metadata.humidity,
-                    width=100, tag="cfg_humidity", step=1.0
-                )
-                dpg.add_text("% RH", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=10)
-            
-            # Notes
-            self._section_header("Notes")
-            dpg.add_input_text(
-                default_value=self.config.metadata.notes,
-                width=-1, height=60,
-                multiline=True,
-                tag="cfg_notes"
-            )
-    
-    def _create_specimen_tab(self):
-        """Create specimen dimensions tab."""
-        with dpg.tab(label="Specimen"):
-            dpg.add_spacer(height=10)
-            
-            # Specimen Type
-            self._section_header("Specimen Type")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Specimen Type:", color=COLORS['text_dim'])
-                dpg.add_combo(
-                    items=["Type 1A (ISO 527)", "Type 1B (ISO 527)", "Type V (ASTM D638)", 
-                           "Type I (ASTM D638)", "Round Bar", "Custom"],
-                    default_value=self.config.specimen.specimen_type,
-                    width=200,
-                    tag="cfg_specimen_type",
-                    callback=self._on_specimen_type_changed
-                )
-            
-            dpg.add_spacer(height=15)
-            
-            # Primary Dimensions
-            self._section_header("Primary Dimensions")
-            
-            with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=50)
-                dpg.add_table_column()
-                
-                # Gauge Length
-                with dpg.table_row():
-                    dpg.add_text("Gauge Length:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.specimen.gauge_length,
-                        width=120, tag="cfg_gauge_length", step=1.0,
-                        callback=self._on_dimension_changed
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                    dpg.add_text("(Lo - measurement length)", color=COLORS['text_dim'])
-                
-                # Thickness
-                with dpg.table_row():
-                    dpg.add_text("Thickness:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.specimen.thickness,
-                        width=120, tag="cfg_thickness", step=0.1,
-                        callback=self._on_dimension_changed
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                    dpg.add_text("", color=COLORS['text_dim'])
-                
-                # Width
-                with dpg.table_row():
-                    dpg.add_text("Width:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.specimen.width,
-                        width=120, tag="cfg_width", step=0.1,
-                        callback=self._on_dimension_changed
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                    dpg.add_text("", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=10)
-            
-            # Cross-section Area
-            self._section_header("Cross-Sectional Area")
-            with dpg.group(horizontal=True):
-                dpg.add_checkbox(
-                    label="Manual entry",
-                    default_value=self.config.specimen.cross_section_manual,
-                    tag="cfg_cross_section_manual",
-                    callback=self._on_cross_section_mode_changed
-                )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Area:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.specimen.cross_section_area,
-                    width=120, tag="cfg_cross_section", step=0.1,
-                    enabled=self.config.specimen.cross_section_manual
-                )
-                dpg.add_text("mm²", color=COLORS['text_dim'])
-                dpg.add_text("(W × T = ", color=COLORS['text_dim'])
-                dpg.add_text(f"{self.config.specimen.width * self.config.specimen.thickness:.2f}", 
-                            tag="cfg_calculated_area", color=COLORS['accent'])
-                dpg.add_text(" mm²)", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Secondary Dimensions
-            self._section_header("Secondary Dimensions")
-            with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=50)
-                dpg.add_table_column()
-                
-                # Parallel Length
-                with dpg.table_row():
-                    dpg.add_text("Parallel Length:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.specimen.parallel_length,
-                        width=120, tag="cfg_parallel_length", step=1.0
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                    dpg.add_text("(constant cross-section)", color=COLORS['text_dim'])
-                
-                # Total Length
-                with dpg.table_row():
-                    dpg.add_text("Total Length:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.specimen.total_length,
-                        width=120, tag="cfg_total_length", step=1.0
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                    dpg.add_text("", color=COLORS['text_dim'])
-                
-                # Grip Distance
-                with dpg.table_row():
-                    dpg.add_text("Grip Distance:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.specimen.grip_distance,
-                        width=120, tag="cfg_grip_distance", step=1.0
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                    dpg.add_text("(between grips)", color=COLORS['text_dim'])
-    
-    def _create_machine_tab(self):
-        """Create machine configuration tab."""
-        with dpg.tab(label="Machine"):
-            dpg.add_spacer(height=10)
-            
-            # Load Cell
-            self._section_header("Load Cell")
-            with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column()
-                
-                with dpg.table_row():
-                    dpg.add_text("Capacity:", color=COLORS['text_dim'])
-                    dpg.add_combo(
-                        items=[e.value for e in LoadCellRange],
-                        default_value=self.config.machine.load_cell_range.value,
-                        width=150,
-                        tag="cfg_load_cell_range"
-                    )
-                
-                with dpg.table_row():
-                    dpg.add_text("Serial Number:", color=COLORS['text_dim'])
-                    dpg.add_input_text(
-                        default_value=self.config.machine.load_cell_serial,
-                        width=200, tag="cfg_load_cell_serial"
-                    )
-                
-                with dpg.table_row():
-                    dpg.add_text("Calibration Date:", color=COLORS['text_dim'])
-                    dpg.add_input_text(
-                        default_value=self.config.machine.load_cell_calibration_date,
-                        width=150, tag="cfg_calibration_date"
-                    )
-            
-            dpg.add_spacer(height=15)
-            
-            # Extensometer
-            self._section_header("Extensometer")
-            with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column()
-                
-                with dpg.table_row():
-                    dpg.add_text("Type:", color=COLORS['text_dim'])
-                    dpg.add_combo(
-                        items=[e.value for e in ExtensometerType],
-                        default_value=self.config.machine.extensometer_type.value,
-                        width=200,
-                        tag="cfg_extensometer_type"
-                    )
-                
-                with dpg.table_row():
-                    dpg.add_text("Gauge Length:", color=COLORS['text_dim'])
-                    with dpg.group(horizontal=True):
-                        dpg.add_input_float(
-                            default_value=self.config.machine.extensometer_gauge,
-                            width=100, tag="cfg_extensometer_gauge", step=5.0
-                        )
-                        dpg.add_text("mm", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Travel Limits
-            self._section_header("Travel Limits")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Upper Limit:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.machine.upper_limit,
-                    width=100, tag="cfg_upper_limit", step=5.0
-                )
-                dpg.add_text("mm", color=COLORS['text_dim'])
-                dpg.add_spacer(width=30)
-                dpg.add_text("Lower Limit:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.machine.lower_limit,
-                    width=100, tag="cfg_lower_limit", step=1.0
-                )
-                dpg.add_text("mm", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Safety Limits
-            self._section_header("Safety Limits")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Max Force:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.machine.force_limit,
-                    width=100, tag="cfg_force_limit", step=10.0
-                )
-                dpg.add_text("N", color=COLORS['text_dim'])
-                dpg.add_spacer(width=30)
-                dpg.add_text("Max Extension:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.machine.extension_limit,
-                    width=100, tag="cfg_extension_limit", step=5.0
-                )
-                dpg.add_text("mm", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=10)
-            dpg.add_checkbox(
-                label="Emergency Stop Enabled",
-                default_value=self.config.machine.emergency_stop_enabled,
-                tag="cfg_emergency_enabled"
-            )
-            
-            dpg.add_spacer(height=15)
-            
-            # Zeroing Options
-            self._section_header("Zeroing on Test Start")
-            dpg.add_checkbox(
-                label="Zero force (tare load cell)",
-                default_value=self.config.machine.zero_force_on_start,
-                tag="cfg_zero_force"
-            )
-            dpg.add_checkbox(
-                label="Zero extension (reset position)",
-                default_value=self.config.machine.zero_extension_on_start,
-                tag="cfg_zero_extension"
-            )
-            dpg.add_checkbox(
-                label="Zero extensometer",
-                default_value=self.config.machine.zero_extensometer_on_start,
-                tag="cfg_zero_extensometer"
-            )
-    
-    def _create_control_tab(self):
-        """Create test control parameters tab."""
-        with dpg.tab(label="Control"):
-            dpg.add_spacer(height=10)
-            
-            # Control Mode
-            self._section_header("Control Mode")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Mode:", color=COLORS['text_dim'])
-                dpg.add_combo(
-                    items=[e.value for e in ControlMode],
-                    default_value=self.config.control.control_mode.value,
-                    width=200,
-                    tag="cfg_control_mode",
-                    callback=self._on_control_mode_changed
-                )
-            
-            dpg.add_spacer(height=15)
-            
-            # Speed Settings
-            self._section_header("Speed Settings")
-            with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column()
-                
-                with dpg.table_row():
-                    dpg.add_text("Test Speed:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.control.test_speed,
-                        width=100, tag="cfg_test_speed", step=0.5
-                    )
-                    dpg.add_text("mm/min", color=COLORS['text_dim'])
-                
-                with dpg.table_row():
-                    dpg.add_text("Strain Rate:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.control.strain_rate,
-                        width=100, tag="cfg_strain_rate", step=0.0001, format="%.4f"
-                    )
-                    dpg.add_text("1/s", color=COLORS['text_dim'])
-                
-                with dpg.table_row():
-                    dpg.add_text("Load Rate:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.control.load_rate,
-                        width=100, tag="cfg_load_rate", step=1.0
-                    )
-                    dpg.add_text("N/s", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Preload
-            self._section_header("Preload")
-            dpg.add_checkbox(
-                label="Enable preload",
-                default_value=self.config.control.preload_enabled,
-                tag="cfg_preload_enabled"
-            )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Preload:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.control.preload_value,
-                    width=100, tag="cfg_preload_value", step=0.1
-                )
-                dpg.add_text("N", color=COLORS['text_dim'])
-                dpg.add_spacer(width=30)
-                dpg.add_text("Speed:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.control.preload_speed,
-                    width=100, tag="cfg_preload_speed", step=1.0
-                )
-                dpg.add_text("mm/min", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Hold Settings
-            self._section_header("Hold Settings")
-            dpg.add_checkbox(
-                label="Enable hold at load",
-                default_value=self.config.control.hold_enabled,
-                tag="cfg_hold_enabled"
-            )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Hold at:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.control.hold_at_load,
-                    width=100, tag="cfg_hold_at_load", step=10.0
-                )
-                dpg.add_text("N", color=COLORS['text_dim'])
-                dpg.add_spacer(width=30)
-                dpg.add_text("Duration:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.control.hold_duration,
-                    width=100, tag="cfg_hold_duration", step=1.0
-                )
-                dpg.add_text("s", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Return Settings
-            self._section_header("Return to Start")
-            dpg.add_checkbox(
-                label="Return after test",
-                default_value=self.config.control.return_enabled,
-                tag="cfg_return_enabled"
-            )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Return Speed:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.control.return_speed,
-                    width=100, tag="cfg_return_speed", step=5.0
-                )
-                dpg.add_text("mm/min", color=COLORS['text_dim'])
-    
-    def _create_acquisition_tab(self):
-        """Create data acquisition settings tab."""
-        with dpg.tab(label="Acquisition"):
-            dpg.add_spacer(height=10)
-            
-            # Sampling Rate
-            self._section_header("Sampling Rate")
-            with dpg.group(horizontal=True):
-                dpg.add_text("Base Rate:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.acquisition.sampling_rate,
-                    width=100, tag="cfg_sampling_rate", step=1.0
-                )
-                dpg.add_text("Hz", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=5)
-            dpg.add_checkbox(
-                label="Enable event-based high-speed sampling",
-                default_value=self.config.acquisition.event_sampling_enabled,
-                tag="cfg_event_sampling"
-            )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Event Rate:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.acquisition.event_sampling_rate,
-                    width=100, tag="cfg_event_rate", step=10.0
-                )
-                dpg.add_text("Hz (during yield, break)", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Filtering
-            self._section_header("Data Filtering")
-            dpg.add_checkbox(
-                label="Enable digital filter",
-                default_value=self.config.acquisition.digital_filter_enabled,
-                tag="cfg_digital_filter"
-            )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Cutoff Frequency:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.acquisition.filter_cutoff,
-                    width=100, tag="cfg_filter_cutoff", step=1.0
-                )
-                dpg.add_text("Hz", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=5)
-            dpg.add_checkbox(
-                label="Enable median filter (noise reduction)",
-                default_value=self.config.acquisition.median_filter_enabled,
-                tag="cfg_median_filter"
-            )
-            with dpg.group(horizontal=True):
-                dpg.add_text("Window Size:", color=COLORS['text_dim'])
-                dpg.add_input_int(
-                    default_value=self.config.acquisition.median_filter_window,
-                    width=100, tag="cfg_median_window", step=2, min_value=3, max_value=11
-                )
-                dpg.add_text("samples", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Channels
-            self._section_header("Recording Channels")
-            with dpg.group(horizontal=True):
-                dpg.add_checkbox(label="Force", default_value=True, enabled=False)
-                dpg.add_checkbox(label="Extension", default_value=True, enabled=False)
-                dpg.add_checkbox(label="Time", default_value=True, enabled=False)
-            with dpg.group(horizontal=True):
-                dpg.add_checkbox(
-                    label="Strain", 
-                    default_value=self.config.acquisition.record_strain,
-                    tag="cfg_record_strain"
-                )
-                dpg.add_checkbox(
-                    label="Temperature", 
-                    default_value=self.config.acquisition.record_temperature,
-                    tag="cfg_record_temp"
-                )
-                dpg.add_checkbox(
-                    label="Video", 
-                    default_value=self.config.acquisition.record_video,
-                    tag="cfg_record_video"
-                )
-            
-            dpg.add_spacer(height=15)
-            
-            # Calculations
-            self._section_header("Real-time Calculations")
-            dpg.add_checkbox(
-                label="Calculate true stress/strain (large deformation)",
-                default_value=self.config.acquisition.calculate_true_values,
-                tag="cfg_true_values"
-            )
-    
-    def _create_termination_tab(self):
-        """Create termination criteria tab."""
-        with dpg.tab(label="Termination"):
-            dpg.add_spacer(height=10)
-            
-            # Break Detection
-            self._section_header("Break Detection")
-            dpg.add_checkbox(
-                label="Enable automatic break detection",
-                default_value=self.config.termination.break_detection_enabled,
-                tag="cfg_break_detection"
-            )
-            
-            with dpg.group(horizontal=True):
-                dpg.add_text("Force Drop:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.termination.break_force_drop,
-                    width=100, tag="cfg_break_drop", step=5.0
-                )
-                dpg.add_text("% from peak", color=COLORS['text_dim'])
-            
-            with dpg.group(horizontal=True):
-                dpg.add_text("Min Force After Break:", color=COLORS['text_dim'])
-                dpg.add_input_float(
-                    default_value=self.config.termination.break_force_threshold,
-                    width=100, tag="cfg_break_threshold", step=0.1
-                )
-                dpg.add_text("N", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Safety Limits
-            self._section_header("Safety Limits (Test will stop if exceeded)")
-            with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
-                dpg.add_table_column()
-                
-                with dpg.table_row():
-                    dpg.add_text("Maximum Force:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.termination.max_force,
-                        width=100, tag="cfg_term_max_force", step=10.0
-                    )
-                    dpg.add_text("N", color=COLORS['text_dim'])
-                
-                with dpg.table_row():
-                    dpg.add_text("Maximum Extension:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.termination.max_extension,
-                        width=100, tag="cfg_term_max_ext", step=5.0
-                    )
-                    dpg.add_text("mm", color=COLORS['text_dim'])
-                
-                with dpg.table_row():
-                    dpg.add_text("Maximum Strain:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.termination.max_strain,
-                        width=100, tag="cfg_term_max_strain", step=10.0
-                    )
-                    dpg.add_text("%", color=COLORS['text_dim'])
-                
+    def _build(self, spec: tuple):
+        """Build one layout node by dispatching on its kind."""
+        self._BUILDERS[spec[0]](self, *spec[1:])
+    
+    def _build_all(self, children: tuple):
+        """Build a sequence of layout nodes."""
+        for child in children:
+            self._build(child)
+    
+    def _build_tab(self, index: int):
+        """Populate a tab's placeholder from _LAYOUT if not done yet."""
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        dpg.push_container_stack(f"config_tab_{index}")
+        try:
+            self._build_all(_LAYOUT[index][2])
+        finally:
+            dpg.pop_container_stack()
+    
+    def _mk_row(self, children: tuple):
+        """Create a horizontal group."""
+        with dpg.group(horizontal=True):
+            self._build_all(children)
+    
+    def _mk_table(self, widths: tuple, rows: tuple):
+        """Create a borderless alignment table (None = stretch column)."""
+        with dpg.table(header_row=False, borders_innerV=False, borders_outerH=False):
+            for width in widths:
+                if width is None:
+                    dpg.add_table_column()
+                else:
+                    dpg.add_table_column(width_fixed=True, init_width_or_weight=width)
+            for row in rows:
                 with dpg.table_row():
-                    dpg.add_text("Maximum Time:", color=COLORS['text_dim'])
-                    dpg.add_input_float(
-                        default_value=self.config.termination.max_time,
-                        width=100, tag="cfg_term_max_time", step=60.0
-                    )
-                    dpg.add_text("s", color=COLORS['text_dim'])
-            
-            dpg.add_spacer(height=15)
-            
-            # Post-Break Actions
-            self._section_header("Post-Break Actions")
-            dpg.add_checkbox(
-                label="Stop test at break",
-                default_value=self.config.termination.stop_at_break,
-                tag="cfg_stop_at_break"
-            )
-            dpg.add_checkbox(
-                label="Return to start after break",
-                default_value=self.config.termination.return_after_break,
-                tag="cfg_return_after_break"
-            )
+                    self._build_all(row)
+    
+    def _mk_spacer(self, height: int):
+        """Vertical spacing."""
+        dpg.add_spacer(height=height)
+    
+    def _mk_hspace(self, width: int):
+        """Horizontal spacing inside a row."""
+        dpg.add_spacer(width=width)
+    
+    def _mk_label(self, text: str):
+        """Dimmed label or unit text."""
+        self._dim_text(text)
+    
+    def _mk_text(self, tag: str, path: str, width: int):
+        """Single-line text input without label."""
+        dpg.add_input_text(default_value=self._value_at(path), width=width, tag=tag,
+                           callback=self._mark_dirty)
+    
+    def _mk_notes(self, tag: str, path: str):
+        """Multiline notes input."""
+        dpg.add_input_text(
+            default_value=self._value_at(path),
+            width=-1, height=60,
+            multiline=True,
+            tag=tag,
+            callback=self._mark_dirty
+        )
+    
+    def _mk_combo(self, tag: str, path: str, items, width: int, options: Optional[dict] = None):
+        """Combo box over an Enum's values or a fixed tuple of strings."""
+        if isinstance(items, type) and issubclass(items, Enum):
+            items = [e.value for e in items]
+        dpg.add_combo(
+            items=list(items),
+            default_value=self._value_at(path),
+            width=width,
+            tag=tag,
+            callback=self._callback(options),
+            **self._options(options)
+        )
+    
+    def _mk_float(self, tag: str, path: str, width: int, step: float, options: Optional[dict] = None):
+        """Float input bound to a config field."""
+        dpg.add_input_float(
+            default_value=self._value_at(path),
+            width=width, tag=tag, step=step,
+            callback=self._callback(options),
+            **self._options(options)
+        )
+    
+    def _mk_int(self, tag: str, path: str, width: int, step: int, options: Optional[dict] = None):
+        """Integer input bound to a config field."""
+        dpg.add_input_int(
+            default_value=self._value_at(path),
+            width=width, tag=tag, step=step,
+            callback=self._callback(options),
+            **self._options(options)
+        )
+    
+    def _mk_check(self, label: str, tag: Optional[str] = None, path: Optional[str] = None,
+                  options: Optional[dict] = None):
+        """Checkbox, optionally bound to a config field."""
+        kwargs = self._options(options)
+        if tag is not None:
+            kwargs = dict(kwargs, tag=tag, default_value=self._value_at(path),
+                          callback=self._callback(options))
+        dpg.add_checkbox(label=label, **kwargs)
+    
+    def _mk_area(self):
+        """Read-only W × T area display."""
+        dpg.add_text(_fmt_area(self.config.specimen.thickness, self.config.specimen.width),
+                    tag="cfg_calculated_area", color=COLORS['accent'])
+    
+    def _value_at(self, path: str):
+        """Current config value at a "section.attr" path (Enums as their value)."""
+        section, attr = path.split(".")
+        value = getattr(getattr(self.config, section), attr)
+        return value.value if isinstance(value, Enum) else value
+    
+    def _options(self, options: Optional[dict]) -> dict:
+        """Resolve layout options except the callback: enabled paths to values."""
+        if not options:
+            return _NO_OPTIONS
+        kwargs = {k: v for k, v in options.items() if k != "callback"}
+        if isinstance(kwargs.get("enabled"), str):
+            kwargs["enabled"] = self._value_at(kwargs["enabled"])
+        return kwargs
+    
+    def _callback(self, options: Optional[dict]) -> Callable:
+        """Callback for a config-bound input: _mark_dirty, chained before any named handler."""
+        name = options.get("callback") if options else None
+        if name is None:
+            return self._mark_dirty
+        handler = getattr(self, name)
+        
+        def chained(sender, app_data):
+            self._ui_dirty = True
+            handler(sender, app_data)
+        return chained
     
     # ============== Helper Methods ==============
     
+    # Bound once; labels and section headers are emitted all over every tab
+    _dim_text = partial(dpg.add_text, color=COLORS['text_dim'])
+    _header_text = partial(dpg.add_text, color=COLORS['header'])
+    _add_separator = staticmethod(dpg.add_separator)
+    _add_spacer = staticmethod(dpg.add_spacer)
+    
     def _section_header(self, text: str):
         """Create a section header."""
-        dpg.add_text(text, color=COLORS['header'])
-        dpg.add_separator()
-        dpg.add_spacer(height=5)
+        self._header_text(text)
+        self._add_separator()
+        self._add_spacer(height=5)
     
-    def _input_row(self, label: str, tag: str, default: str, hint: str = ""):
-        """Create an input row with label."""
+    def _input_row(self, label: str, tag: str, path: str, hint: str = ""):
+        """Create a text input row with label."""
         with dpg.group(horizontal=True):
-            dpg.add_text(label, color=COLORS['text_dim'])
-            dpg.add_input_text(default_value=default, width=200, tag=tag, hint=hint)
+            self._dim_text(label)
+            dpg.add_input_text(default_value=self._value_at(path), width=200, tag=tag, hint=hint,
+                               callback=self._mark_dirty)
     
+    _BUILDERS = {
+        "row": _mk_row,
+        "table": _mk_table,
+        "spacer": _mk_spacer,
+        "hspace": _mk_hspace,
+        "section": _section_header,
+        "label": _mk_label,
+        "text_row": _input_row,
+        "text": _mk_text,
+        "notes": _mk_notes,
+        "combo": _mk_combo,
+        "float": _mk_float,
+        "int": _mk_int,
+        "check": _mk_check,
+        "area": _mk_area,
+    }
+
     # ============== Callbacks ==============
     
     def _on_dimension_changed(self, sender, app_data):
         """Handle dimension change - recalculate area."""
-        thickness = dpg.get_value("cfg_thickness")
-        width = dpg.get_value("cfg_width")
-        calculated = thickness * width
-        dpg.set_value("cfg_calculated_area", f"{calculated:.2f}")
+        get = dpg.get_value
+        set_value = dpg.set_value
+        dims = (get("cfg_thickness"), get("cfg_width"))
+        if dims == self._last_dims:
+            return
+        self._last_dims = dims
         
-        if not dpg.get_value("cfg_cross_section_manual"):
-            dpg.set_value("cfg_cross_section", calculated)
+        calculated = dims[0] * dims[1]
+        calc_str = _fmt_area(*dims)
+        if calc_str != self._last_calc_str:
+            self._last_calc_str = calc_str
+            set_value("cfg_calculated_area", calc_str)
+        
+        if not get("cfg_cross_section_manual"):
+            set_value("cfg_cross_section", calculated)
     
     def _on_cross_section_mode_changed(self, sender, app_data):
         """Handle cross-section mode change."""
@@ -754,22 +678,37 @@ class ConfigDialog:
     
     def _on_specimen_type_changed(self, sender, app_data):
         """Apply specimen type preset."""
-        presets = {
-            "Type 1A (ISO 527)": {"gauge": 50, "thickness": 4, "width": 10, "parallel": 80, "total": 150, "grip": 115},
-            "Type 1B (ISO 527)": {"gauge": 50, "thickness": 4, "width": 10, "parallel": 60, "total": 150, "grip": 115},
-            "Type V (ASTM D638)": {"gauge": 7.62, "thickness": 3.2, "width": 3.18, "parallel": 9.53, "total": 63.5, "grip": 25.4},
-            "Type I (ASTM D638)": {"gauge": 50, "thickness": 3.2, "width": 13, "parallel": 57, "total": 165, "grip": 115},
-        }
+        p = _SPECIMEN_PRESETS.get(app_data)
+        if p is None:
+            return
+        
+        set_value = dpg.set_value
+        set_value("cfg_gauge_length", p[0])
+        set_value("cfg_thickness", p[1])
+        set_value("cfg_width", p[2])
+        set_value("cfg_parallel_length", p[3])
+        set_value("cfg_total_length", p[4])
+        set_value("cfg_grip_distance", p[5])
         
-        if app_data in presets:
-            p = presets[app_data]
-            dpg.set_value("cfg_gauge_length", p["gauge"])
-            dpg.set_value("cfg_thickness", p["thickness"])
-            dpg.set_value("cfg_width", p["width"])
-            dpg.set_value("cfg_parallel_length", p["parallel"])
-            dpg.set_value("cfg_total_length", p["total"])
-            dpg.set_value("cfg_grip_distance", p["grip"])
-            self._on_dimension_changed(None, None)
+        # Area straight from the preset rather than reading the widgets back;
+        # the widgets store float32, so the dims cache is just invalidated
+        self._last_dims = (None, None)
+        calc_str = _fmt_area(p[1], p[2])
+        if calc_str != self._last_calc_str:
+            self._last_calc_str = calc_str
+            set_value("cfg_calculated_area", calc_str)
+        if not dpg.get_value("cfg_cross_section_manual"):
+            set_value("cfg_cross_section", p[1] * p[2])
+    
+    def _mark_dirty(self, sender, app_data):
+        """Note that an input changed since the last read."""
+        self._ui_dirty = True
+    
+    def _on_tab_changed(self, sender, app_data):
+        """Build a tab's contents on first selection."""
+        alias = dpg.get_item_alias(app_data) if isinstance(app_data, int) else app_data
+        if alias and alias.startswith("config_tab_"):
+            self._build_tab(int(alias[len("config_tab_"):]))
     
     def _on_control_mode_changed(self, sender, app_data):
         """Handle control mode change."""
@@ -799,11 +738,24 @@ class ConfigDialog:
     def _on_save(self):
         """Save configuration to file."""
         # TODO: Implement file dialog
-        config_dict = self.config.to_dict()
+        if self._config_dirty or self._cached_dict is None:
+            self._cached_dict = self.config.to_dict()
+            self._config_dirty = False
+        config_dict = self._cached_dict
         filename = f"config_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(filename, 'w') as f:
-                json.dump(config_dict, f, indent=2)
+            if HAS_ORJSON:
+                data = orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(config_dict, indent=2).encode('utf-8')
+            # Write to a temp file and swap it in so a crash never leaves a
+            # truncated config behind
+            tmp_filename = filename + ".tmp"
+            with open(tmp_filename, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, filename)
             print(f"Configuration saved to {filename}")
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -815,116 +767,28 @@ class ConfigDialog:
     
     def _read_config(self):
         """Read all values from UI into config."""
-        # Metadata
-        std_str = dpg.get_value("cfg_test_standard")
-        for std in TestStandard:
-            if std.value == std_str:
-                self.config.metadata.test_standard = std
-                break
-        
-        mat_str = dpg.get_value("cfg_material_type")
-        for mat in MaterialType:
-            if mat.value == mat_str:
-                self.config.metadata.material_type = mat
-                break
-        
-        self.config.metadata.test_id = dpg.get_value("cfg_test_id")
-        self.config.metadata.sample_id = dpg.get_value("cfg_sample_id")
-        self.config.metadata.batch_id = dpg.get_value("cfg_batch_id")
-        self.config.metadata.lot_number = dpg.get_value("cfg_lot_number")
-        self.config.metadata.material_name = dpg.get_value("cfg_material_name")
-        self.config.metadata.material_grade = dpg.get_value("cfg_material_grade")
-        self.config.metadata.operator_name = dpg.get_value("cfg_operator")
-        self.config.metadata.customer_name = dpg.get_value("cfg_customer")
-        self.config.metadata.project_name = dpg.get_value("cfg_project")
-        self.config.metadata.temperature = dpg.get_value("cfg_temperature")
-        self.config.metadata.humidity = dpg.get_value("cfg_humidity")
-        self.config.metadata.notes = dpg.get_value("cfg_notes")
-        
-        # Specimen
-        self.config.specimen.specimen_type = dpg.get_value("cfg_specimen_type")
-        self.config.specimen.gauge_length = dpg.get_value("cfg_gauge_length")
-        self.config.specimen.thickness = dpg.get_value("cfg_thickness")
-        self.config.specimen.width = dpg.get_value("cfg_width")
-        self.config.specimen.cross_section_manual = dpg.get_value("cfg_cross_section_manual")
-        self.config.specimen.cross_section_area = dpg.get_value("cfg_cross_section")
-        self.config.specimen.parallel_length = dpg.get_value("cfg_parallel_length")
-        self.config.specimen.total_length = dpg.get_value("cfg_total_length")
-        self.config.specimen.grip_distance = dpg.get_value("cfg_grip_distance")
-        
-        # Machine
-        lc_str = dpg.get_value("cfg_load_cell_range")
-        for lc in LoadCellRange:
-            if lc.value == lc_str:
-                self.config.machine.load_cell_range = lc
-                break
-        
-        ext_str = dpg.get_value("cfg_extensometer_type")
-        for ext in ExtensometerType:
-            if ext.value == ext_str:
-                self.config.machine.extensometer_type = ext
-                break
-        
-        self.config.machine.load_cell_serial = dpg.get_value("cfg_load_cell_serial")
-        self.config.machine.load_cell_calibration_date = dpg.get_value("cfg_calibration_date")
-        self.config.machine.extensometer_gauge = dpg.get_value("cfg_extensometer_gauge")
-        self.config.machine.upper_limit = dpg.get_value("cfg_upper_limit")
-        self.config.machine.lower_limit = dpg.get_value("cfg_lower_limit")
-        self.config.machine.force_limit = dpg.get_value("cfg_force_limit")
-        self.config.machine.extension_limit = dpg.get_value("cfg_extension_limit")
-        self.config.machine.emergency_stop_enabled = dpg.get_value("cfg_emergency_enabled")
-        self.config.machine.zero_force_on_start = dpg.get_value("cfg_zero_force")
-        self.config.machine.zero_extension_on_start = dpg.get_value("cfg_zero_extension")
-        self.config.machine.zero_extensometer_on_start = dpg.get_value("cfg_zero_extensometer")
-        
-        # Control
-        ctrl_str = dpg.get_value("cfg_control_mode")
-        for ctrl in ControlMode:
-            if ctrl.value == ctrl_str:
-                self.config.control.control_mode = ctrl
-                break
-        
-        self.config.control.test_speed = dpg.get_value("cfg_test_speed")
-        self.config.control.strain_rate = dpg.get_value("cfg_strain_rate")
-        self.config.control.load_rate = dpg.get_value("cfg_load_rate")
-        self.config.control.preload_enabled = dpg.get_value("cfg_preload_enabled")
-        self.config.control.preload_value = dpg.get_value("cfg_preload_value")
-        self.config.control.preload_speed = dpg.get_value("cfg_preload_speed")
-        self.config.control.hold_enabled = dpg.get_value("cfg_hold_enabled")
-        self.config.control.hold_at_load = dpg.get_value("cfg_hold_at_load")
-        self.config.control.hold_duration = dpg.get_value("cfg_hold_duration")
-        self.config.control.return_enabled = dpg.get_value("cfg_return_enabled")
-        self.config.control.return_speed = dpg.get_value("cfg_return_speed")
-        
-        # Acquisition
-        self.config.acquisition.sampling_rate = dpg.get_value("cfg_sampling_rate")
-        self.config.acquisition.event_sampling_enabled = dpg.get_value("cfg_event_sampling")
-        self.config.acquisition.event_sampling_rate = dpg.get_value("cfg_event_rate")
-        self.config.acquisition.digital_filter_enabled = dpg.get_value("cfg_digital_filter")
-        self.config.acquisition.filter_cutoff = dpg.get_value("cfg_filter_cutoff")
-        self.config.acquisition.median_filter_enabled = dpg.get_value("cfg_median_filter")
-        self.config.acquisition.median_filter_window = dpg.get_value("cfg_median_window")
-        self.config.acquisition.record_strain = dpg.get_value("cfg_record_strain")
-        self.config.acquisition.record_temperature = dpg.get_value("cfg_record_temp")
-        self.config.acquisition.record_video = dpg.get_value("cfg_record_video")
-        self.config.acquisition.calculate_true_values = dpg.get_value("cfg_true_values")
-        
-        # Termination
-        self.config.termination.break_detection_enabled = dpg.get_value("cfg_break_detection")
-        self.config.termination.break_force_drop = dpg.get_value("cfg_break_drop")
-        self.config.termination.break_force_threshold = dpg.get_value("cfg_break_threshold")
-        self.config.termination.max_force = dpg.get_value("cfg_term_max_force")
-        self.config.termination.max_extension = dpg.get_value("cfg_term_max_ext")
-        self.config.termination.max_strain = dpg.get_value("cfg_term_max_strain")
-        self.config.termination.max_time = dpg.get_value("cfg_term_max_time")
-        self.config.termination.stop_at_break = dpg.get_value("cfg_stop_at_break")
-        self.config.termination.return_after_break = dpg.get_value("cfg_return_after_break")
+        if not self._ui_dirty:
+            return
+        # Tabs that were never opened still hold the config values
+        for index in self._built_tabs:
+            _TAB_MARSHALLERS[index][0](self)
+        self._ui_dirty = False
+        self._config_dirty = True
     
     def _update_ui_from_config(self):
         """Update UI controls from config values."""
-        # This would set all UI values from self.config
-        # Implementation similar to _read_config but in reverse
-        pass
+        # Unbuilt tabs pick up self.config when they are first opened
+        for index in self._built_tabs:
+            _TAB_MARSHALLERS[index][1](self)
+        self._ui_dirty = False
+        
+        if not dpg.does_item_exist("cfg_cross_section"):
+            return
+        specimen = self.config.specimen
+        dpg.configure_item("cfg_cross_section", enabled=specimen.cross_section_manual)
+        self._last_dims = (specimen.thickness, specimen.width)
+        self._last_calc_str = _fmt_area(specimen.thickness, specimen.width)
+        dpg.set_value("cfg_calculated_area", self._last_calc_str)
     
     def get_config(self) -> TestConfiguration:
         """Get current configuration."""
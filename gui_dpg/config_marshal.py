@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Config Dialog Field Marshalling
+
+Copies values between the configuration dialog widgets and the
+TestConfiguration dataclasses. The field tables are derived from the
+dialog's declarative layout and compiled once into straight-line
+functions, so the Apply path has no per-field loop or path lookup.
+
+Author: DIY Tensile Tester Project
+Version: 2.0.0
+"""
+
+import dearpygui.dearpygui as dpg
+from enum import Enum
+from typing import Callable, Dict, Optional, Tuple
+
+# Position of the UI tag among a bound node's arguments (the path follows it)
+_TAG_INDEX = {
+    "text_row": 1, "check": 1,
+    "text": 0, "notes": 0, "combo": 0, "float": 0, "int": 0,
+}
+
+
+def bound_fields(nodes: tuple):
+    """Yield (tag, path, node) for every layout input bound to a config field."""
+    for node in nodes:
+        kind, args = node[0], node[1:]
+        if kind == "tab":
+            yield from bound_fields(args[1])
+        elif kind == "row":
+            yield from bound_fields(args[0])
+        elif kind == "table":
+            for row in args[1]:
+                yield from bound_fields(row)
+        elif kind in _TAG_INDEX:
+            i = _TAG_INDEX[kind]
+            if args[i] is not None:
+                yield args[i], args[i + 1], node
+
+
+def enum_of(node: tuple) -> Optional[type]:
+    """Enum class behind a combo node, or None for plain inputs."""
+    if node[0] == "combo" and isinstance(node[3], type) and issubclass(node[3], Enum):
+        return node[3]
+    return None
+
+
+def field_tables(layout: tuple) -> Tuple[tuple, tuple]:
+    """
+    Split a layout's bound inputs into plain and enum fields.
+
+    Returns (field_map, enum_fields) where field_map holds
+    (tag, section, attr) and enum_fields holds (tag, section, attr, enum class).
+    """
+    field_map = []
+    enum_fields = []
+    for tag, path, node in bound_fields(layout):
+        section, attr = path.split(".")
+        enum_cls = enum_of(node)
+        if enum_cls is None:
+            field_map.append((tag, section, attr))
+        else:
+            enum_fields.append((tag, section, attr, enum_cls))
+    return tuple(field_map), tuple(enum_fields)
+
+
+def compile_marshallers(field_map: tuple, enum_fields: tuple,
+                        enum_maps: Dict[str, dict]) -> Tuple[Callable, Callable]:
+    """
+    Generate straight-line UI <-> config copy functions from the field tables.
+
+    Returns (read, write), each called with the dialog: read copies every
+    widget into self.config, write pushes every config value back into its
+    widget. enum_maps maps each enum combo tag to a {value: member} dict,
+    so translating a selection is a single dict hit.
+    """
+    sections = sorted({f[1] for f in field_map + enum_fields})
+    namespace = {"dpg": dpg}
+    read = [
+        "def _read_fields(self):",
+        '    """Copy the bound UI values into self.config."""',
+        "    get = dpg.get_value",
+        "    config = self.config",
+    ]
+    write = [
+        "def _write_fields(self):",
+        '    """Push the bound config values into the UI controls."""',
+        "    set_value = dpg.set_value",
+        "    config = self.config",
+    ]
+    for section in sections:
+        read.append(f"    {section} = config.{section}")
+        write.append(f"    {section} = config.{section}")
+
+    for i, (tag, section, attr, _) in enumerate(enum_fields):
+        namespace[f"_enum{i}"] = enum_maps[tag]
+        read.append(f"    {section}.{attr} = _enum{i}.get(get({tag!r}), {section}.{attr})")
+        write.append(f"    set_value({tag!r}, {section}.{attr}.value)")
+    for tag, section, attr in field_map:
+        read.append(f"    {section}.{attr} = get({tag!r})")
+        write.append(f"    set_value({tag!r}, {section}.{attr})")
+
+    source = "\n".join(read) + "\n\n" + "\n".join(write) + "\n"
+    exec(compile(source, "<config_marshal>", "exec"), namespace)
+    return namespace["_read_fields"], namespace["_write_fields"]
@@ -10,43 +10,144 @@ Version: 2.0.0
 """
 
 import os
+import io
 import json
+import math
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from xml.sax.saxutils import escape
 from typing import List, Optional, Dict, Any
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 import numpy as np
 
 from models import (
     TestConfiguration, MechanicalProperties, TestResults,
     TestMetadata, SpecimenConfig, ExportConfig
 )
+from _csv_kernel import HAS_NUMBA, MAX_EXACT_VALUE, format_rows as _format_csv_rows
 
 # Try to import optional dependencies
+# (openpyxl and reportlab are heavy and imported on first use instead,
+# see DataExporter._openpyxl and DataExporter._reportlab)
 try:
-    import pandas as pd
-    HAS_PANDAS = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_PANDAS = False
+    HAS_ORJSON = False
 
-try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-    from openpyxl.chart import LineChart, Reference
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
 
-try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import mm
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageBreak
-    from reportlab.graphics.shapes import Drawing
-    from reportlab.graphics.charts.lineplots import LinePlot
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
+# File buffer size for exports, so header lines and data rows coalesce
+# into few large writes
+_WRITE_BUFFER = 1 << 20
+
+# Most points per series embedded in Excel charts
+_CHART_MAX_POINTS = 2000
+
+# Page cache hints for export files (POSIX only)
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# Rows formatted per % operation by _write_rows
+_ROW_BLOCK = 256
+
+# Stands in for the raw data array while the JSON envelope is encoded
+_JSON_DATA_PLACEHOLDER = "__raw_data_rows__"
+
+
+# ASCII characters not allowed in generated filenames, mapped to "_"
+_FILENAME_TRANS = str.maketrans({
+    c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")
+})
+
+
+def _clean_filename_part(text: str) -> str:
+    """Replace everything but letters, digits, "-" and "_" with "_"."""
+    if text.isascii():
+        return text.translate(_FILENAME_TRANS)
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in text)
+
+
+def _data_matrix(times, forces, extensions, stresses, strains) -> np.ndarray:
+    """
+    Stack the five data channels into one contiguous float64 (n, 5) array.
+
+    Strain is converted to percent. The inputs are read, never copied back,
+    so they must not be mutated while an export runs.
+    """
+    data = np.empty((len(times), 5), dtype=np.float64)
+    data[:, 0] = times
+    data[:, 1] = forces
+    data[:, 2] = extensions
+    data[:, 3] = stresses
+    np.multiply(strains, 100.0, out=data[:, 4])
+    return data
+
+
+@dataclass
+class _Prepared:
+    """Data matrix built once and shared by every format of an export_all."""
+    sources: tuple      # The caller's five channel objects, matched by identity
+    data: np.ndarray    # _data_matrix() of those channels
+
+
+def _prepare(times, forces, extensions, stresses, strains) -> _Prepared:
+    """Coerce the channels once for several exports of the same data."""
+    sources = (times, forces, extensions, stresses, strains)
+    return _Prepared(sources, _data_matrix(*sources))
+
+
+@contextmanager
+def _export_file(filename: str):
+    """
+    Open an export file for buffered binary writing.
+    
+    Where posix_fadvise exists, the kernel is told the file is written
+    sequentially, and once written that its pages need not stay cached.
+    """
+    with open(filename, 'wb', buffering=_WRITE_BUFFER) as f:
+        if _HAS_FADVISE:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            yield f
+        finally:
+            if _HAS_FADVISE:
+                f.flush()
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _write_rows(f, data: np.ndarray, row_fmt: str):
+    """
+    Write every row of data through a %-format string to a binary file.
+    
+    Rows are formatted a block at a time with a single % operation and
+    collected in a bytearray that is flushed to f about every 64 KB.
+    """
+    buf = bytearray()
+    extend = buf.extend
+    for start in range(0, len(data), _ROW_BLOCK):
+        block = data[start:start + _ROW_BLOCK]
+        extend(((row_fmt * len(block)) % tuple(block.ravel().tolist())).encode('ascii'))
+        if len(buf) >= 65536:
+            f.write(buf)
+            del buf[:]
+    if buf:
+        f.write(buf)
+
+
+def _has_non_finite(obj) -> bool:
+    """True if a JSON-bound structure holds a NaN or infinite float."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(map(_has_non_finite, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(_has_non_finite, obj))
+    return False
+
+
+def _xml_text(value) -> str:
+    """Escape a user-supplied value for use as XML element text."""
+    return escape(str(value)) if value is not None else ""
 
 
 class ExportError(Exception):
@@ -61,31 +162,75 @@ class DataExporter:
         self.output_dir = output_dir
         self._ensure_output_dir()
     
+    # Set by export_all while its formats run
+    _prepared: Optional[_Prepared] = None
+    
+    # Optional backends, imported by the first export that needs them
+    _openpyxl_names: Optional[tuple] = None
+    _reportlab_names: Optional[tuple] = None
+    
+    @classmethod
+    def _openpyxl(cls) -> tuple:
+        """
+        Import openpyxl on first use.
+        
+        Returns (Workbook, Font, PatternFill, Border, Side, LineChart, Reference).
+        """
+        if cls._openpyxl_names is None:
+            try:
+                from openpyxl import Workbook
+                from openpyxl.styles import Font, PatternFill, Border, Side
+                from openpyxl.chart import LineChart, Reference
+            except ImportError:
+                raise ExportError("openpyxl not installed. Install with: pip install openpyxl")
+            cls._openpyxl_names = (Workbook, Font, PatternFill, Border, Side, LineChart, Reference)
+        return cls._openpyxl_names
+    
+    @classmethod
+    def _reportlab(cls) -> tuple:
+        """
+        Import reportlab on first use.
+        
+        Returns (colors, A4, mm, getSampleStyleSheet, ParagraphStyle,
+        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle).
+        """
+        if cls._reportlab_names is None:
+            try:
+                from reportlab.lib import colors
+                from reportlab.lib.pagesizes import A4
+                from reportlab.lib.units import mm
+                from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+                from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+            except ImportError:
+                raise ExportError("reportlab not installed. Install with: pip install reportlab")
+            cls._reportlab_names = (colors, A4, mm, getSampleStyleSheet, ParagraphStyle,
+                                    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle)
+        return cls._reportlab_names
+    
+    def _data(self, times, forces, extensions, stresses, strains) -> np.ndarray:
+        """Data matrix for the channels, reusing export_all's if it is for the same data."""
+        prepared = self._prepared
+        if prepared is not None:
+            channels = (times, forces, extensions, stresses, strains)
+            if all(a is b for a, b in zip(prepared.sources, channels)):
+                return prepared.data
+        return _data_matrix(times, forces, extensions, stresses, strains)
+    
     def _ensure_output_dir(self):
         """Ensure output directory exists."""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
     
     def generate_filename(self, config: TestConfiguration, extension: str) -> str:
-        """Generate filename from pattern: date-material_name."""
-        timestamp = datetime.now()
-        
-        # Get material name, fallback to sample_id, then "unknown"
-        material = config.metadata.material_name or config.metadata.sample_id or "unknown"
-        
-        # Clean material name for filename
-        material = "".join(c if c.isalnum() or c in "-_" else "_" for c in material)
-        
-        # Format: YYYYMMDD-material_name.ext
-        filename = f"{timestamp.strftime('%Y%m%d')}-{material}.{extension}"
-        return os.path.join(self.output_dir, filename)
+        """Generate filename from pattern: date-material_name, in the output directory."""
+        return os.path.join(self.output_dir, self.generate_default_filename(config, extension))
     
     def generate_default_filename(self, config: TestConfiguration, extension: str) -> str:
         """Generate default filename suggestion."""
-        timestamp = datetime.now()
+        # Get material name, fallback to sample_id, then "unknown"
         material = config.metadata.material_name or config.metadata.sample_id or "unknown"
-        material = "".join(c if c.isalnum() or c in "-_" else "_" for c in material)
-        return f"{timestamp.strftime('%Y%m%d')}-{material}.{extension}"
+        
+        # Format: YYYYMMDD-material_name.ext
+        return f"{datetime.now():%Y%m%d}-{_clean_filename_part(material)}.{extension}"
     
     # ============== CSV Export ==============
     
@@ -103,32 +248,45 @@ class DataExporter:
         filename = filepath if filepath else self.generate_filename(config, "csv")
         
         try:
-            with open(filename, 'w', newline='') as f:
-                if include_header:
-                    # Write metadata header
-                    f.write(f"# Tensile Test Results\n")
-                    f.write(f"# Sample ID: {config.metadata.sample_id}\n")
-                    f.write(f"# Material: {config.metadata.material_name}\n")
-                    f.write(f"# Standard: {config.metadata.test_standard.value}\n")
-                    f.write(f"# Date: {config.metadata.test_date}\n")
-                    f.write(f"# Operator: {config.metadata.operator_name}\n")
-                    f.write(f"# Gauge Length: {config.specimen.gauge_length} mm\n")
-                    f.write(f"# Cross-Section: {config.specimen.cross_section_area} mm²\n")
-                    f.write(f"#\n")
-                    f.write(f"# Results:\n")
-                    f.write(f"# UTS: {properties.ultimate_tensile_strength:.2f} MPa\n")
-                    f.write(f"# Yield Strength: {properties.yield_strength_offset:.2f} MPa\n")
-                    f.write(f"# Young's Modulus: {properties.youngs_modulus:.1f} MPa\n")
-                    f.write(f"# Elongation: {properties.strain_at_break:.2f} %\n")
-                    f.write(f"#\n")
-                
-                # Column headers
-                f.write("Time (s),Force (N),Extension (mm),Stress (MPa),Strain (%)\n")
+            md = config.metadata
+            sp = config.specimen
+            
+            lines = []
+            if include_header:
+                # Metadata header
+                lines = [
+                    "# Tensile Test Results",
+                    f"# Sample ID: {md.sample_id}",
+                    f"# Material: {md.material_name}",
+                    f"# Standard: {md.test_standard.value}",
+                    f"# Date: {md.test_date}",
+                    f"# Operator: {md.operator_name}",
+                    f"# Gauge Length: {sp.gauge_length} mm",
+                    f"# Cross-Section: {sp.cross_section_area} mm²",
+                    "#",
+                    "# Results:",
+                    f"# UTS: {properties.ultimate_tensile_strength:.2f} MPa",
+                    f"# Yield Strength: {properties.yield_strength_offset:.2f} MPa",
+                    f"# Young's Modulus: {properties.youngs_modulus:.1f} MPa",
+                    f"# Elongation: {properties.strain_at_break:.2f} %",
+                    "#",
+                ]
+            
+            # Column headers
+            lines.append("Time (s),Force (N),Extension (mm),Stress (MPa),Strain (%)\n")
+            
+            # Binary file: the header is encoded once, the rows are already bytes
+            with _export_file(filename) as f:
+                f.write("\n".join(lines).encode('utf-8'))
                 
                 # Data rows
-                for i in range(len(times)):
-                    f.write(f"{times[i]:.4f},{forces[i]:.4f},{extensions[i]:.4f},"
-                           f"{stresses[i]:.4f},{strains[i]*100:.4f}\n")
+                data = self._data(times, forces, extensions, stresses, strains)
+                if (HAS_NUMBA and len(data) and np.isfinite(data).all()
+                        and np.abs(data).max() < MAX_EXACT_VALUE):
+                    # Compiled formatter
+                    f.write(_format_csv_rows(data).tobytes())
+                else:
+                    np.savetxt(f, data, fmt="%.4f", delimiter=",")
             
             return filename
             
@@ -147,12 +305,14 @@ class DataExporter:
                      properties: MechanicalProperties,
                      filepath: str = None) -> str:
         """Export test data to Excel file with formatting and charts."""
-        if not HAS_OPENPYXL:
-            raise ExportError("openpyxl not installed. Install with: pip install openpyxl")
+        Workbook, Font, PatternFill, Border, Side, LineChart, Reference = self._openpyxl()
         
         filename = filepath if filepath else self.generate_filename(config, "xlsx")
         
         try:
+            md = config.metadata
+            sp = config.specimen
+            
             wb = Workbook()
             
             # Styles
@@ -174,62 +334,65 @@ class DataExporter:
             ws_summary['A1'] = "Tensile Test Report"
             ws_summary['A1'].font = title_font
             
-            # Metadata section
-            row = 3
+            # Metadata section, one append per row from row 3
+            ws_summary.append([])
+            append = ws_summary.append
             metadata_items = [
                 ("Test Information", ""),
-                ("Sample ID", config.metadata.sample_id),
-                ("Material", config.metadata.material_name),
-                ("Grade", config.metadata.material_grade),
-                ("Standard", config.metadata.test_standard.value),
-                ("Date", config.metadata.test_date),
-                ("Time", config.metadata.test_time),
-                ("Operator", config.metadata.operator_name),
-                ("Customer", config.metadata.customer_name),
+                ("Sample ID", md.sample_id),
+                ("Material", md.material_name),
+                ("Grade", md.material_grade),
+                ("Standard", md.test_standard.value),
+                ("Date", md.test_date),
+                ("Time", md.test_time),
+                ("Operator", md.operator_name),
+                ("Customer", md.customer_name),
                 ("", ""),
                 ("Specimen Dimensions", ""),
-                ("Gauge Length", f"{config.specimen.gauge_length} mm"),
-                ("Thickness", f"{config.specimen.thickness} mm"),
-                ("Width", f"{config.specimen.width} mm"),
-                ("Cross-Section", f"{config.specimen.cross_section_area} mm²"),
+                ("Gauge Length", f"{sp.gauge_length} mm"),
+                ("Thickness", f"{sp.thickness} mm"),
+                ("Width", f"{sp.width} mm"),
+                ("Cross-Section", f"{sp.cross_section_area} mm²"),
                 ("", ""),
                 ("Environment", ""),
-                ("Temperature", f"{config.metadata.temperature} °C"),
-                ("Humidity", f"{config.metadata.humidity} % RH"),
+                ("Temperature", f"{md.temperature} °C"),
+                ("Humidity", f"{md.humidity} % RH"),
             ]
             
+            row = 2
             for label, value in metadata_items:
+                row += 1
                 if label and not value:  # Section header
-                    ws_summary.cell(row=row, column=1, value=label).font = header_font
+                    append([label])
+                    ws_summary[f"A{row}"].font = header_font
                 else:
-                    ws_summary.cell(row=row, column=1, value=label)
-                    ws_summary.cell(row=row, column=2, value=value)
-                row += 1
+                    append([label, value])
             
             # Results section
-            row += 1
-            ws_summary.cell(row=row, column=1, value="Mechanical Properties").font = header_font
-            row += 1
+            append([])
+            append(["Mechanical Properties"])
+            row += 2
+            ws_summary[f"A{row}"].font = header_font
             
+            # (property, value, unit, decimals shown)
             results_items = [
-                ("Ultimate Tensile Strength", f"{properties.ultimate_tensile_strength:.2f}", "MPa"),
-                ("Yield Strength (Rp0.2)", f"{properties.yield_strength_offset:.2f}", "MPa"),
-                ("Young's Modulus", f"{properties.youngs_modulus:.1f}", "MPa"),
-                ("Elongation at Break", f"{properties.strain_at_break:.2f}", "%"),
-                ("Maximum Force", f"{properties.max_force:.2f}", "N"),
-                ("Energy to Break", f"{properties.energy_to_break:.4f}", "J"),
+                ("Ultimate Tensile Strength", properties.ultimate_tensile_strength, "MPa", 2),
+                ("Yield Strength (Rp0.2)", properties.yield_strength_offset, "MPa", 2),
+                ("Young's Modulus", properties.youngs_modulus, "MPa", 1),
+                ("Elongation at Break", properties.strain_at_break, "%", 2),
+                ("Maximum Force", properties.max_force, "N", 2),
+                ("Energy to Break", properties.energy_to_break, "J", 4),
             ]
             
-            ws_summary.cell(row=row, column=1, value="Property").font = header_font
-            ws_summary.cell(row=row, column=2, value="Value").font = header_font
-            ws_summary.cell(row=row, column=3, value="Unit").font = header_font
+            append(["Property", "Value", "Unit"])
             row += 1
+            for cell in ws_summary[row]:
+                cell.font = header_font
             
-            for prop, val, unit in results_items:
-                ws_summary.cell(row=row, column=1, value=prop)
-                ws_summary.cell(row=row, column=2, value=float(val.replace(',', '.')))
-                ws_summary.cell(row=row, column=3, value=unit)
+            for prop, val, unit, decimals in results_items:
+                append([prop, val, unit])
                 row += 1
+                ws_summary[f"B{row}"].number_format = "0." + "0" * decimals
             
             # Adjust column widths
             ws_summary.column_dimensions['A'].width = 25
@@ -246,18 +409,32 @@ class DataExporter:
                 cell.font = header_font
                 cell.fill = accent_fill
             
-            # Data
-            for i in range(len(times)):
-                ws_data.cell(row=i+2, column=1, value=times[i])
-                ws_data.cell(row=i+2, column=2, value=forces[i])
-                ws_data.cell(row=i+2, column=3, value=extensions[i])
-                ws_data.cell(row=i+2, column=4, value=stresses[i])
-                ws_data.cell(row=i+2, column=5, value=strains[i]*100)
+            # Data, appended a row at a time below the headers
+            data_rows = self._data(times, forces, extensions, stresses, strains).tolist()
+            append = ws_data.append
+            for row_values in data_rows:
+                append(row_values)
             
             # Adjust column widths
             for col in range(1, 6):
                 ws_data.column_dimensions[chr(64+col)].width = 15
             
+            # ===== Chart Data Sheet =====
+            # Charts plot a decimated copy so their embedded series stay
+            # small; Raw Data keeps every sample
+            ws_chart_data = wb.create_sheet("Chart Data")
+            ws_chart_data.sheet_state = "hidden"
+            ws_chart_data.append(headers)
+            n = len(data_rows)
+            stride = max(1, -(-n // _CHART_MAX_POINTS))
+            chart_rows = data_rows[::stride]
+            if (n - 1) % stride:
+                chart_rows.append(data_rows[-1])
+            append = ws_chart_data.append
+            for row_values in chart_rows:
+                append(row_values)
+            last = len(chart_rows) + 1  # Header row plus samples
+            
             # ===== Chart Sheet =====
             ws_chart = wb.create_sheet("Charts")
             
@@ -268,8 +445,8 @@ class DataExporter:
             chart1.x_axis.title = "Extension (mm)"
             chart1.style = 10
             
-            data = Reference(ws_data, min_col=2, min_row=1, max_row=len(times)+1)
-            cats = Reference(ws_data, min_col=3, min_row=2, max_row=len(times)+1)
+            data = Reference(ws_chart_data, min_col=2, min_row=1, max_row=last)
+            cats = Reference(ws_chart_data, min_col=3, min_row=2, max_row=last)
             chart1.add_data(data, titles_from_data=True)
             chart1.set_categories(cats)
             chart1.height = 15
@@ -284,8 +461,8 @@ class DataExporter:
             chart2.x_axis.title = "Strain (%)"
             chart2.style = 10
             
-            data2 = Reference(ws_data, min_col=4, min_row=1, max_row=len(times)+1)
-            cats2 = Reference(ws_data, min_col=5, min_row=2, max_row=len(times)+1)
+            data2 = Reference(ws_chart_data, min_col=4, min_row=1, max_row=last)
+            cats2 = Reference(ws_chart_data, min_col=5, min_row=2, max_row=last)
             chart2.add_data(data2, titles_from_data=True)
             chart2.set_categories(cats2)
             chart2.height = 15
@@ -293,7 +470,8 @@ class DataExporter:
             
             ws_chart.add_chart(chart2, "A32")
             
-            wb.save(filename)
+            with _export_file(filename) as f:
+                wb.save(f)
             return filename
             
         except Exception as e:
@@ -314,35 +492,38 @@ class DataExporter:
         filename = filepath if filepath else self.generate_filename(config, "json")
         
         try:
+            md = config.metadata
+            sp = config.specimen
+            
             # Build export data structure
             export_data = {
                 "metadata": {
-                    "test_id": config.metadata.test_id,
-                    "sample_id": config.metadata.sample_id,
-                    "batch_id": config.metadata.batch_id,
+                    "test_id": md.test_id,
+                    "sample_id": md.sample_id,
+                    "batch_id": md.batch_id,
                     "material": {
-                        "name": config.metadata.material_name,
-                        "type": config.metadata.material_type.value,
-                        "grade": config.metadata.material_grade,
+                        "name": md.material_name,
+                        "type": md.material_type.value,
+                        "grade": md.material_grade,
                     },
-                    "standard": config.metadata.test_standard.value,
-                    "operator": config.metadata.operator_name,
-                    "customer": config.metadata.customer_name,
-                    "date": config.metadata.test_date,
-                    "time": config.metadata.test_time,
+                    "standard": md.test_standard.value,
+                    "operator": md.operator_name,
+                    "customer": md.customer_name,
+                    "date": md.test_date,
+                    "time": md.test_time,
                     "environment": {
-                        "temperature_c": config.metadata.temperature,
-                        "humidity_pct": config.metadata.humidity,
+                        "temperature_c": md.temperature,
+                        "humidity_pct": md.humidity,
                     },
-                    "notes": config.metadata.notes,
+                    "notes": md.notes,
                 },
                 "specimen": {
-                    "type": config.specimen.specimen_type,
-                    "gauge_length_mm": config.specimen.gauge_length,
-                    "thickness_mm": config.specimen.thickness,
-                    "width_mm": config.specimen.width,
-                    "cross_section_mm2": config.specimen.cross_section_area,
-                    "grip_distance_mm": config.specimen.grip_distance,
+                    "type": sp.specimen_type,
+                    "gauge_length_mm": sp.gauge_length,
+                    "thickness_mm": sp.thickness,
+                    "width_mm": sp.width,
+                    "cross_section_mm2": sp.cross_section_area,
+                    "grip_distance_mm": sp.grip_distance,
                 },
                 "test_parameters": {
                     "control_mode": config.control.control_mode.value,
@@ -377,10 +558,7 @@ class DataExporter:
                 "raw_data": {
                     "points": len(times),
                     "columns": ["time_s", "force_n", "extension_mm", "stress_mpa", "strain_pct"],
-                    "data": [
-                        [round(t, 4), round(f, 4), round(e, 4), round(s, 4), round(st*100, 4)]
-                        for t, f, e, s, st in zip(times, forces, extensions, stresses, strains)
-                    ]
+                    "data": _JSON_DATA_PLACEHOLDER,  # Streamed in below
                 },
                 "export_info": {
                     "format_version": "1.0",
@@ -389,8 +567,37 @@ class DataExporter:
                 }
             }
             
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+            data = self._data(times, forces, extensions, stresses, strains)
+            
+            # orjson would write NaN/Infinity as null, so any non-finite result
+            # takes the json path and the file reads the same either way
+            if HAS_ORJSON and not _has_non_finite(export_data):
+                envelope = orjson.dumps(export_data, option=orjson.OPT_INDENT_2)
+            else:
+                # UTF-8 without \u escapes, as orjson writes it
+                envelope = json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            # Write the envelope around the data array and stream the rows
+            # straight from the stacked columns, without a list-of-lists copy
+            head, tail = envelope.split(
+                json.dumps(_JSON_DATA_PLACEHOLDER).encode('ascii'), 1)
+            
+            with _export_file(filename) as f:
+                f.write(head)
+                if len(data):
+                    f.write(b"[\n")
+                    buf = io.BytesIO()
+                    np.savetxt(buf, data, fmt="      [%.4f, %.4f, %.4f, %.4f, %.4f]",
+                               newline=",\n")
+                    rows = buf.getbuffer()[:-2]
+                    if not np.isfinite(data).all():
+                        # Same tokens json.dump uses for non-finite floats
+                        rows = bytes(rows).replace(b"nan", b"NaN").replace(b"inf", b"Infinity")
+                    f.write(rows)
+                    f.write(b"\n    ]")
+                else:
+                    f.write(b"[]")
+                f.write(tail)
             
             return filename
             
@@ -399,6 +606,78 @@ class DataExporter:
     
     # ============== PDF Export ==============
     
+    # ReportLab styles, built on first PDF export and shared afterwards
+    _pdf_style_cache: Optional[Dict[str, Any]] = None
+    _pdf_table_style_cache: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def _pdf_styles(cls) -> Dict[str, Any]:
+        """Paragraph styles for the PDF report."""
+        if cls._pdf_style_cache is None:
+            colors, _, _, getSampleStyleSheet, ParagraphStyle, *_ = cls._reportlab()
+            styles = getSampleStyleSheet()
+            normal_style = styles['Normal']
+            cls._pdf_style_cache = {
+                "title": ParagraphStyle(
+                    'CustomTitle',
+                    parent=styles['Heading1'],
+                    fontSize=18,
+                    spaceAfter=20,
+                    alignment=1  # Center
+                ),
+                "heading": ParagraphStyle(
+                    'CustomHeading',
+                    parent=styles['Heading2'],
+                    fontSize=12,
+                    spaceBefore=15,
+                    spaceAfter=10,
+                    textColor=colors.HexColor('#1976D2')
+                ),
+                "normal": normal_style,
+                "footer": ParagraphStyle('Footer', parent=normal_style, fontSize=8, textColor=colors.grey),
+            }
+        return cls._pdf_style_cache
+    
+    @classmethod
+    def _pdf_table_styles(cls) -> Dict[str, Any]:
+        """Table styles for the PDF report."""
+        if cls._pdf_table_style_cache is None:
+            colors, *_, TableStyle = cls._reportlab()
+            cls._pdf_table_style_cache = {
+                "info": TableStyle([
+                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+                ]),
+                # Specimen dimensions and test conditions
+                "label_value": TableStyle([
+                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+                ]),
+                "results": TableStyle([
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E3F2FD')),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1976D2')),
+                    ('ALIGN', (2, 1), (2, -1), 'RIGHT'),
+                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+                    ('TOPPADDING', (0, 0), (-1, -1), 8),
+                ]),
+                "signature": TableStyle([
+                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+                    ('FONTSIZE', (0, 0), (-1, -1), 10),
+                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                    ('TOPPADDING', (0, 2), (-1, 2), 5),
+                ]),
+            }
+        return cls._pdf_table_style_cache
+    
     def export_pdf(self,
                    times: List[float],
                    forces: List[float],
@@ -408,14 +687,23 @@ class DataExporter:
                    config: TestConfiguration,
                    properties: MechanicalProperties,
                    include_plot: bool = True,
-                   filepath: Optional[str] = None) -> str:
-        """Export test report to PDF file."""
-        if not HAS_REPORTLAB:
-            raise ExportError("reportlab not installed. Install with: pip install reportlab")
+                   filepath: Optional[str] = None,
+                   minimal: bool = False) -> str:
+        """
+        Export test report to PDF file.
+        
+        minimal=True produces a data-only report without the signature
+        fields and footer, for automated batch pipelines.
+        """
+        (colors, A4, mm, _, _, SimpleDocTemplate,
+         Paragraph, Spacer, Table, _) = self._reportlab()
         
         filename = filepath if filepath else self.generate_filename(config, "pdf")
         
         try:
+            md = config.metadata
+            sp = config.specimen
+            
             doc = SimpleDocTemplate(
                 filename,
                 pagesize=A4,
@@ -425,27 +713,11 @@ class DataExporter:
                 bottomMargin=20*mm
             )
             
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=18,
-                spaceAfter=20,
-                alignment=1  # Center
-            )
-            
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=12,
-                spaceBefore=15,
-                spaceAfter=10,
-                textColor=colors.HexColor('#1976D2')
-            )
-            
-            normal_style = styles['Normal']
+            styles = self._pdf_styles()
+            table_styles = self._pdf_table_styles()
+            title_style = styles["title"]
+            heading_style = styles["heading"]
+            normal_style = styles["normal"]
             
             # Build content
             content = []
@@ -458,44 +730,33 @@ class DataExporter:
             content.append(Paragraph("Test Information", heading_style))
             
             info_data = [
-                ["Sample ID:", config.metadata.sample_id or "N/A"],
-                ["Material:", config.metadata.material_name or "N/A"],
-                ["Grade:", config.metadata.material_grade or "N/A"],
-                ["Standard:", config.metadata.test_standard.value],
-                ["Date:", config.metadata.test_date],
-                ["Operator:", config.metadata.operator_name or "N/A"],
-                ["Customer:", config.metadata.customer_name or "N/A"],
+                ["Sample ID:", md.sample_id or "N/A"],
+                ["Material:", md.material_name or "N/A"],
+                ["Grade:", md.material_grade or "N/A"],
+                ["Standard:", md.test_standard.value],
+                ["Date:", md.test_date],
+                ["Operator:", md.operator_name or "N/A"],
+                ["Customer:", md.customer_name or "N/A"],
             ]
             
             info_table = Table(info_data, colWidths=[120, 300])
-            info_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
-                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-            ]))
+            info_table.setStyle(table_styles["info"])
             content.append(info_table)
             
             # Specimen Dimensions
             content.append(Paragraph("Specimen Dimensions", heading_style))
             
             spec_data = [
-                ["Specimen Type:", config.specimen.specimen_type],
-                ["Gauge Length:", f"{config.specimen.gauge_length} mm"],
-                ["Thickness:", f"{config.specimen.thickness} mm"],
-                ["Width:", f"{config.specimen.width} mm"],
-                ["Cross-Section Area:", f"{config.specimen.cross_section_area} mm²"],
-                ["Grip Distance:", f"{config.specimen.grip_distance} mm"],
+                ["Specimen Type:", sp.specimen_type],
+                ["Gauge Length:", f"{sp.gauge_length} mm"],
+                ["Thickness:", f"{sp.thickness} mm"],
+                ["Width:", f"{sp.width} mm"],
+                ["Cross-Section Area:", f"{sp.cross_section_area} mm²"],
+                ["Grip Distance:", f"{sp.grip_distance} mm"],
             ]
             
             spec_table = Table(spec_data, colWidths=[120, 300])
-            spec_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-            ]))
+            spec_table.setStyle(table_styles["label_value"])
             content.append(spec_table)
             
             # Mechanical Properties
@@ -514,17 +775,7 @@ class DataExporter:
             ]
             
             results_table = Table(results_data, colWidths=[150, 50, 80, 50])
-            results_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E3F2FD')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#1976D2')),
-                ('ALIGN', (2, 1), (2, -1), 'RIGHT'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ]))
+            results_table.setStyle(table_styles["results"])
             content.append(results_table)
             
             # Test Conditions
@@ -533,50 +784,41 @@ class DataExporter:
             cond_data = [
                 ["Control Mode:", config.control.control_mode.value],
                 ["Test Speed:", f"{config.control.test_speed} mm/min"],
-                ["Temperature:", f"{config.metadata.temperature} °C"],
-                ["Humidity:", f"{config.metadata.humidity} % RH"],
+                ["Temperature:", f"{md.temperature} °C"],
+                ["Humidity:", f"{md.humidity} % RH"],
                 ["Data Points:", str(len(times))],
-                ["Test Duration:", f"{times[-1] if times else 0:.1f} s"],
+                ["Test Duration:", f"{times[-1] if len(times) else 0:.1f} s"],
             ]
             
             cond_table = Table(cond_data, colWidths=[120, 300])
-            cond_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('TEXTCOLOR', (0, 0), (0, -1), colors.grey),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-            ]))
+            cond_table.setStyle(table_styles["label_value"])
             content.append(cond_table)
             
             # Notes
-            if config.metadata.notes:
+            if md.notes:
                 content.append(Paragraph("Notes", heading_style))
-                content.append(Paragraph(config.metadata.notes, normal_style))
-            
-            # Signature fields
-            content.append(Spacer(1, 40))
-            sig_data = [
-                ["", ""],
-                ["_" * 30, "_" * 30],
-                ["Tested by", "Approved by"],
-            ]
-            sig_table = Table(sig_data, colWidths=[200, 200])
-            sig_table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('TOPPADDING', (0, 2), (-1, 2), 5),
-            ]))
-            content.append(sig_table)
-            
-            # Footer info
-            content.append(Spacer(1, 20))
-            footer = Paragraph(
-                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
-                f"Software: DIY Tensile Tester v2.0",
-                ParagraphStyle('Footer', parent=normal_style, fontSize=8, textColor=colors.grey)
-            )
-            content.append(footer)
+                content.append(Paragraph(md.notes, normal_style))
+            
+            if not minimal:
+                # Signature fields
+                content.append(Spacer(1, 40))
+                sig_data = [
+                    ["", ""],
+                    ["_" * 30, "_" * 30],
+                    ["Tested by", "Approved by"],
+                ]
+                sig_table = Table(sig_data, colWidths=[200, 200])
+                sig_table.setStyle(table_styles["signature"])
+                content.append(sig_table)
+                
+                # Footer info
+                content.append(Spacer(1, 20))
+                footer = Paragraph(
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | "
+                    f"Software: DIY Tensile Tester v2.0",
+                    styles["footer"]
+                )
+                content.append(footer)
             
             doc.build(content)
             return filename
@@ -598,30 +840,35 @@ class DataExporter:
         filename = self.generate_filename(config, "xml")
         
         try:
-            # Build XML manually for simplicity
-            xml_lines = [
+            md = config.metadata
+            sp = config.specimen
+            
+            esc = _xml_text
+            
+            # Build XML manually for simplicity; free-text fields are escaped
+            head_lines = [
                 '<?xml version="1.0" encoding="UTF-8"?>',
                 '<TensileTestReport>',
                 '  <Metadata>',
-                f'    <TestID>{config.metadata.test_id}</TestID>',
-                f'    <SampleID>{config.metadata.sample_id}</SampleID>',
-                f'    <BatchID>{config.metadata.batch_id}</BatchID>',
-                f'    <MaterialName>{config.metadata.material_name}</MaterialName>',
-                f'    <MaterialType>{config.metadata.material_type.value}</MaterialType>',
-                f'    <Standard>{config.metadata.test_standard.value}</Standard>',
-                f'    <Operator>{config.metadata.operator_name}</Operator>',
-                f'    <Customer>{config.metadata.customer_name}</Customer>',
-                f'    <TestDate>{config.metadata.test_date}</TestDate>',
-                f'    <TestTime>{config.metadata.test_time}</TestTime>',
-                f'    <Temperature unit="C">{config.metadata.temperature}</Temperature>',
-                f'    <Humidity unit="percent">{config.metadata.humidity}</Humidity>',
+                f'    <TestID>{esc(md.test_id)}</TestID>',
+                f'    <SampleID>{esc(md.sample_id)}</SampleID>',
+                f'    <BatchID>{esc(md.batch_id)}</BatchID>',
+                f'    <MaterialName>{esc(md.material_name)}</MaterialName>',
+                f'    <MaterialType>{md.material_type.value}</MaterialType>',
+                f'    <Standard>{md.test_standard.value}</Standard>',
+                f'    <Operator>{esc(md.operator_name)}</Operator>',
+                f'    <Customer>{esc(md.customer_name)}</Customer>',
+                f'    <TestDate>{esc(md.test_date)}</TestDate>',
+                f'    <TestTime>{esc(md.test_time)}</TestTime>',
+                f'    <Temperature unit="C">{md.temperature}</Temperature>',
+                f'    <Humidity unit="percent">{md.humidity}</Humidity>',
                 '  </Metadata>',
                 '  <Specimen>',
-                f'    <Type>{config.specimen.specimen_type}</Type>',
-                f'    <GaugeLength unit="mm">{config.specimen.gauge_length}</GaugeLength>',
-                f'    <Thickness unit="mm">{config.specimen.thickness}</Thickness>',
-                f'    <Width unit="mm">{config.specimen.width}</Width>',
-                f'    <CrossSection unit="mm2">{config.specimen.cross_section_area}</CrossSection>',
+                f'    <Type>{esc(sp.specimen_type)}</Type>',
+                f'    <GaugeLength unit="mm">{sp.gauge_length}</GaugeLength>',
+                f'    <Thickness unit="mm">{sp.thickness}</Thickness>',
+                f'    <Width unit="mm">{sp.width}</Width>',
+                f'    <CrossSection unit="mm2">{sp.cross_section_area}</CrossSection>',
                 '  </Specimen>',
                 '  <Results>',
                 '    <Strength>',
@@ -650,17 +897,9 @@ class DataExporter:
                 '  <RawData>',
                 f'    <Points>{len(times)}</Points>',
                 '    <DataPoints>',
+                '',
             ]
-            
-            # Add data points
-            for i in range(len(times)):
-                xml_lines.append(
-                    f'      <Point time="{times[i]:.4f}" force="{forces[i]:.4f}" '
-                    f'extension="{extensions[i]:.4f}" stress="{stresses[i]:.4f}" '
-                    f'strain="{strains[i]*100:.4f}"/>'
-                )
-            
-            xml_lines.extend([
+            tail_lines = [
                 '    </DataPoints>',
                 '  </RawData>',
                 '  <ExportInfo>',
@@ -668,10 +907,20 @@ class DataExporter:
                 '    <Software>DIY Tensile Tester v2.0</Software>',
                 '  </ExportInfo>',
                 '</TensileTestReport>',
-            ])
+            ]
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(xml_lines))
+            # The data points stream from the matrix into the buffered file
+            # between the two fixed parts, so the document is never joined
+            # into one string
+            with _export_file(filename) as f:
+                f.write('\n'.join(head_lines).encode('utf-8'))
+                if len(times):
+                    data = self._data(times, forces, extensions, stresses, strains)
+                    _write_rows(f, data, (
+                        '      <Point time="%.4f" force="%.4f" extension="%.4f" '
+                        'stress="%.4f" strain="%.4f"/>\n'
+                    ))
+                f.write('\n'.join(tail_lines).encode('utf-8'))
             
             return filename
             
@@ -681,60 +930,52 @@ class DataExporter:
     # ============== Batch Export ==============
     
     def export_all(self,
-                   times: List[float],
-                   forces: List[float],
-                   extensions: List[float],
-                   stresses: List[float],
-                   strains: List[float],
+                   times: np.ndarray,
+                   forces: np.ndarray,
+                   extensions: np.ndarray,
+                   stresses: np.ndarray,
+                   strains: np.ndarray,
                    config: TestConfiguration,
                    properties: MechanicalProperties,
                    export_config: ExportConfig) -> Dict[str, str]:
-        """Export to all selected formats."""
-        results = {}
-        
-        if export_config.export_csv:
-            try:
-                results['csv'] = self.export_csv(
-                    times, forces, extensions, stresses, strains,
-                    config, properties
-                )
-            except ExportError as e:
-                results['csv_error'] = str(e)
+        """
+        Export to all selected formats.
         
-        if export_config.export_excel:
-            try:
-                results['excel'] = self.export_excel(
-                    times, forces, extensions, stresses, strains,
-                    config, properties
-                )
-            except ExportError as e:
-                results['excel_error'] = str(e)
-        
-        if export_config.export_json:
-            try:
-                results['json'] = self.export_json(
-                    times, forces, extensions, stresses, strains,
-                    config, properties
-                )
-            except ExportError as e:
-                results['json_error'] = str(e)
-        
-        if export_config.export_pdf:
-            try:
-                results['pdf'] = self.export_pdf(
-                    times, forces, extensions, stresses, strains,
-                    config, properties
-                )
-            except ExportError as e:
-                results['pdf_error'] = str(e)
+        The formats share no state, so they run concurrently on a thread
+        pool and the total time is roughly that of the slowest one. The
+        channels may be arrays or lists; lists are converted once here.
+        """
+        times, forces, extensions, stresses, strains = (
+            np.asarray(c, dtype=np.float64)
+            for c in (times, forces, extensions, stresses, strains)
+        )
+        jobs = [(key, export) for key, enabled, export in (
+            ('csv', export_config.export_csv, self.export_csv),
+            ('excel', export_config.export_excel, self.export_excel),
+            ('json', export_config.export_json, self.export_json),
+            ('pdf', export_config.export_pdf, self.export_pdf),
+            ('xml', export_config.export_xml, self.export_xml),
+        ) if enabled]
+        results = {}
+        if not jobs:
+            return results
         
-        if export_config.export_xml:
-            try:
-                results['xml'] = self.export_xml(
-                    times, forces, extensions, stresses, strains,
-                    config, properties
-                )
-            except ExportError as e:
-                results['xml_error'] = str(e)
+        # Every format reads the same stacked matrix, so build it only once
+        self._prepared = _prepare(times, forces, extensions, stresses, strains)
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                futures = {
+                    pool.submit(export, times, forces, extensions, stresses, strains,
+                                config, properties): key
+                    for key, export in jobs
+                }
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        results[key] = future.result()
+                    except ExportError as e:
+                        results[f'{key}_error'] = str(e)
+        finally:
+            self._prepared = None
         
         return results
@@ -5,15 +5,29 @@ Mock Serial for Dear PyGui Testing
 Simulates hardware for testing without physical device.
 """
 
+import logging
 import threading
 import time
 import math
-import random
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from dataclasses import dataclass
+import numpy as np
 
+# Try to import optional dependencies
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+# Hybrid sampling event thresholds
+FORCE_THRESHOLD = 2.0    # N - trigger event sampling (reduced for sensitivity)
+SLOPE_THRESHOLD = 0.2    # 20% slope change
+
+
+@dataclass(slots=True)
 class DataPoint:
     """Data point from tensile test."""
     timestamp: float
@@ -23,7 +37,7 @@ class DataPoint:
     strain: float
 
 
-@dataclass 
+@dataclass(slots=True)
 class Status:
     """Machine status."""
     state: str
@@ -32,6 +46,46 @@ class Status:
     is_running: bool
 
 
+def _noop(*args, **kwargs):
+    """Default for unset callbacks, so they can be called unconditionally."""
+
+
+def _tick(model_force, last_force, last_slope, noise, dt, ultimate_force):
+    """
+    One physics step of the simulated specimen.
+    
+    Returns (force, slope, event_detected) for the noise-free model force
+    at this tick, the noise sample to add and the last sampled force and
+    slope.
+    """
+    # Add noise
+    force = model_force + noise
+    force = max(0.0, force)
+    
+    # Event detection
+    force_change = abs(force - last_force)
+    current_slope = (force - last_force) / max(dt, 0.001)
+    slope_change = abs(current_slope - last_slope) / max(abs(last_slope), 0.1)
+    
+    event_detected = False
+    if force_change > FORCE_THRESHOLD:
+        event_detected = True
+    if slope_change > SLOPE_THRESHOLD and abs(last_slope) > 1.0:
+        event_detected = True
+    if force > 0.95 * ultimate_force:
+        event_detected = True  # Near peak
+    if last_force > 10 and force < last_force * 0.9:
+        event_detected = True  # Force drop (failure)
+    
+    return force, current_slope, event_detected
+
+
+if HAS_NUMBA:
+    _tick = njit(cache=True, fastmath=True)(_tick)
+    # Compile now rather than on the first tick of the first test
+    _tick(0.0, 0.0, 0.0, 0.0, 0.01, 80.0)
+
+
 class MockSerialHandler:
     """Mock serial handler that simulates tensile test hardware."""
     
@@ -47,24 +101,32 @@ class MockSerialHandler:
         self._is_testing = False
         self._is_paused = False
         
+        # Wake the test thread at once on pause/resume/stop instead of polling
+        self._resume_event = threading.Event()  # Clear while paused
+        self._resume_event.set()
+        self._stop_event = threading.Event()
+        
         # Test parameters
         self._speed = 1.0
         self._max_force = 450.0
         self._max_extension = 100.0
         
+        # Noise generator owned by this handler, seeded once
+        self._rng = np.random.default_rng()
+        
         # Specimen parameters (for simulation)
         self._gauge_length = 50.0  # mm
         self._cross_section = 12.57  # mm² (4mm diameter)
         
         # Callbacks
-        self.on_connected = None
-        self.on_disconnected = None
-        self.on_status = None
-        self.on_data = None
-        self.on_force = None
-        self.on_position = None
-        self.on_response = None
-        self.on_error = None
+        self.on_connected = _noop
+        self.on_disconnected = _noop
+        self.on_status = _noop
+        self.on_data = _noop
+        self.on_force = _noop
+        self.on_position = _noop
+        self.on_response = _noop
+        self.on_error = _noop
     
     @staticmethod
     def list_ports() -> List[str]:
@@ -76,26 +138,25 @@ class MockSerialHandler:
     
     def connect(self, port: str, baudrate: int = 115200) -> bool:
         """Simulate connection."""
-        print(f"[MockSerial] Connecting to {port}...")
+        logger.debug("Connecting to %s...", port)
         time.sleep(0.3)  # Simulate connection delay
         
         self._connected = True
         self._state = "IDLE"
         self._running = True
         
-        if self.on_connected:
-            self.on_connected()
-        
-        if self.on_response:
-            self.on_response("Connected to Mock Pico")
+        self.on_connected()
+        self.on_response("Connected to Mock Pico")
         
-        print(f"[MockSerial] Connected!")
+        logger.debug("Connected!")
         return True
     
     def disconnect(self):
         """Disconnect."""
         self._running = False
         self._is_testing = False
+        self._stop_event.set()
+        self._resume_event.set()
         
         if self._test_thread:
             self._test_thread.join(timeout=2.0)
@@ -104,10 +165,9 @@ class MockSerialHandler:
         self._connected = False
         self._state = "DISCONNECTED"
         
-        if self.on_disconnected:
-            self.on_disconnected()
+        self.on_disconnected()
         
-        print("[MockSerial] Disconnected")
+        logger.debug("Disconnected")
     
     def is_connected(self) -> bool:
         return self._connected
@@ -115,7 +175,7 @@ class MockSerialHandler:
     def send_command(self, command: str) -> bool:
         if not self._connected:
             return False
-        print(f"[MockSerial] Command: {command}")
+        logger.debug("Command: %s", command)
         return True
     
     def start_test(self) -> bool:
@@ -123,9 +183,11 @@ class MockSerialHandler:
         if not self._connected or self._is_testing:
             return False
         
-        print("[MockSerial] Starting test simulation...")
+        logger.debug("Starting test simulation...")
         self._is_testing = True
         self._is_paused = False
+        self._stop_event.clear()
+        self._resume_event.set()
         self._state = "RUNNING"
         self._position = 0.0
         self._force = 0.0
@@ -134,46 +196,47 @@ class MockSerialHandler:
         self._test_thread = threading.Thread(target=self._run_test, daemon=True)
         self._test_thread.start()
         
-        if self.on_response:
-            self.on_response("Test started")
+        self.on_response("Test started")
         
         return True
     
     def stop_test(self) -> bool:
         """Stop test."""
         self._is_testing = False
+        self._stop_event.set()
+        self._resume_event.set()
         self._state = "IDLE"
         
-        if self.on_response:
-            self.on_response("Test stopped")
+        self.on_response("Test stopped")
         return True
     
     def pause_test(self) -> bool:
         """Pause test."""
         self._is_paused = True
+        self._resume_event.clear()
         self._state = "PAUSED"
         
-        if self.on_response:
-            self.on_response("Test paused")
+        self.on_response("Test paused")
         return True
     
     def resume_test(self) -> bool:
         """Resume test."""
         self._is_paused = False
+        self._resume_event.set()
         self._state = "RUNNING"
         
-        if self.on_response:
-            self.on_response("Test resumed")
+        self.on_response("Test resumed")
         return True
     
     def emergency_stop(self) -> bool:
         """Emergency stop."""
         self._is_testing = False
         self._is_paused = False
+        self._stop_event.set()
+        self._resume_event.set()
         self._state = "ESTOP"
         
-        if self.on_response:
-            self.on_response("EMERGENCY STOP!")
+        self.on_response("EMERGENCY STOP!")
         return True
     
     def home(self) -> bool:
@@ -186,8 +249,7 @@ class MockSerialHandler:
         def do_home():
             time.sleep(1.0)
             self._state = "IDLE"
-            if self.on_response:
-                self.on_response("Homing complete")
+            self.on_response("Homing complete")
         
         threading.Thread(target=do_home, daemon=True).start()
         return True
@@ -196,8 +258,7 @@ class MockSerialHandler:
         """Tare load cell."""
         self._force = 0.0
         
-        if self.on_response:
-            self.on_response("Tare complete")
+        self.on_response("Tare complete")
         return True
     
     def set_speed(self, speed: float) -> bool:
@@ -214,7 +275,7 @@ class MockSerialHandler:
     
     def get_status(self) -> bool:
         """Get current status."""
-        if self.on_status:
+        if self.on_status is not _noop:
             status = Status(
                 state=self._state,
                 force=self._force,
@@ -225,18 +286,15 @@ class MockSerialHandler:
         return True
     
     def get_force(self) -> bool:
-        if self.on_force:
-            self.on_force(self._force)
+        self.on_force(self._force)
         return True
     
     def get_position(self) -> bool:
-        if self.on_position:
-            self.on_position(self._position)
+        self.on_position(self._position)
         return True
     
     def identify(self) -> bool:
-        if self.on_response:
-            self.on_response("ID Mock Pico Tensile Tester v2.0")
+        self.on_response("ID Mock Pico Tensile Tester v2.0")
         return True
     
     def jog_up(self, distance: float = 0) -> bool:
@@ -252,10 +310,54 @@ class MockSerialHandler:
         self._state = "IDLE"
         return True
     
+    def _precompute_curve(self, dt: float,
+                          yield_extension: float, ultimate_extension: float,
+                          break_extension: float, yield_force: float,
+                          ultimate_force: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Noise-free crosshead path from the current position at the current
+        speed, one entry per physics tick.
+        
+        Returns (extensions, forces, strains) up to and including the first
+        tick that breaks the specimen or passes the max extension.
+        """
+        step = self._speed * dt
+        if step <= 0:
+            empty = np.empty(0)
+            return empty, empty, empty
+        
+        # Same sequential sums as advancing the position tick by tick
+        limit = min(break_extension, self._max_extension)
+        n = int(limit / step) + 2
+        extensions = self._position + np.cumsum(np.full(n, step))
+        end = np.flatnonzero((extensions >= break_extension) |
+                             (extensions > self._max_extension))[0]
+        extensions = extensions[:end + 1]
+        
+        # Extension-based material model, one region per condition
+        forces = np.select(
+            [
+                extensions < yield_extension,       # Elastic region - linear
+                extensions < ultimate_extension,    # Plastic region - strain hardening
+                extensions < break_extension,       # Necking - force decreases
+            ],
+            [
+                (extensions / yield_extension) * yield_force,
+                yield_force + ((extensions - yield_extension)
+                               / (ultimate_extension - yield_extension))
+                * (ultimate_force - yield_force),
+                ultimate_force * (1.0 - 0.6 * ((extensions - ultimate_extension)
+                                               / (break_extension - ultimate_extension))),
+            ],
+            default=0.0  # Broken
+        )
+        strains = extensions * (1.0 / self._gauge_length)
+        return extensions, forces, strains
+    
     def _run_test(self):
         """Run simulated tensile test with hybrid time + event-based sampling."""
-        print("[MockSerial] Test thread started (Hybrid Sampling)")
-        print(f"[MockSerial] Speed: {self._speed} mm/s, Max ext: {self._max_extension} mm")
+        logger.debug("Test thread started (Hybrid Sampling)")
+        logger.debug("Speed: %s mm/s, Max ext: %s mm", self._speed, self._max_extension)
         
         # Material simulation parameters - more realistic for longer test
         # Simulating a ductile polymer or soft metal
@@ -274,85 +376,89 @@ class MockSerialHandler:
         yield_force = 50.0       # N at yield
         ultimate_force = 80.0    # N at peak (UTS)
         
-        start_time = time.time()
+        # Physics update interval and the model curve it steps through
+        dt_move = 0.01  # 10ms physics update
+        
+        def build_curve():
+            """Curve from the current position at the current speed, plus its noise."""
+            curve = [a.tolist() for a in self._precompute_curve(
+                dt_move, yield_extension, ultimate_extension, break_extension,
+                yield_force, ultimate_force
+            )]
+            # Load cell noise for every tick, drawn in one call
+            curve.append(self._rng.normal(0.0, 0.5, len(curve[0])).tolist())
+            return curve
+        
+        curve_speed = self._speed
+        extensions, model_forces, strains, noise = build_curve()
+        n_ticks = len(extensions)
+        tick = 0
+        
+        # Integer nanoseconds on the monotonic clock (immune to wall-clock steps)
+        start_time = time.monotonic_ns()
         last_sample_time = start_time
         last_force = 0.0
         last_slope = 0.0
         
-        # Hybrid sampling parameters
-        BASE_INTERVAL = 0.1      # 100ms = 10 Hz base rate
-        EVENT_INTERVAL = 0.02    # 20ms = 50 Hz during events
-        FORCE_THRESHOLD = 2.0    # N - trigger event sampling (reduced for sensitivity)
-        SLOPE_THRESHOLD = 0.2    # 20% slope change
-        MIN_EVENT_INTERVAL = 0.02  # Minimum 20ms between event samples
+        # Hybrid sampling parameters (event thresholds are module level)
+        BASE_INTERVAL = 100_000_000      # 100ms = 10 Hz base rate
+        EVENT_INTERVAL = 20_000_000      # 20ms = 50 Hz during events
+        MIN_EVENT_INTERVAL = 20_000_000  # Minimum 20ms between event samples
+        EVENT_MODE_TIMEOUT = 500_000_000  # Leave event mode 500ms after the last event
         
-        last_event_time = 0
+        last_event_time = start_time - EVENT_MODE_TIMEOUT
         in_event_mode = False
         sample_count = 0
         
-        while self._is_testing and self._running:
-            if self._is_paused:
-                time.sleep(0.05)
-                continue
+        # Bind what the loop calls every tick to locals
+        now = time.monotonic_ns
+        step = _tick
+        wait_resumed = self._resume_event.wait
+        wait_stopped = self._stop_event.wait
+        is_stopped = self._stop_event.is_set
+        inv_area = 1.0 / self._cross_section
+        
+        while self._is_testing and self._running and tick < n_ticks:
+            # Blocks while paused; stop and disconnect also release it
+            wait_resumed()
+            if is_stopped():
+                break
             
-            current_time = time.time()
-            elapsed = current_time - start_time
+            current_time = now()
             
-            # Move crosshead (continuous)
-            dt_move = 0.01  # 10ms physics update
-            self._position += self._speed * dt_move
-            extension = self._position
+            # Speed changed mid-test: continue from here at the new rate
+            if self._speed != curve_speed:
+                curve_speed = self._speed
+                extensions, model_forces, strains, noise = build_curve()
+                n_ticks = len(extensions)
+                tick = 0
+                if not n_ticks:
+                    break
             
-            # Calculate strain
-            strain = extension / self._gauge_length
+            # Move crosshead (continuous) along the precomputed curve
+            extension = extensions[tick]
+            strain = strains[tick]
+            self._position = extension
             
-            # Calculate force using extension-based material model
-            if extension < yield_extension:
-                # Elastic region - linear
-                force = (extension / yield_extension) * yield_force
-            elif extension < ultimate_extension:
-                # Plastic region - strain hardening
-                progress = (extension - yield_extension) / (ultimate_extension - yield_extension)
-                force = yield_force + progress * (ultimate_force - yield_force)
-            elif extension < break_extension:
-                # Necking - force decreases
-                progress = (extension - ultimate_extension) / (break_extension - ultimate_extension)
-                force = ultimate_force * (1.0 - 0.6 * progress)
-            else:
-                # Broken
-                force = 0.0
+            # Noise and event detection
+            force, current_slope, event_detected = step(
+                model_forces[tick], last_force, last_slope, noise[tick],
+                dt_move, ultimate_force
+            )
+            tick += 1
+            if extension >= break_extension:
                 self._is_testing = False
                 self._state = "COMPLETE"
-                print(f"[MockSerial] Specimen failed at {extension:.1f}mm!")
-            
-            # Add noise
-            force += random.gauss(0, 0.5)
-            force = max(0, force)
+                logger.debug("Specimen failed at %.1fmm!", extension)
             self._force = force
             
             # Calculate stress from force
-            stress = force / self._cross_section
+            stress = force * inv_area
             
             # === Hybrid Sampling Decision ===
             time_since_last_sample = current_time - last_sample_time
             time_since_last_event = current_time - last_event_time
             
-            # Event detection
-            force_change = abs(force - last_force)
-            current_slope = (force - last_force) / max(dt_move, 0.001)
-            slope_change = abs(current_slope - last_slope) / max(abs(last_slope), 0.1)
-            
-            # Check for events
-            event_detected = False
-            if force_change > FORCE_THRESHOLD:
-                event_detected = True
-            if slope_change > SLOPE_THRESHOLD and abs(last_slope) > 1.0:
-                event_detected = True
-            if force > 0.95 * ultimate_force:
-                event_detected = True  # Near peak
-            if last_force > 10 and force < last_force * 0.9:
-                event_detected = True  # Force drop (failure)
-            
             # Determine if we should sample
             should_sample = False
             
@@ -362,7 +468,7 @@ class MockSerialHandler:
                 last_event_time = current_time
             elif in_event_mode and time_since_last_sample >= EVENT_INTERVAL:
                 should_sample = True
-                if time_since_last_event > 0.5:
+                if time_since_last_event > EVENT_MODE_TIMEOUT:
                     in_event_mode = False
             elif time_since_last_sample >= BASE_INTERVAL:
                 should_sample = True
@@ -373,10 +479,12 @@ class MockSerialHandler:
                 last_sample_time = current_time
                 last_slope = current_slope
                 last_force = force
+                timestamp = (current_time - start_time) / 1e6  # ms
                 
-                if self.on_data:
+                # Per-sample object only for consumers that want one
+                if self.on_data is not _noop:
                     data = DataPoint(
-                        timestamp=elapsed * 1000,  # ms
+                        timestamp=timestamp,
                         force=force,
                         extension=extension,
                         stress=stress,
@@ -386,21 +494,26 @@ class MockSerialHandler:
             
             # Check limits
             if force > self._max_force:
-                print(f"[MockSerial] Max force ({self._max_force}N) reached!")
+                logger.debug("Max force (%sN) reached!", self._max_force)
                 self._is_testing = False
                 self._state = "COMPLETE"
             
             if extension > self._max_extension:
-                print(f"[MockSerial] Max extension ({self._max_extension}mm) reached!")
+                logger.debug("Max extension (%smm) reached!", self._max_extension)
                 self._is_testing = False
                 self._state = "COMPLETE"
             
-            time.sleep(dt_move)
+            if wait_stopped(dt_move):
+                break
+        
+        if tick == n_ticks:
+            # Curve exhausted without reaching a limit (no crosshead motion)
+            self._is_testing = False
+            self._state = "COMPLETE"
         
-        print(f"[MockSerial] Test ended - {sample_count} data points collected")
+        logger.debug("Test ended - %d data points collected", sample_count)
         
-        if self.on_response:
-            self.on_response("Test complete")
+        self.on_response("Test complete")
 
 
 # Create singleton instance
@@ -9,7 +9,7 @@ Author: DIY Tensile Tester Project
 Version: 2.0.0
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import List, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
@@ -106,7 +106,7 @@ class TestStage(Enum):
 
 # ============== Configuration Data Classes ==============
 
-@dataclass
+@dataclass(slots=True)
 class TestMetadata:
     """Test identification and metadata."""
     # Identification
@@ -138,7 +138,7 @@ class TestMetadata:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecimenConfig:
     """Specimen dimensions and geometry."""
     # Dimensions
@@ -165,7 +165,7 @@ class SpecimenConfig:
         return self.cross_section_area
 
 
-@dataclass
+@dataclass(slots=True)
 class MachineConfig:
     """Machine and hardware settings."""
     # Load cell
@@ -193,7 +193,7 @@ class MachineConfig:
     zero_extensometer_on_start: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TestControlConfig:
     """Test control parameters."""
     # Control mode
@@ -223,7 +223,7 @@ class TestControlConfig:
     return_speed: float = 50.0  # mm/min
 
 
-@dataclass
+@dataclass(slots=True)
 class DataAcquisitionConfig:
     """Data acquisition settings."""
     # Sampling
@@ -250,7 +250,7 @@ class DataAcquisitionConfig:
     calculate_true_values: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminationCriteria:
     """Test termination conditions."""
     # Break detection
@@ -271,7 +271,7 @@ class TerminationCriteria:
 
 # ============== Test Results Data Classes ==============
 
-@dataclass
+@dataclass(slots=True)
 class DataPoint:
     """Single data point during test."""
     timestamp: float  # ms
@@ -287,7 +287,7 @@ class DataPoint:
     strain_rate: float = 0.0  # 1/s
 
 
-@dataclass
+@dataclass(slots=True)
 class MechanicalProperties:
     """Calculated mechanical properties."""
     # Strength
@@ -368,7 +368,7 @@ class TestResults:
     video_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TestConfiguration:
     """Complete test configuration container."""
     metadata: TestMetadata = field(default_factory=TestMetadata)
@@ -379,20 +379,8 @@ class TestConfiguration:
     termination: TerminationCriteria = field(default_factory=TerminationCriteria)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON export."""
-        from dataclasses import asdict
-        result = {}
-        for key, value in asdict(self).items():
-            if isinstance(value, dict):
-                result[key] = {}
-                for k, v in value.items():
-                    if isinstance(v, Enum):
-                        result[key][k] = v.value
-                    else:
-                        result[key][k] = v
-            else:
-                result[key] = value
-        return result
+        """Convert to a dictionary of JSON primitives for export."""
+        return _configuration_to_dict(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TestConfiguration':
@@ -402,6 +390,42 @@ class TestConfiguration:
         return config
 
 
+def _compile_to_dict(cls) -> Any:
+    """
+    Generate a to_dict function specialized to a configuration class.
+    
+    The nested schema is fixed, so the generated code is one literal dict
+    of attribute reads: enum fields emit .value and list fields (the stage
+    profile) a shallow copy of each entry, decided once from the field
+    types rather than per value.
+    """
+    lines = ["def _to_dict(self):"]
+    body = []
+    for section in fields(cls):
+        name = section.name
+        lines.append(f"    {name} = self.{name}")
+        items = []
+        for f in fields(section.type):
+            ref = f"{name}.{f.name}"
+            if isinstance(f.type, type) and issubclass(f.type, Enum):
+                ref += ".value"
+            elif getattr(f.type, "__origin__", None) is list:
+                ref = f"[dict(v) if isinstance(v, dict) else v for v in {ref}]"
+            items.append(f"            {f.name!r}: {ref},")
+        body.append(f"        {name!r}: {{")
+        body.extend(items)
+        body.append("        },")
+    lines.append("    return {")
+    lines.extend(body)
+    lines.append("    }")
+    namespace = {}
+    exec(compile("\n".join(lines) + "\n", f"<{cls.__name__}.to_dict>", "exec"), namespace)
+    return namespace["_to_dict"]
+
+
+_configuration_to_dict = _compile_to_dict(TestConfiguration)
+
+
 # ============== Export Formats ==============
 
 @dataclass
@@ -9,16 +9,28 @@ Author: DIY Tensile Tester Project
 Version: 2.0.0
 """
 
+import logging
+import math
 import dearpygui.dearpygui as dpg
 import numpy as np
-from typing import List, Optional, Callable
+from functools import partial
+from typing import Optional, Callable
 from dataclasses import dataclass, field
 
+# Try to import optional dependencies
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from models import (
     TestConfiguration, MechanicalProperties, TestResults,
     FailureType, BreakLocation, TestStage
 )
 
+logger = logging.getLogger(__name__)
+
 # Color scheme
 COLORS = {
     'accent': (79, 195, 247),
@@ -33,16 +45,324 @@ COLORS = {
 }
 
 
+# Properties tab layout: section title, then (label, symbol, attribute, format, unit)
+PROPERTY_SECTIONS = (
+    ("Strength Properties", (
+        ("Ultimate Tensile Strength", "σ_UTS", "ultimate_tensile_strength", ".2f", "MPa"),
+        ("Yield Strength (Rp0.2)", "σ_y", "yield_strength_offset", ".2f", "MPa"),
+        ("Break Stress", "σ_b", "break_stress", ".2f", "MPa"),
+        ("Maximum Force", "F_max", "max_force", ".2f", "N"),
+        ("Force at Yield", "F_y", "force_at_yield", ".2f", "N"),
+        ("Force at Break", "F_b", "force_at_break", ".2f", "N"),
+    )),
+    ("Elastic Properties", (
+        ("Young's Modulus", "E", "youngs_modulus", ".1f", "MPa"),
+        ("Modulus R²", "R²", "modulus_r_squared", ".4f", "-"),
+        ("Secant Modulus", "E_s", "secant_modulus", ".1f", "MPa"),
+    )),
+    ("Deformation Properties", (
+        ("Elongation at Break", "ε_b", "strain_at_break", ".2f", "%"),
+        ("Strain at Yield", "ε_y", "strain_at_yield", ".2f", "%"),
+        ("Strain at UTS", "ε_UTS", "strain_at_uts", ".2f", "%"),
+        ("Extension at Break", "ΔL_b", "extension_at_break", ".3f", "mm"),
+        ("Extension at Yield", "ΔL_y", "extension_at_yield", ".3f", "mm"),
+    )),
+    ("Energy Properties", (
+        ("Energy to Break", "U_b", "energy_to_break", ".4f", "J"),
+        ("Energy to Yield", "U_y", "energy_to_yield", ".4f", "J"),
+        ("Resilience", "U_r", "resilience", ".4f", "MJ/m³"),
+    )),
+)
+
+# (attribute, DPG tag, format) of every properties-tab value
+PROPERTY_VALUE_TAGS = tuple(
+    (attr, f"prop_{attr}_value", spec)
+    for _, rows in PROPERTY_SECTIONS for _, _, attr, spec, _ in rows
+)
+
+# Summary tab key results: (label, attribute, format, unit, DPG tag)
+SUMMARY_RESULTS = (
+    ("Ultimate Tensile Strength", "ultimate_tensile_strength", ".2f", "MPa", "summary_uts"),
+    ("Yield Strength (Rp0.2)", "yield_strength_offset", ".2f", "MPa", "summary_yield"),
+    ("Young's Modulus", "youngs_modulus", ".1f", "MPa", "summary_modulus"),
+    ("Elongation at Break", "strain_at_break", ".2f", "%", "summary_elongation"),
+    ("Maximum Force", "max_force", ".2f", "N", "summary_max_force"),
+    ("Energy to Break", "energy_to_break", ".4f", "J", "summary_energy"),
+)
+
+# Compliance tab criteria: (label, tag key, attribute, format, default max)
+COMPLIANCE_CRITERIA = (
+    ("UTS (MPa)", "uts", "ultimate_tensile_strength", ".2f", 999),
+    ("Elongation (%)", "elong", "strain_at_break", ".2f", 999),
+    ("Young's Modulus (MPa)", "mod", "youngs_modulus", ".1f", 99999),
+)
+
+# Starting capacity of the TestData backing buffers (doubled when full)
+TEST_DATA_CAPACITY = 1024
+
+# Channel storage type; results are display-grade, reductions run in float64
+TEST_DATA_DTYPE = np.float32
+
+
+def _empty_channel() -> np.ndarray:
+    return np.empty(0, dtype=TEST_DATA_DTYPE)
+
+
+def _trapz(y: np.ndarray, x: np.ndarray) -> float:
+    """Trapezoid integral of y over x, accumulated in float64."""
+    return 0.5 * float(np.einsum('i,i->', y[:-1] + y[1:], np.diff(x), dtype=np.float64))
+
+
 @dataclass
 class TestData:
-    """Container for test data arrays."""
-    times: List[float] = field(default_factory=list)
-    forces: List[float] = field(default_factory=list)
-    extensions: List[float] = field(default_factory=list)
-    stresses: List[float] = field(default_factory=list)
-    strains: List[float] = field(default_factory=list)
-    true_stresses: List[float] = field(default_factory=list)
-    true_strains: List[float] = field(default_factory=list)
+    """
+    Container for test data arrays.
+    
+    Each channel is an ndarray view of its valid samples. Sequences passed
+    to the constructor are converted once; append() writes into backing
+    buffers that grow by doubling, so the views never need copying.
+    """
+    times: np.ndarray = field(default_factory=_empty_channel)
+    forces: np.ndarray = field(default_factory=_empty_channel)
+    extensions: np.ndarray = field(default_factory=_empty_channel)
+    stresses: np.ndarray = field(default_factory=_empty_channel)
+    strains: np.ndarray = field(default_factory=_empty_channel)
+    true_stresses: np.ndarray = field(default_factory=_empty_channel)
+    true_strains: np.ndarray = field(default_factory=_empty_channel)
+    _buffers: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    _CHANNELS = ('times', 'forces', 'extensions', 'stresses', 'strains',
+                 'true_stresses', 'true_strains')
+    
+    def __post_init__(self):
+        for name in self._CHANNELS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=TEST_DATA_DTYPE))
+    
+    def append(self, time: float, force: float, extension: float, stress: float,
+               strain: float, true_stress: Optional[float] = None,
+               true_strain: Optional[float] = None):
+        """Append one sample; true values are only recorded when given."""
+        self._push('times', time)
+        self._push('forces', force)
+        self._push('extensions', extension)
+        self._push('stresses', stress)
+        self._push('strains', strain)
+        if true_stress is not None:
+            self._push('true_stresses', true_stress)
+            self._push('true_strains', true_strain)
+    
+    def _push(self, name: str, value: float):
+        view = getattr(self, name)
+        n = len(view)
+        buf = self._buffers.get(name)
+        if buf is None or n == len(buf) or view.base is not buf:
+            buf = np.empty(max(TEST_DATA_CAPACITY, 2 * n), dtype=TEST_DATA_DTYPE)
+            buf[:n] = view
+            self._buffers[name] = buf
+        buf[n] = value
+        setattr(self, name, buf[:n + 1])
+
+
+# Failure types by failure code
+_FAILURE_TYPES = (FailureType.UNKNOWN, FailureType.BRITTLE, FailureType.DUCTILE,
+                  FailureType.NECKING, FailureType.NO_BREAK)
+
+
+def _failure_code_table() -> np.ndarray:
+    """
+    Failure code for every combination of the classification flags.
+    
+    Index bits: 1 brittle, 2 ductile, 4 necking plateau, 8 small force drop.
+    Earlier rules win, and a curve matching none of them counts as ductile.
+    """
+    codes = np.empty(16, dtype=np.int8)
+    for bits in range(16):
+        if bits & 1:
+            codes[bits] = 1
+        elif bits & 2:
+            codes[bits] = 2
+        elif bits & 4:
+            codes[bits] = 3
+        elif bits & 8:
+            codes[bits] = 4
+        else:
+            codes[bits] = 2
+    return codes
+
+
+_FAILURE_CODES = _failure_code_table()
+
+
+def _analyze_numba(forces, extensions, stresses, strains):
+    """
+    Compiled counterpart of the ResultsAnalyzer numpy path.
+
+    Each stage is a single loop over the arrays with scalar accumulators.
+    Returns (max_idx, yield_idx, max_force, uts, strain_at_uts,
+    youngs_modulus, r_squared, secant_modulus, yield_strength,
+    strain_at_yield, force_at_yield, energy_to_break, energy_to_yield,
+    resilience, extension_at_yield, failure_code), where failure_code
+    indexes _FAILURE_TYPES.
+    """
+    n = forces.shape[0]
+    
+    # Peak values and the number of points in the 0.05-0.25% window
+    max_idx = 0
+    max_force = forces[0]
+    uts = stresses[0]
+    n_window = 0
+    for i in range(n):
+        if forces[i] > max_force:
+            max_force = forces[i]
+            max_idx = i
+        if stresses[i] > uts:
+            uts = stresses[i]
+        sp = strains[i] * 100.0
+        if sp >= 0.05 and sp <= 0.25:
+            n_window += 1
+    strain_at_uts = strains[max_idx] * 100.0
+    
+    # Linear region: the standard window, else the first 20% of the data
+    use_window = n_window >= 5
+    n_fit = n_window
+    if not use_window:
+        n_fit = n // 5
+        if n_fit < 5:
+            n_fit = min(20, n)
+    
+    youngs_modulus = 0.0
+    r_squared = 0.0
+    secant_modulus = 0.0
+    if n_fit >= 3:
+        sx = 0.0
+        sy = 0.0
+        sxx = 0.0
+        sxy = 0.0
+        syy = 0.0
+        for i in range(n):
+            sp = strains[i] * 100.0
+            if (sp >= 0.05 and sp <= 0.25) if use_window else i < n_fit:
+                y = float(stresses[i])
+                sx += sp
+                sy += y
+                sxx += sp * sp
+                sxy += sp * y
+                syy += y * y
+        denom = n_fit * sxx - sx * sx
+        if denom > 0.0:
+            slope = (n_fit * sxy - sx * sy) / denom
+            youngs_modulus = slope * 100.0
+            
+            # R² of a least-squares line from the same sums
+            var_x = sxx - sx * sx / n_fit
+            var_y = syy - sy * sy / n_fit
+            if var_y > 0.0:
+                r_squared = slope * slope * var_x / var_y
+        
+        # Secant modulus at the point nearest 1% strain
+        idx_1pct = 0
+        best = abs(strains[0] * 100.0 - 1.0)
+        for i in range(1, n):
+            d = abs(strains[i] * 100.0 - 1.0)
+            if d < best:
+                best = d
+                idx_1pct = i
+        sp = strains[idx_1pct] * 100.0
+        if sp > 0.0:
+            secant_modulus = stresses[idx_1pct] / (sp / 100.0)
+    
+    # Yield: first crossing of the 0.2% offset line, else 5% deviation
+    yield_strength = 0.0
+    strain_at_yield = 0.0
+    force_at_yield = 0.0
+    if youngs_modulus > 0.0:
+        k = youngs_modulus / 100.0
+        prev = stresses[0] - k * (strains[0] * 100.0 - 0.2)
+        for i in range(1, n):
+            d = stresses[i] - k * (strains[i] * 100.0 - 0.2)
+            if prev < 0.0 and d >= 0.0:
+                t = -prev / (d - prev)
+                yield_strength = stresses[i-1] + t * (stresses[i] - stresses[i-1])
+                strain_at_yield = (strains[i-1] * 100.0
+                                   + t * (strains[i] * 100.0 - strains[i-1] * 100.0))
+                ratio = yield_strength / stresses[i] if stresses[i] > 0.0 else 1.0
+                force_at_yield = max_force * ratio
+                break
+            prev = d
+        
+        if yield_strength == 0.0:
+            for i in range(n):
+                linear_stress = k * (strains[i] * 100.0)
+                if linear_stress > 0.0 and abs(stresses[i] - linear_stress) / linear_stress > 0.05:
+                    if i > 0:
+                        yield_strength = stresses[i]
+                        strain_at_yield = strains[i] * 100.0
+                    break
+    
+    # Sample nearest the yield strain
+    yield_idx = 0
+    if strain_at_yield > 0.0:
+        best = abs(strains[0] * 100.0 - strain_at_yield)
+        for i in range(1, n):
+            d = abs(strains[i] * 100.0 - strain_at_yield)
+            if d < best:
+                best = d
+                yield_idx = i
+    
+    # Trapezoid energies; the yield values are prefixes of the same sums.
+    # Force-extension work is summed in N*mm and scaled to J once.
+    energy_to_break = 0.0
+    energy_to_yield = 0.0
+    resilience = 0.0
+    for i in range(1, n):
+        energy_to_break += 0.5 * (forces[i] + forces[i-1]) * (extensions[i] - extensions[i-1])
+        if i <= yield_idx:
+            resilience += 0.5 * (stresses[i] + stresses[i-1]) * (strains[i] - strains[i-1])
+            if i == yield_idx:
+                energy_to_yield = energy_to_break * 1e-3
+    energy_to_break *= 1e-3
+    
+    extension_at_yield = extensions[yield_idx] if strain_at_yield > 0.0 else 0.0
+    
+    # Failure classification (same rules as ResultsAnalyzer.classify_failure)
+    failure_code = 0
+    if n >= 10:
+        force_drop = (max_force - forces[n-1]) / max_force if max_force > 0.0 else 0.0
+        points_after_peak = n - max_idx
+        
+        # Plateau mean and spread from one pass of running sums
+        start = int(max_idx * 0.8)
+        m = max_idx - start
+        s1 = 0.0
+        s2 = 0.0
+        for i in range(start, max_idx):
+            f = float(forces[i])
+            s1 += f
+            s2 += f * f
+        necking = False
+        if max_idx > n * 0.3 and m > 5:
+            mean = s1 / m
+            std = math.sqrt(max(s2 / m - mean * mean, 0.0))
+            necking = mean != 0.0 and std / mean < 0.05
+        
+        bits = (int(force_drop > 0.9 and points_after_peak < n * 0.1)
+                | int(force_drop > 0.5 and points_after_peak > n * 0.2) << 1
+                | int(necking) << 2
+                | int(force_drop < 0.3) << 3)
+        failure_code = _FAILURE_CODES[bits]
+    
+    return (max_idx, yield_idx, max_force, uts, strain_at_uts,
+            youngs_modulus, r_squared, secant_modulus, yield_strength,
+            strain_at_yield, force_at_yield, energy_to_break, energy_to_yield,
+            resilience, extension_at_yield, failure_code)
+
+
+if HAS_NUMBA:
+    _analyze_numba = njit(cache=True, fastmath=True)(_analyze_numba)
+    # Compile now rather than on the first results display
+    _warmup = np.linspace(0.0, 0.01, 32, dtype=TEST_DATA_DTYPE)
+    _analyze_numba(_warmup * 1000.0, _warmup * 50.0, _warmup * 2000.0, _warmup)
+    del _warmup
 
 
 class ResultsAnalyzer:
@@ -50,221 +370,309 @@ class ResultsAnalyzer:
     
     def __init__(self):
         self.properties = MechanicalProperties()
+        # Sample indices of the force peak and the yield point from the last analysis
+        self._max_idx = 0
+        self._yield_idx = 0
+        self.failure_type = FailureType.UNKNOWN
+        # Work arrays for the numpy path, kept across analyze() calls
+        self._scratch = {}
+    
+    def _buffer(self, name: str, n: int, dtype) -> np.ndarray:
+        """Return a length-n scratch array, reallocated only when too small."""
+        buf = self._scratch.get(name)
+        if buf is None or len(buf) < n or buf.dtype != dtype:
+            buf = np.empty(n, dtype=dtype)
+            self._scratch[name] = buf
+        return buf[:n]
+    
+    def _nearest(self, values: np.ndarray, target: float) -> int:
+        """Index of the value closest to target."""
+        dist = self._buffer('dist', len(values), values.dtype)
+        np.subtract(values, target, out=dist)
+        return int(np.argmin(np.abs(dist, out=dist)))
     
     def analyze(self, data: TestData, config: TestConfiguration) -> MechanicalProperties:
         """Perform complete analysis of test data."""
-        self.properties = MechanicalProperties()
+        self._max_idx = 0
+        self._yield_idx = 0
+        self.failure_type = FailureType.UNKNOWN
         
-        if not data.forces or len(data.forces) < 5:
+        if len(data.forces) < 5:
+            self.properties = MechanicalProperties()
             return self.properties
         
-        forces = np.array(data.forces)
-        extensions = np.array(data.extensions)
-        stresses = np.array(data.stresses)
-        strains = np.array(data.strains)
-        
-        # Maximum values
-        self._calculate_max_values(forces, extensions, stresses, strains)
-        
-        # Young's Modulus
-        self._calculate_modulus(stresses, strains)
-        
-        # Yield strength (0.2% offset)
-        self._calculate_yield(stresses, strains)
-        
-        # Energy calculations
-        self._calculate_energy(forces, extensions, stresses, strains)
-        
-        # Break values
-        self._calculate_break_values(forces, extensions, stresses, strains)
+        forces = data.forces
+        extensions = data.extensions
+        stresses = data.stresses
+        strains = data.strains
         
         # True stress/strain if available
-        if data.true_stresses:
-            self._calculate_true_values(data.true_stresses, data.true_strains)
+        true_stress_at_uts, true_strain_at_break = self._calculate_true_values(
+            data.true_stresses, data.true_strains)
+        
+        if HAS_NUMBA:
+            (self._max_idx, self._yield_idx, max_force, uts, strain_at_uts,
+             youngs_modulus, r_squared, secant_modulus, yield_strength,
+             strain_at_yield, force_at_yield, energy_to_break, energy_to_yield,
+             resilience, extension_at_yield,
+             failure_code) = _analyze_numba(forces, extensions, stresses, strains)
+            self.failure_type = _FAILURE_TYPES[failure_code]
+            strain_at_break = float(strains[-1] * 100.0)
+        else:
+            # Shared by every calculation below
+            strain_pct = np.multiply(strains, 100.0,
+                                     out=self._buffer('strain_pct', len(strains), strains.dtype))
+            self._max_idx = int(np.argmax(forces))
+            
+            # Maximum values
+            max_force, uts, strain_at_uts = self._calculate_max_values(
+                forces, stresses, strain_pct, self._max_idx)
+            
+            # Young's Modulus
+            youngs_modulus, r_squared, secant_modulus = self._calculate_modulus(
+                stresses, strain_pct)
+            
+            # Yield strength (0.2% offset)
+            yield_strength, strain_at_yield, force_at_yield = self._calculate_yield(
+                stresses, strain_pct, youngs_modulus, max_force)
+            
+            # Energy calculations
+            energy_to_break, energy_to_yield, resilience = self._calculate_energy(
+                forces, extensions, stresses, strains)
+            
+            # Extension at yield
+            extension_at_yield = float(extensions[self._yield_idx]) if strain_at_yield > 0 else 0.0
+            strain_at_break = float(strain_pct[-1])
+            
+            # Failure classification
+            self.failure_type = self.classify_failure(forces, stresses, self._max_idx)
         
+        # Break values: assume last point is break point
+        self.properties = MechanicalProperties(
+            ultimate_tensile_strength=float(uts),
+            yield_strength_offset=float(yield_strength),
+            break_stress=float(stresses[-1]),
+            max_force=float(max_force),
+            force_at_yield=float(force_at_yield),
+            force_at_break=float(forces[-1]),
+            youngs_modulus=float(youngs_modulus),
+            secant_modulus=float(secant_modulus),
+            modulus_r_squared=float(r_squared),
+            strain_at_yield=float(strain_at_yield),
+            strain_at_break=strain_at_break,
+            strain_at_uts=float(strain_at_uts),
+            extension_at_break=float(extensions[-1]),
+            extension_at_yield=float(extension_at_yield),
+            energy_to_yield=float(energy_to_yield),
+            energy_to_break=float(energy_to_break),
+            resilience=float(resilience),
+            true_stress_at_uts=true_stress_at_uts,
+            true_strain_at_break=true_strain_at_break,
+        )
         return self.properties
     
-    def _calculate_max_values(self, forces, extensions, stresses, strains):
-        """Calculate maximum values."""
-        max_idx = np.argmax(forces)
-        
-        self.properties.max_force = float(np.max(forces))
-        self.properties.ultimate_tensile_strength = float(np.max(stresses))
-        self.properties.strain_at_uts = float(strains[max_idx] * 100)  # Convert to %
+    def _calculate_max_values(self, forces, stresses, strain_pct, max_idx):
+        """Calculate maximum values: (max_force, UTS, strain at UTS)."""
+        return (float(forces[max_idx]), float(np.max(stresses)),
+                float(strain_pct[max_idx]))
     
-    def _calculate_modulus(self, stresses, strains):
-        """Calculate Young's modulus from linear region."""
-        # Find linear region (typically 0.05% to 0.25% strain)
-        strain_pct = strains * 100
+    def _calculate_modulus(self, stresses, strain_pct):
+        """
+        Calculate Young's modulus from linear region.
+        
+        Returns (youngs_modulus, r_squared, secant_modulus).
+        """
+        youngs_modulus = 0.0
+        r_squared = 0.0
+        secant_modulus = 0.0
         
-        # Find indices in linear region
-        linear_mask = (strain_pct >= 0.05) & (strain_pct <= 0.25)
+        # Find linear region (typically 0.05% to 0.25% strain); a mask rather
+        # than a slice, since measured strain need not be monotonic
+        n_all = len(strain_pct)
+        in_window = np.greater_equal(strain_pct, 0.05, out=self._buffer('mask', n_all, np.bool_))
+        in_window &= np.less_equal(strain_pct, 0.25, out=self._buffer('mask2', n_all, np.bool_))
         
-        # If not enough points in standard range, use first 20% of data
-        if np.sum(linear_mask) < 5:
-            n_points = len(strains) // 5
+        if np.count_nonzero(in_window) >= 5:
+            lin_strains = strain_pct[in_window].astype(np.float64)
+            lin_stresses = stresses[in_window].astype(np.float64)
+        else:
+            # If not enough points in standard range, use first 20% of data
+            n_points = n_all // 5
             if n_points < 5:
-                n_points = min(20, len(strains))
-            linear_mask = np.zeros(len(strains), dtype=bool)
-            linear_mask[:n_points] = True
+                n_points = min(20, n_all)
+            lin_strains = strain_pct[:n_points].astype(np.float64)
+            lin_stresses = stresses[:n_points].astype(np.float64)
         
-        if np.sum(linear_mask) >= 3:
-            lin_strains = strain_pct[linear_mask]
-            lin_stresses = stresses[linear_mask]
-            
-            # Linear regression
-            coeffs = np.polyfit(lin_strains, lin_stresses, 1)
-            
-            # Young's modulus is slope (MPa/%)
-            # Convert to MPa by multiplying by 100 (since strain was in %)
-            self.properties.youngs_modulus = float(coeffs[0] * 100)
-            
-            # R-squared
-            predicted = np.polyval(coeffs, lin_strains)
-            ss_res = np.sum((lin_stresses - predicted) ** 2)
-            ss_tot = np.sum((lin_stresses - np.mean(lin_stresses)) ** 2)
-            if ss_tot > 0:
-                self.properties.modulus_r_squared = float(1 - ss_res / ss_tot)
+        if lin_strains.size >= 3:
+            # Linear regression (closed-form least squares)
+            n = lin_strains.size
+            sx = lin_strains.sum()
+            sy = lin_stresses.sum()
+            sxx = np.dot(lin_strains, lin_strains)
+            sxy = np.dot(lin_strains, lin_stresses)
+            syy = np.dot(lin_stresses, lin_stresses)
+            denom = n * sxx - sx * sx
+            if denom > 0:
+                slope = (n * sxy - sx * sy) / denom
+                
+                # Young's modulus is slope (MPa/%)
+                # Convert to MPa by multiplying by 100 (since strain was in %)
+                youngs_modulus = float(slope * 100)
+                
+                # R-squared of a least-squares line: slope² * var(x) / var(y)
+                var_x = sxx - sx * sx / n
+                var_y = syy - sy * sy / n
+                if var_y > 0:
+                    r_squared = float(slope * slope * var_x / var_y)
             
             # Secant modulus (stress at 1% strain / 0.01)
             if len(strain_pct) > 0:
-                idx_1pct = np.argmin(np.abs(strain_pct - 1.0))
+                idx_1pct = self._nearest(strain_pct, 1.0)
                 if strain_pct[idx_1pct] > 0:
-                    self.properties.secant_modulus = float(stresses[idx_1pct] / (strain_pct[idx_1pct] / 100))
+                    secant_modulus = float(stresses[idx_1pct] / (strain_pct[idx_1pct] / 100))
+        
+        return youngs_modulus, r_squared, secant_modulus
     
-    def _calculate_yield(self, stresses, strains):
-        """Calculate yield strength using 0.2% offset method."""
-        strain_pct = strains * 100
+    def _calculate_yield(self, stresses, strain_pct, E, max_force):
+        """
+        Calculate yield strength using 0.2% offset method.
         
-        if self.properties.youngs_modulus > 0:
+        Returns (yield_strength, strain_at_yield, force_at_yield) and
+        records the sample nearest the yield strain in _yield_idx.
+        """
+        yield_strength = 0.0
+        strain_at_yield = 0.0
+        force_at_yield = 0.0
+        
+        if E > 0:
             # Offset line: stress = E * (strain - 0.2)
             offset_strain = 0.2  # %
-            E = self.properties.youngs_modulus
+            
+            n = len(strain_pct)
             
             # Find intersection with stress-strain curve
-            offset_line = E * (strain_pct - offset_strain) / 100
+            diff = self._buffer('diff', n, strain_pct.dtype)
+            np.subtract(strain_pct, offset_strain, out=diff)
+            np.multiply(diff, E / 100.0, out=diff)
             
             # Find where stress-strain curve crosses offset line
-            diff = stresses - offset_line
-            
-            # Look for sign change (crossing point)
-            for i in range(1, len(diff)):
-                if diff[i-1] < 0 and diff[i] >= 0:
-                    # Linear interpolation to find exact crossing
-                    t = -diff[i-1] / (diff[i] - diff[i-1])
-                    yield_stress = stresses[i-1] + t * (stresses[i] - stresses[i-1])
-                    yield_strain = strain_pct[i-1] + t * (strain_pct[i] - strain_pct[i-1])
-                    
-                    self.properties.yield_strength_offset = float(yield_stress)
-                    self.properties.strain_at_yield = float(yield_strain)
-                    
-                    # Find corresponding force
-                    if i < len(stresses):
-                        # Approximate from stress ratio
-                        ratio = yield_stress / stresses[i] if stresses[i] > 0 else 1
-                        self.properties.force_at_yield = float(self.properties.max_force * ratio)
-                    
-                    break
+            np.subtract(stresses, diff, out=diff)
+            
+            # Look for the first sign change (crossing point)
+            sign_change = np.less(diff[:-1], 0, out=self._buffer('mask', n - 1, np.bool_))
+            sign_change &= np.greater_equal(diff[1:], 0, out=self._buffer('mask2', n - 1, np.bool_))
+            if sign_change.any():
+                i = int(np.argmax(sign_change)) + 1
+                
+                # Linear interpolation to find exact crossing
+                t = -diff[i-1] / (diff[i] - diff[i-1])
+                yield_stress = stresses[i-1] + t * (stresses[i] - stresses[i-1])
+                yield_strain = strain_pct[i-1] + t * (strain_pct[i] - strain_pct[i-1])
+                
+                yield_strength = float(yield_stress)
+                strain_at_yield = float(yield_strain)
+                
+                # Find corresponding force (approximate from stress ratio)
+                ratio = yield_stress / stresses[i] if stresses[i] > 0 else 1
+                force_at_yield = float(max_force * ratio)
             
             # If no crossing found, use alternative method (first significant deviation)
-            if self.properties.yield_strength_offset == 0:
+            if yield_strength == 0:
                 # Find where stress deviates >5% from linear
-                linear_stress = E * strain_pct / 100
-                deviation = np.abs(stresses - linear_stress) / (linear_stress + 0.001)
+                # (points with no linear stress yet cannot deviate)
+                linear_stress = np.multiply(strain_pct, E / 100.0,
+                                            out=self._buffer('linear_stress', n, strain_pct.dtype))
+                loaded = np.greater(linear_stress, 0, out=self._buffer('mask', n, np.bool_))
+                deviation = np.subtract(stresses, linear_stress, out=diff)
+                np.abs(deviation, out=deviation)
+                np.divide(deviation, linear_stress, out=deviation, where=loaded)
                 
-                yield_idx = np.argmax(deviation > 0.05)
+                deviated = np.greater(deviation, 0.05, out=self._buffer('mask2', n, np.bool_))
+                deviated &= loaded
+                yield_idx = np.argmax(deviated)
                 if yield_idx > 0:
-                    self.properties.yield_strength_offset = float(stresses[yield_idx])
-                    self.properties.strain_at_yield = float(strain_pct[yield_idx])
+                    yield_strength = float(stresses[yield_idx])
+                    strain_at_yield = float(strain_pct[yield_idx])
+        
+        # Sample nearest the yield strain, shared by the energy and break values
+        if strain_at_yield > 0:
+            self._yield_idx = self._nearest(strain_pct, strain_at_yield)
+        
+        return yield_strength, strain_at_yield, force_at_yield
     
     def _calculate_energy(self, forces, extensions, stresses, strains):
-        """Calculate energy values."""
+        """Calculate energy values: (energy_to_break, energy_to_yield, resilience)."""
         # Energy to break (area under force-extension curve in Joules)
-        # Force in N, extension in mm -> need to convert mm to m
-        if len(forces) >= 2:
-            ext_m = extensions / 1000.0  # mm to m
-            self.properties.energy_to_break = float(np.trapz(forces, ext_m))
-        
-        # Energy to yield
-        if self.properties.strain_at_yield > 0:
-            strain_pct = strains * 100
-            yield_idx = np.argmin(np.abs(strain_pct - self.properties.strain_at_yield))
-            if yield_idx > 0:
-                ext_m = extensions[:yield_idx+1] / 1000.0
-                self.properties.energy_to_yield = float(np.trapz(forces[:yield_idx+1], ext_m))
-        
-        # Resilience (energy per unit volume up to yield point)
-        # This is area under stress-strain curve to yield point
-        if self.properties.strain_at_yield > 0:
-            strain_pct = strains * 100
-            yield_idx = np.argmin(np.abs(strain_pct - self.properties.strain_at_yield))
-            if yield_idx > 0:
-                # Strain as ratio (not %), stress in MPa
-                self.properties.resilience = float(np.trapz(
-                    stresses[:yield_idx+1], 
-                    strains[:yield_idx+1]
-                ))
-    
-    def _calculate_break_values(self, forces, extensions, stresses, strains):
-        """Calculate values at break."""
-        # Assume last point is break point
-        self.properties.force_at_break = float(forces[-1])
-        self.properties.break_stress = float(stresses[-1])
-        self.properties.extension_at_break = float(extensions[-1])
-        self.properties.strain_at_break = float(strains[-1] * 100)  # Convert to %
-        
-        # Find extension at yield
-        if self.properties.strain_at_yield > 0:
-            strain_pct = strains * 100
-            yield_idx = np.argmin(np.abs(strain_pct - self.properties.strain_at_yield))
-            self.properties.extension_at_yield = float(extensions[yield_idx])
+        # Force in N, extension in mm -> integrate in N*mm, then scale to J
+        # Cumulative trapezoid sums, so the yield energy is a prefix of the same pass
+        n = len(forces) - 1
+        work = np.add(forces[1:], forces[:-1], out=self._buffer('pair_sum', n, forces.dtype))
+        work *= np.subtract(extensions[1:], extensions[:-1],
+                            out=self._buffer('dx', n, extensions.dtype))
+        cum_fe = np.cumsum(work, dtype=np.float64, out=self._buffer('cum_fe', n, np.float64))
+        cum_fe *= 0.5
+        energy_to_break = float(cum_fe[-1]) * 1e-3
+        energy_to_yield = 0.0
+        resilience = 0.0
+        
+        yield_idx = self._yield_idx
+        if yield_idx > 0:
+            # Energy to yield
+            energy_to_yield = float(cum_fe[yield_idx-1]) * 1e-3
+            
+            # Resilience (energy per unit volume up to yield point)
+            # This is area under stress-strain curve to yield point
+            # Strain as ratio (not %), stress in MPa
+            resilience = _trapz(stresses[:yield_idx+1], strains[:yield_idx+1])
+        
+        return energy_to_break, energy_to_yield, resilience
     
     def _calculate_true_values(self, true_stresses, true_strains):
-        """Calculate true stress/strain values."""
-        if true_stresses and len(true_stresses) > 0:
+        """Calculate true stress/strain values: (true stress at UTS, true strain at break)."""
+        if len(true_stresses) > 0:
             max_idx = np.argmax(true_stresses)
-            self.properties.true_stress_at_uts = float(true_stresses[max_idx])
-            self.properties.true_strain_at_break = float(true_strains[-1])
+            return float(true_stresses[max_idx]), float(true_strains[-1])
+        return 0.0, 0.0
     
     @staticmethod
-    def classify_failure(forces: List[float], stresses: List[float]) -> FailureType:
-        """Classify failure type based on curve characteristics."""
-        if not forces or len(forces) < 10:
-            return FailureType.UNKNOWN
+    def classify_failure(forces: np.ndarray, stresses: np.ndarray, max_idx: int) -> FailureType:
+        """
+        Classify failure type based on curve characteristics.
         
-        forces = np.array(forces)
-        stresses = np.array(stresses)
+        max_idx is the force peak index already found by analyze().
+        """
+        if len(forces) < 10:
+            return FailureType.UNKNOWN
         
-        max_idx = np.argmax(forces)
         max_force = forces[max_idx]
         final_force = forces[-1]
+        n = len(forces)
         
         # Calculate strain at failure indicators
         force_drop = (max_force - final_force) / max_force if max_force > 0 else 0
-        points_after_peak = len(forces) - max_idx
-        
-        # Brittle: sudden drop, little plastic deformation
-        if force_drop > 0.9 and points_after_peak < len(forces) * 0.1:
-            return FailureType.BRITTLE
-        
-        # Ductile: gradual drop, significant plastic deformation
-        if force_drop > 0.5 and points_after_peak > len(forces) * 0.2:
-            return FailureType.DUCTILE
+        points_after_peak = n - max_idx
         
         # Necking: visible plateau before drop
-        if max_idx > len(forces) * 0.3:
+        necking = False
+        if max_idx > n * 0.3:
             # Look for plateau region
             plateau_region = forces[int(max_idx*0.8):max_idx]
-            if len(plateau_region) > 5:
-                variation = np.std(plateau_region) / np.mean(plateau_region)
-                if variation < 0.05:  # Less than 5% variation
-                    return FailureType.NECKING
-        
-        # No clear break
-        if force_drop < 0.3:
-            return FailureType.NO_BREAK
+            m = len(plateau_region)
+            if m > 5:
+                # Mean and spread from one pass of running sums
+                mean = plateau_region.sum(dtype=np.float64) / m
+                mean_sq = np.einsum('i,i->', plateau_region, plateau_region, dtype=np.float64) / m
+                std = math.sqrt(max(mean_sq - mean * mean, 0.0))
+                necking = mean != 0 and std / mean < 0.05  # Less than 5% variation
         
-        return FailureType.DUCTILE
+        # Brittle: sudden drop, little plastic deformation
+        # Ductile: gradual drop, significant plastic deformation
+        # No clear break: small force drop
+        bits = (int(force_drop > 0.9 and points_after_peak < n * 0.1)
+                | int(force_drop > 0.5 and points_after_peak > n * 0.2) << 1
+                | int(necking) << 2
+                | int(force_drop < 0.3) << 3)
+        return _FAILURE_TYPES[_FAILURE_CODES[bits]]
 
 
 class ResultsWindow:
@@ -277,32 +685,41 @@ class ResultsWindow:
         self.config: Optional[TestConfiguration] = None
         self.test_data: Optional[TestData] = None
         self.on_export: Optional[Callable] = None
+        # Export button callbacks with the format bound in
+        self._export_csv_cb = partial(self._export, "csv")
+        self._export_excel_cb = partial(self._export, "excel")
+        self._export_pdf_cb = partial(self._export, "pdf")
+        # Failure characteristics are filled in when their tab is first viewed
+        self._failure_characteristics_ready = False
+        # Compliance item ids (min, max, actual, status, attr, format) per criterion
+        self._criteria: list = []
+        self._overall_status = 0
     
     def show(self, data: TestData, config: TestConfiguration):
         """Show results window with analyzed data."""
         self.test_data = data
         self.config = config
         
-        # Debug
-        print(f"[ResultsWindow] Data points: {len(data.forces) if data.forces else 0}")
-        print(f"[ResultsWindow] Forces: {data.forces[:5] if data.forces else 'empty'}...")
-        print(f"[ResultsWindow] Stresses: {data.stresses[:5] if data.stresses else 'empty'}...")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Data points: %d", len(data.forces))
+            logger.debug("Forces: %s...", data.forces[:5])
+            logger.debug("Stresses: %s...", data.stresses[:5])
         
         # Analyze data
         self.properties = self.analyzer.analyze(data, config)
         
-        # Debug properties
-        print(f"[ResultsWindow] UTS: {self.properties.ultimate_tensile_strength}")
-        print(f"[ResultsWindow] Modulus: {self.properties.youngs_modulus}")
-        print(f"[ResultsWindow] Max Force: {self.properties.max_force}")
+        if debug:
+            logger.debug("UTS: %s", self.properties.ultimate_tensile_strength)
+            logger.debug("Modulus: %s", self.properties.youngs_modulus)
+            logger.debug("Max Force: %s", self.properties.max_force)
         
-        # Classify failure
-        failure_type = ResultsAnalyzer.classify_failure(data.forces, data.stresses)
+        # The window is built once and only its values change between tests
+        if not dpg.does_item_exist(self.window_tag):
+            self._create_window()
         
-        if dpg.does_item_exist(self.window_tag):
-            dpg.delete_item(self.window_tag)
-        
-        self._create_window(failure_type, data)
+        # Failure classification comes from the same analysis pass
+        self._update_window(self.analyzer.failure_type, data)
         dpg.show_item(self.window_tag)
     
     def hide(self):
@@ -310,8 +727,8 @@ class ResultsWindow:
         if dpg.does_item_exist(self.window_tag):
             dpg.hide_item(self.window_tag)
     
-    def _create_window(self, failure_type: FailureType, data: TestData):
-        """Create the results window."""
+    def _create_window(self):
+        """Create the results window (values are filled in by _update_window)."""
         with dpg.window(
             label="Test Results - Mechanical Properties",
             tag=self.window_tag,
@@ -323,11 +740,11 @@ class ResultsWindow:
             pos=(137, 0)
         ):
             # Tab bar for different views
-            with dpg.tab_bar():
+            with dpg.tab_bar(tag="results_tab_bar", callback=self._on_tab_changed):
                 self._create_properties_tab()
-                self._create_failure_tab(failure_type)
+                self._create_failure_tab()
                 self._create_compliance_tab()
-                self._create_summary_tab(data)
+                self._create_summary_tab()
             
             dpg.add_spacer(height=10)
             dpg.add_separator()
@@ -335,107 +752,123 @@ class ResultsWindow:
             
             # Buttons
             with dpg.group(horizontal=True):
-                dpg.add_button(label="Export CSV", width=100, callback=self._on_export_csv)
-                dpg.add_button(label="Export Excel", width=100, callback=self._on_export_excel)
-                dpg.add_button(label="Export PDF", width=100, callback=self._on_export_pdf)
+                dpg.add_button(label="Export CSV", width=100, callback=self._export_csv_cb)
+                dpg.add_button(label="Export Excel", width=100, callback=self._export_excel_cb)
+                dpg.add_button(label="Export PDF", width=100, callback=self._export_pdf_cb)
                 dpg.add_spacer(width=100)
                 dpg.add_button(label="Close", width=100, callback=self.hide)
     
+    def _update_window(self, failure_type: FailureType, data: TestData):
+        """Write the current results into the existing window items."""
+        set_value = dpg.set_value
+        p = self.properties
+        
+        # Properties tab
+        for attr, tag, spec in PROPERTY_VALUE_TAGS:
+            set_value(tag, format(getattr(p, attr), spec))
+        
+        # Failure tab (operator input starts fresh for every test)
+        set_value("result_failure_type", failure_type.value)
+        set_value("result_break_location", BreakLocation.UNKNOWN.value)
+        set_value("result_operator_notes", "")
+        
+        dpg.configure_item("result_failure_characteristics", show=len(data.forces) > 0)
+        self._failure_characteristics_ready = False
+        if dpg.get_value("results_tab_bar") == dpg.get_alias_id("results_failure_tab"):
+            self._update_failure_characteristics()
+        
+        # Compliance tab: actual values, statuses back to unevaluated
+        for _, _, actual, status, attr, spec in self._criteria:
+            set_value(actual, format(getattr(p, attr), spec))
+            dpg.configure_item(status, default_value="PASS", color=COLORS['pass'])
+        dpg.configure_item(self._overall_status, default_value="PASS", color=COLORS['pass'])
+        
+        # Summary tab
+        config = self.config
+        dpg.configure_item("result_test_standard", show=bool(config))
+        for tag in ("summary_sample_row", "summary_material_row",
+                    "summary_operator_row", "summary_standard_row"):
+            dpg.configure_item(tag, show=bool(config))
+        if config:
+            metadata = config.metadata
+            set_value("result_test_standard", f"Test Standard: {metadata.test_standard.value}")
+            set_value("summary_sample_id", metadata.sample_id or "N/A")
+            set_value("summary_material", metadata.material_name or "N/A")
+            set_value("summary_operator", metadata.operator_name or "N/A")
+            set_value("summary_standard", metadata.test_standard.value)
+        
+        set_value("summary_data_points", str(len(data.forces)))
+        duration = data.times[-1] if len(data.times) else 0
+        set_value("summary_duration", f"{duration:.1f} s")
+        
+        for label, attr, spec, unit, tag in SUMMARY_RESULTS:
+            set_value(tag, f"{format(getattr(p, attr), spec)} {unit}")
+    
     def _create_properties_tab(self):
         """Create mechanical properties tab."""
+        text_dim = COLORS['text_dim']
+        accent = COLORS['accent']
+        add_text = dpg.add_text
+        
         with dpg.tab(label="Properties"):
             dpg.add_spacer(height=10)
             
-            # Strength properties
-            self._section_header("Strength Properties")
-            with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True,
-                          borders_innerV=True, borders_outerV=True):
-                dpg.add_table_column(label="Property", width_fixed=True, init_width_or_weight=200)
-                dpg.add_table_column(label="Symbol", width_fixed=True, init_width_or_weight=80)
-                dpg.add_table_column(label="Value", width_fixed=True, init_width_or_weight=120)
-                dpg.add_table_column(label="Unit", width_fixed=True, init_width_or_weight=80)
-                
-                self._property_row("Ultimate Tensile Strength", "σ_UTS", 
-                                  f"{self.properties.ultimate_tensile_strength:.2f}", "MPa")
-                self._property_row("Yield Strength (Rp0.2)", "σ_y", 
-                                  f"{self.properties.yield_strength_offset:.2f}", "MPa")
-                self._property_row("Break Stress", "σ_b", 
-                                  f"{self.properties.break_stress:.2f}", "MPa")
-                self._property_row("Maximum Force", "F_max", 
-                                  f"{self.properties.max_force:.2f}", "N")
-                self._property_row("Force at Yield", "F_y", 
-                                  f"{self.properties.force_at_yield:.2f}", "N")
-                self._property_row("Force at Break", "F_b", 
-                                  f"{self.properties.force_at_break:.2f}", "N")
-            
-            dpg.add_spacer(height=15)
-            
-            # Modulus properties
-            self._section_header("Elastic Properties")
-            with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True,
-                          borders_innerV=True, borders_outerV=True):
-                dpg.add_table_column(label="Property", width_fixed=True, init_width_or_weight=200)
-                dpg.add_table_column(label="Symbol", width_fixed=True, init_width_or_weight=80)
-                dpg.add_table_column(label="Value", width_fixed=True, init_width_or_weight=120)
-                dpg.add_table_column(label="Unit", width_fixed=True, init_width_or_weight=80)
-                
-                self._property_row("Young's Modulus", "E", 
-                                  f"{self.properties.youngs_modulus:.1f}", "MPa")
-                self._property_row("Modulus R²", "R²", 
-                                  f"{self.properties.modulus_r_squared:.4f}", "-")
-                self._property_row("Secant Modulus", "E_s", 
-                                  f"{self.properties.secant_modulus:.1f}", "MPa")
-            
-            dpg.add_spacer(height=15)
-            
-            # Strain/Extension properties
-            self._section_header("Deformation Properties")
-            with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True,
-                          borders_innerV=True, borders_outerV=True):
-                dpg.add_table_column(label="Property", width_fixed=True, init_width_or_weight=200)
-                dpg.add_table_column(label="Symbol", width_fixed=True, init_width_or_weight=80)
-                dpg.add_table_column(label="Value", width_fixed=True, init_width_or_weight=120)
-                dpg.add_table_column(label="Unit", width_fixed=True, init_width_or_weight=80)
-                
-                self._property_row("Elongation at Break", "ε_b", 
-                                  f"{self.properties.strain_at_break:.2f}", "%")
-                self._property_row("Strain at Yield", "ε_y", 
-                                  f"{self.properties.strain_at_yield:.2f}", "%")
-                self._property_row("Strain at UTS", "ε_UTS", 
-                                  f"{self.properties.strain_at_uts:.2f}", "%")
-                self._property_row("Extension at Break", "ΔL_b", 
-                                  f"{self.properties.extension_at_break:.3f}", "mm")
-                self._property_row("Extension at Yield", "ΔL_y", 
-                                  f"{self.properties.extension_at_yield:.3f}", "mm")
-            
-            dpg.add_spacer(height=15)
-            
-            # Energy properties
-            self._section_header("Energy Properties")
-            with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True,
-                          borders_innerV=True, borders_outerV=True):
-                dpg.add_table_column(label="Property", width_fixed=True, init_width_or_weight=200)
-                dpg.add_table_column(label="Symbol", width_fixed=True, init_width_or_weight=80)
-                dpg.add_table_column(label="Value", width_fixed=True, init_width_or_weight=120)
-                dpg.add_table_column(label="Unit", width_fixed=True, init_width_or_weight=80)
+            for i, (title, rows) in enumerate(PROPERTY_SECTIONS):
+                if i:
+                    dpg.add_spacer(height=15)
                 
-                self._property_row("Energy to Break", "U_b", 
-                                  f"{self.properties.energy_to_break:.4f}", "J")
-                self._property_row("Energy to Yield", "U_y", 
-                                  f"{self.properties.energy_to_yield:.4f}", "J")
-                self._property_row("Resilience", "U_r", 
-                                  f"{self.properties.resilience:.4f}", "MJ/m³")
-    
-    def _create_failure_tab(self, failure_type: FailureType):
+                self._section_header(title)
+                with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True,
+                              borders_innerV=True, borders_outerV=True):
+                    dpg.add_table_column(label="Property", width_fixed=True, init_width_or_weight=200)
+                    dpg.add_table_column(label="Symbol", width_fixed=True, init_width_or_weight=80)
+                    dpg.add_table_column(label="Value", width_fixed=True, init_width_or_weight=120)
+                    dpg.add_table_column(label="Unit", width_fixed=True, init_width_or_weight=80)
+                    
+                    for name, symbol, attr, spec, unit in rows:
+                        with dpg.table_row():
+                            add_text(name)
+                            add_text(symbol, color=text_dim)
+                            add_text("", color=accent, tag=f"prop_{attr}_value")
+                            add_text(unit, color=text_dim)
+    
+    def _on_tab_changed(self, sender, app_data):
+        """Fill in deferred tab contents when a tab is selected."""
+        if app_data == dpg.get_alias_id("results_failure_tab"):
+            self._update_failure_characteristics()
+    
+    def _update_failure_characteristics(self):
+        """Compute the failure characteristics once per test."""
+        if self._failure_characteristics_ready or self.test_data is None:
+            return
+        self._failure_characteristics_ready = True
+        
+        forces = self.test_data.forces
+        if len(forces) == 0:
+            return
+        # analyze() skips tests under 5 points and leaves _max_idx at 0
+        if len(forces) < 5:
+            max_idx = int(np.argmax(forces))
+        else:
+            max_idx = self.analyzer._max_idx
+        max_force = forces[max_idx]
+        final_force = forces[-1]
+        force_drop = (max_force - final_force) / max_force * 100 if max_force > 0 else 0
+        points_after_peak = len(forces) - max_idx
+        dpg.set_value("result_force_drop", f"{force_drop:.1f}%")
+        dpg.set_value("result_points_after_peak", f"{points_after_peak}")
+        dpg.set_value("result_peak_position", f"{max_idx * 100 / len(forces):.1f}% through test")
+    
+    def _create_failure_tab(self):
         """Create failure analysis tab."""
-        with dpg.tab(label="Failure Analysis"):
+        with dpg.tab(label="Failure Analysis", tag="results_failure_tab"):
             dpg.add_spacer(height=10)
             
             self._section_header("Failure Classification")
             
             with dpg.group(horizontal=True):
                 dpg.add_text("Failure Type:", color=COLORS['text_dim'])
-                dpg.add_text(failure_type.value, color=COLORS['accent'])
+                dpg.add_text("", color=COLORS['accent'], tag="result_failure_type")
             
             dpg.add_spacer(height=10)
             
@@ -452,30 +885,22 @@ class ResultsWindow:
             
             self._section_header("Failure Characteristics")
             
-            # Calculate characteristics
-            if self.test_data and self.test_data.forces:
-                forces = np.array(self.test_data.forces)
-                max_idx = np.argmax(forces)
-                max_force = forces[max_idx]
-                final_force = forces[-1]
-                force_drop = (max_force - final_force) / max_force * 100 if max_force > 0 else 0
-                points_after_peak = len(forces) - max_idx
+            with dpg.table(header_row=False, borders_innerV=False,
+                           tag="result_failure_characteristics"):
+                dpg.add_table_column(width_fixed=True, init_width_or_weight=200)
+                dpg.add_table_column()
                 
-                with dpg.table(header_row=False, borders_innerV=False):
-                    dpg.add_table_column(width_fixed=True, init_width_or_weight=200)
-                    dpg.add_table_column()
-                    
-                    with dpg.table_row():
-                        dpg.add_text("Force drop at break:", color=COLORS['text_dim'])
-                        dpg.add_text(f"{force_drop:.1f}%", color=COLORS['accent'])
-                    
-                    with dpg.table_row():
-                        dpg.add_text("Points after peak:", color=COLORS['text_dim'])
-                        dpg.add_text(f"{points_after_peak}", color=COLORS['accent'])
-                    
-                    with dpg.table_row():
-                        dpg.add_text("Peak position:", color=COLORS['text_dim'])
-                        dpg.add_text(f"{max_idx * 100 / len(forces):.1f}% through test", color=COLORS['accent'])
+                with dpg.table_row():
+                    dpg.add_text("Force drop at break:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="result_force_drop")
+                
+                with dpg.table_row():
+                    dpg.add_text("Points after peak:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="result_points_after_peak")
+                
+                with dpg.table_row():
+                    dpg.add_text("Peak position:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="result_peak_position")
             
             dpg.add_spacer(height=15)
             
@@ -494,7 +919,7 @@ class ResultsWindow:
             
             self._section_header("Pass/Fail Criteria")
             
-            # Editable criteria
+            # Editable criteria (limits are kept between tests)
             with dpg.table(header_row=True, borders_innerH=True, borders_outerH=True,
                           borders_innerV=True, borders_outerV=True):
                 dpg.add_table_column(label="Property", width_fixed=True, init_width_or_weight=180)
@@ -503,29 +928,21 @@ class ResultsWindow:
                 dpg.add_table_column(label="Max", width_fixed=True, init_width_or_weight=100)
                 dpg.add_table_column(label="Status", width_fixed=True, init_width_or_weight=80)
                 
-                # UTS criteria
-                with dpg.table_row():
-                    dpg.add_text("UTS (MPa)")
-                    dpg.add_input_float(default_value=0, width=80, tag="crit_uts_min", step=0)
-                    dpg.add_text(f"{self.properties.ultimate_tensile_strength:.2f}", color=COLORS['accent'])
-                    dpg.add_input_float(default_value=999, width=80, tag="crit_uts_max", step=0)
-                    dpg.add_text("PASS", color=COLORS['pass'], tag="crit_uts_status")
-                
-                # Elongation criteria
-                with dpg.table_row():
-                    dpg.add_text("Elongation (%)")
-                    dpg.add_input_float(default_value=0, width=80, tag="crit_elong_min", step=0)
-                    dpg.add_text(f"{self.properties.strain_at_break:.2f}", color=COLORS['accent'])
-                    dpg.add_input_float(default_value=999, width=80, tag="crit_elong_max", step=0)
-                    dpg.add_text("PASS", color=COLORS['pass'], tag="crit_elong_status")
-                
-                # Modulus criteria
-                with dpg.table_row():
-                    dpg.add_text("Young's Modulus (MPa)")
-                    dpg.add_input_float(default_value=0, width=80, tag="crit_mod_min", step=0)
-                    dpg.add_text(f"{self.properties.youngs_modulus:.1f}", color=COLORS['accent'])
-                    dpg.add_input_float(default_value=99999, width=80, tag="crit_mod_max", step=0)
-                    dpg.add_text("PASS", color=COLORS['pass'], tag="crit_mod_status")
+                # Item ids are cached so evaluation skips the tag lookups
+                alias_id = dpg.get_alias_id
+                self._criteria = []
+                for label, key, attr, spec, max_default in COMPLIANCE_CRITERIA:
+                    with dpg.table_row():
+                        dpg.add_text(label)
+                        dpg.add_input_float(default_value=0, width=80, tag=f"crit_{key}_min", step=0)
+                        dpg.add_text("", color=COLORS['accent'], tag=f"crit_{key}_actual")
+                        dpg.add_input_float(default_value=max_default, width=80,
+                                            tag=f"crit_{key}_max", step=0)
+                        dpg.add_text("PASS", color=COLORS['pass'], tag=f"crit_{key}_status")
+                    self._criteria.append((
+                        alias_id(f"crit_{key}_min"), alias_id(f"crit_{key}_max"),
+                        alias_id(f"crit_{key}_actual"), alias_id(f"crit_{key}_status"),
+                        attr, spec))
             
             dpg.add_spacer(height=10)
             dpg.add_button(label="Evaluate Criteria", callback=self._evaluate_criteria)
@@ -536,18 +953,17 @@ class ResultsWindow:
             with dpg.group(horizontal=True):
                 dpg.add_text("Overall Status:", color=COLORS['text_dim'])
                 dpg.add_text("PASS", color=COLORS['pass'], tag="overall_pass_fail")
+            self._overall_status = dpg.get_alias_id("overall_pass_fail")
             
             dpg.add_spacer(height=15)
             
             self._section_header("Standard Compliance")
-            if self.config:
-                dpg.add_text(f"Test Standard: {self.config.metadata.test_standard.value}", 
-                            color=COLORS['text_dim'])
+            dpg.add_text("", color=COLORS['text_dim'], tag="result_test_standard")
             dpg.add_text("Note: Compliance with specific standards requires", color=COLORS['text_dim'])
             dpg.add_text("verification of specimen geometry, test speed, and", color=COLORS['text_dim'])
             dpg.add_text("environmental conditions per standard requirements.", color=COLORS['text_dim'])
     
-    def _create_summary_tab(self, data: TestData):
+    def _create_summary_tab(self):
         """Create summary tab."""
         with dpg.tab(label="Summary"):
             dpg.add_spacer(height=10)
@@ -558,31 +974,30 @@ class ResultsWindow:
                 dpg.add_table_column(width_fixed=True, init_width_or_weight=150)
                 dpg.add_table_column()
                 
-                if self.config:
-                    with dpg.table_row():
-                        dpg.add_text("Sample ID:", color=COLORS['text_dim'])
-                        dpg.add_text(self.config.metadata.sample_id or "N/A", color=COLORS['accent'])
-                    
-                    with dpg.table_row():
-                        dpg.add_text("Material:", color=COLORS['text_dim'])
-                        dpg.add_text(self.config.metadata.material_name or "N/A", color=COLORS['accent'])
-                    
-                    with dpg.table_row():
-                        dpg.add_text("Operator:", color=COLORS['text_dim'])
-                        dpg.add_text(self.config.metadata.operator_name or "N/A", color=COLORS['accent'])
-                    
-                    with dpg.table_row():
-                        dpg.add_text("Standard:", color=COLORS['text_dim'])
-                        dpg.add_text(self.config.metadata.test_standard.value, color=COLORS['accent'])
+                # Metadata rows are hidden when there is no configuration
+                with dpg.table_row(tag="summary_sample_row"):
+                    dpg.add_text("Sample ID:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="summary_sample_id")
+                
+                with dpg.table_row(tag="summary_material_row"):
+                    dpg.add_text("Material:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="summary_material")
+                
+                with dpg.table_row(tag="summary_operator_row"):
+                    dpg.add_text("Operator:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="summary_operator")
+                
+                with dpg.table_row(tag="summary_standard_row"):
+                    dpg.add_text("Standard:", color=COLORS['text_dim'])
+                    dpg.add_text("", color=COLORS['accent'], tag="summary_standard")
                 
                 with dpg.table_row():
                     dpg.add_text("Data Points:", color=COLORS['text_dim'])
-                    dpg.add_text(str(len(data.forces)), color=COLORS['accent'])
+                    dpg.add_text("", color=COLORS['accent'], tag="summary_data_points")
                 
                 with dpg.table_row():
                     dpg.add_text("Test Duration:", color=COLORS['text_dim'])
-                    duration = data.times[-1] if data.times else 0
-                    dpg.add_text(f"{duration:.1f} s", color=COLORS['accent'])
+                    dpg.add_text("", color=COLORS['accent'], tag="summary_duration")
             
             dpg.add_spacer(height=15)
             
@@ -592,19 +1007,10 @@ class ResultsWindow:
                 dpg.add_table_column(width_fixed=True, init_width_or_weight=200)
                 dpg.add_table_column()
                 
-                results = [
-                    ("Ultimate Tensile Strength", f"{self.properties.ultimate_tensile_strength:.2f} MPa"),
-                    ("Yield Strength (Rp0.2)", f"{self.properties.yield_strength_offset:.2f} MPa"),
-                    ("Young's Modulus", f"{self.properties.youngs_modulus:.1f} MPa"),
-                    ("Elongation at Break", f"{self.properties.strain_at_break:.2f} %"),
-                    ("Maximum Force", f"{self.properties.max_force:.2f} N"),
-                    ("Energy to Break", f"{self.properties.energy_to_break:.4f} J"),
-                ]
-                
-                for label, value in results:
+                for label, attr, spec, unit, tag in SUMMARY_RESULTS:
                     with dpg.table_row():
                         dpg.add_text(f"{label}:", color=COLORS['text_dim'])
-                        dpg.add_text(value, color=COLORS['accent'])
+                        dpg.add_text("", color=COLORS['accent'], tag=tag)
     
     def _section_header(self, text: str):
         """Create a section header."""
@@ -612,60 +1018,28 @@ class ResultsWindow:
         dpg.add_separator()
         dpg.add_spacer(height=5)
     
-    def _property_row(self, name: str, symbol: str, value: str, unit: str):
-        """Add a property row to a table."""
-        with dpg.table_row():
-            dpg.add_text(name)
-            dpg.add_text(symbol, color=COLORS['text_dim'])
-            dpg.add_text(value, color=COLORS['accent'])
-            dpg.add_text(unit, color=COLORS['text_dim'])
-    
     def _evaluate_criteria(self):
         """Evaluate pass/fail criteria."""
+        get_value = dpg.get_value
+        configure_item = dpg.configure_item
+        p = self.properties
         all_pass = True
         
-        # UTS
-        uts_min = dpg.get_value("crit_uts_min")
-        uts_max = dpg.get_value("crit_uts_max")
-        uts_pass = uts_min <= self.properties.ultimate_tensile_strength <= uts_max
-        dpg.set_value("crit_uts_status", "PASS" if uts_pass else "FAIL")
-        dpg.configure_item("crit_uts_status", color=COLORS['pass'] if uts_pass else COLORS['fail'])
-        all_pass = all_pass and uts_pass
-        
-        # Elongation
-        elong_min = dpg.get_value("crit_elong_min")
-        elong_max = dpg.get_value("crit_elong_max")
-        elong_pass = elong_min <= self.properties.strain_at_break <= elong_max
-        dpg.set_value("crit_elong_status", "PASS" if elong_pass else "FAIL")
-        dpg.configure_item("crit_elong_status", color=COLORS['pass'] if elong_pass else COLORS['fail'])
-        all_pass = all_pass and elong_pass
-        
-        # Modulus
-        mod_min = dpg.get_value("crit_mod_min")
-        mod_max = dpg.get_value("crit_mod_max")
-        mod_pass = mod_min <= self.properties.youngs_modulus <= mod_max
-        dpg.set_value("crit_mod_status", "PASS" if mod_pass else "FAIL")
-        dpg.configure_item("crit_mod_status", color=COLORS['pass'] if mod_pass else COLORS['fail'])
-        all_pass = all_pass and mod_pass
+        for min_id, max_id, _, status, attr, _ in self._criteria:
+            passed = get_value(min_id) <= getattr(p, attr) <= get_value(max_id)
+            configure_item(status, default_value="PASS" if passed else "FAIL",
+                           color=COLORS['pass'] if passed else COLORS['fail'])
+            all_pass = all_pass and passed
         
         # Overall
-        dpg.set_value("overall_pass_fail", "PASS" if all_pass else "FAIL")
-        dpg.configure_item("overall_pass_fail", color=COLORS['pass'] if all_pass else COLORS['fail'])
-    
-    def _on_export_csv(self):
-        """Export to CSV."""
-        if self.on_export:
-            self.on_export("csv", self.properties, self.test_data, self.config)
-    
-    def _on_export_excel(self):
-        """Export to Excel."""
-        if self.on_export:
-            self.on_export("excel", self.properties, self.test_data, self.config)
-    
-    def _on_export_pdf(self):
-        """Export to PDF."""
-        if self.on_export:
-            self.on_export("pdf", self.properties, self.test_data, self.config)
+        configure_item(self._overall_status, default_value="PASS" if all_pass else "FAIL",
+                       color=COLORS['pass'] if all_pass else COLORS['fail'])
+    
+    def _export(self, fmt: str, sender=None, app_data=None, user_data=None):
+        """Hand the results to the export handler in the given format."""
+        on_export = self.on_export
+        if on_export:
+            on_export(fmt, self.properties, self.test_data, self.config)
     
     def get_properties(self) -> MechanicalProperties:
         """Get calculated properties."""
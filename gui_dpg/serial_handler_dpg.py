@@ -6,6 +6,9 @@ Manages serial communication with the Raspberry Pi Pico.
 Uses callbacks instead of Qt signals.
 """
 
+import os
+import re
+import select
 import serial
 import serial.tools.list_ports
 import threading
@@ -13,8 +16,16 @@ import time
 from dataclasses import dataclass
 from typing import Optional, Callable, List
 
+# STATUS line as the firmware prints it: "STATUS <state> F:<force> P:<pos> R:<0|1>"
+_STATUS_RE = re.compile(rb'STATUS (\S+) F:(\S+) P:(\S+) R:(\S*)')
 
-@dataclass
+
+def _text(raw: bytes) -> str:
+    """Decode a protocol field for the callbacks (the protocol is ASCII)."""
+    return raw.decode('utf-8', errors='ignore')
+
+
+@dataclass(slots=True)
 class DataPoint:
     """Data point from tensile test."""
     timestamp: float  # ms
@@ -24,7 +35,7 @@ class DataPoint:
     strain: float     # ratio
 
 
-@dataclass
+@dataclass(slots=True)
 class Status:
     """Machine status."""
     state: str
@@ -43,7 +54,9 @@ class SerialHandler:
         self.serial: Optional[serial.Serial] = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+        # Pipe that wakes the read thread out of select() on disconnect
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
         
         # Callbacks (set these to handle events)
         self.on_connected: Optional[Callable[[], None]] = None
@@ -82,12 +95,35 @@ class SerialHandler:
                 timeout=0.1,
                 write_timeout=1.0
             )
+            
+            # Larger driver buffers ride out pauses in the read thread
+            # (only the Windows backend exposes this)
+            if hasattr(self.serial, 'set_buffer_size'):
+                self.serial.set_buffer_size(rx_size=65536, tx_size=4096)
+            
+            # USB-serial adapters on Linux batch input on a 16 ms latency
+            # timer unless ASYNC_LOW_LATENCY is set; not every port supports it
+            if hasattr(self.serial, 'set_low_latency_mode'):
+                try:
+                    self.serial.set_low_latency_mode(True)
+                except ValueError:
+                    pass
+            
             time.sleep(0.5)
             
             # Clear buffers
             self.serial.reset_input_buffer()
             self.serial.reset_output_buffer()
             
+            # On POSIX the read thread waits in select() on the port and a
+            # wake-up pipe; the Windows backend has no fileno() and keeps
+            # using the port timeout
+            try:
+                self.serial.fileno()
+                self._wake_r, self._wake_w = os.pipe()
+            except (OSError, ValueError):
+                self._wake_r = self._wake_w = None
+            
             # Start read thread
             self._running = True
             self._thread = threading.Thread(target=self._read_loop, daemon=True)
@@ -105,11 +141,18 @@ class SerialHandler:
     def disconnect(self):
         """Disconnect from serial port."""
         self._running = False
+        if self._wake_w is not None:
+            os.write(self._wake_w, b'x')
         
         if self._thread:
             self._thread.join(timeout=1.0)
             self._thread = None
         
+        if self._wake_w is not None:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+        
         if self.serial:
             try:
                 self.serial.close()
@@ -124,16 +167,28 @@ class SerialHandler:
         """Check if connected."""
         return self.serial is not None and self.serial.is_open
     
+    # Commands without arguments, encoded once
+    _COMMANDS = {name: (name + '\n').encode('ascii') for name in (
+        "START", "STOP", "PAUSE", "RESUME", "ESTOP", "HOME", "UP", "DOWN",
+        "HALT", "TARE", "STATUS", "FORCE", "POS", "ID", "RESET")}
+    
     def send_command(self, command: str) -> bool:
-        """Send command to controller."""
+        """Send command to controller (GUI thread only, see _send_raw)."""
+        return self._send_raw((command.strip() + '\n').encode('utf-8'))
+    
+    def _send_raw(self, payload: bytes) -> bool:
+        """
+        Write an encoded, newline-terminated command.
+        
+        Commands are only sent from the GUI thread and the read thread never
+        writes, so writes are not serialized with a lock.
+        """
         if not self.is_connected():
             return False
         
         try:
-            with self._lock:
-                cmd = command.strip() + '\n'
-                self.serial.write(cmd.encode('utf-8'))
-                return True
+            self.serial.write(payload)
+            return True
         except Exception as e:
             if self.on_error:
                 self.on_error(f"Send failed: {str(e)}")
@@ -141,38 +196,38 @@ class SerialHandler:
     
     # Convenience methods
     def start_test(self) -> bool:
-        return self.send_command("START")
+        return self._send_raw(self._COMMANDS["START"])
     
     def stop_test(self) -> bool:
-        return self.send_command("STOP")
+        return self._send_raw(self._COMMANDS["STOP"])
     
     def pause_test(self) -> bool:
-        return self.send_command("PAUSE")
+        return self._send_raw(self._COMMANDS["PAUSE"])
     
     def resume_test(self) -> bool:
-        return self.send_command("RESUME")
+        return self._send_raw(self._COMMANDS["RESUME"])
     
     def emergency_stop(self) -> bool:
-        return self.send_command("ESTOP")
+        return self._send_raw(self._COMMANDS["ESTOP"])
     
     def home(self) -> bool:
-        return self.send_command("HOME")
+        return self._send_raw(self._COMMANDS["HOME"])
     
     def jog_up(self, distance: float = 0) -> bool:
         if distance > 0:
             return self.send_command(f"UP {distance}")
-        return self.send_command("UP")
+        return self._send_raw(self._COMMANDS["UP"])
     
     def jog_down(self, distance: float = 0) -> bool:
         if distance > 0:
             return self.send_command(f"DOWN {distance}")
-        return self.send_command("DOWN")
+        return self._send_raw(self._COMMANDS["DOWN"])
     
     def stop_jog(self) -> bool:
-        return self.send_command("HALT")
+        return self._send_raw(self._COMMANDS["HALT"])
     
     def tare(self) -> bool:
-        return self.send_command("TARE")
+        return self._send_raw(self._COMMANDS["TARE"])
     
     def set_speed(self, speed: float) -> bool:
         return self.send_command(f"SPEED {speed}")
@@ -184,116 +239,166 @@ class SerialHandler:
         return self.send_command(f"MAXEXT {extension}")
     
     def get_status(self) -> bool:
-        return self.send_command("STATUS")
+        return self._send_raw(self._COMMANDS["STATUS"])
     
     def get_force(self) -> bool:
-        return self.send_command("FORCE")
+        return self._send_raw(self._COMMANDS["FORCE"])
     
     def get_position(self) -> bool:
-        return self.send_command("POS")
+        return self._send_raw(self._COMMANDS["POS"])
     
     def identify(self) -> bool:
-        return self.send_command("ID")
+        return self._send_raw(self._COMMANDS["ID"])
     
     def reset(self) -> bool:
-        return self.send_command("RESET")
+        return self._send_raw(self._COMMANDS["RESET"])
     
     def _read_loop(self):
         """Background thread for reading serial data."""
-        buffer = ""
+        buffer = bytearray()
         while self._running and self.serial:
             try:
-                if self.serial.in_waiting:
-                    chunk = self.serial.read(min(self.serial.in_waiting, 4096))
-                    buffer += chunk.decode('utf-8', errors='ignore')
-                    
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.strip()
-                        if line:
-                            self._parse_response(line)
-                else:
-                    time.sleep(0.01)
+                chunk = self._read_chunk()
+                if not chunk:
+                    continue
+                buffer += chunk
+                end = buffer.rfind(b'\n')
+                if end < 0:
+                    continue
+                
+                # Take every complete line at once, leaving the partial tail
+                lines = bytes(memoryview(buffer)[:end]).split(b'\n')
+                del buffer[:end + 1]
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        self._parse_response(line)
+
             except Exception as e:
                 if self._running and self.on_error:
                     self.on_error(f"Read error: {str(e)}")
                 time.sleep(0.1)
     
-    def _parse_response(self, line: str):
-        """Parse response from controller."""
-        parts = line.split()
-        if not parts:
+    def _read_chunk(self) -> bytes:
+        """Wait for serial input; returns b'' on timeout or wake-up."""
+        if self._wake_r is None:
+            # Block until the first byte arrives (or the port timeout
+            # expires so _running is rechecked), then take what is queued
+            return self.serial.read(min(self.serial.in_waiting, 4096) or 1)
+        
+        fd = self.serial.fileno()
+        ready, _, _ = select.select([fd, self._wake_r], [], [])
+        if self._wake_r in ready:
+            return b''
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            # Readable but empty: the device went away (as pyserial reports it)
+            raise serial.SerialException(
+                "device reports readiness to read but returned no data")
+        return chunk
+    
+    def _parse_response(self, line: bytes):
+        """Parse a raw response line from the controller."""
+        if not line.isascii():
+            # Drop undecodable bytes (line noise) like a text decode would
+            line = _text(line).encode()
+        
+        # DATA is nearly all of the traffic: skip the generic dispatch
+        if line.startswith(b"DATA "):
+            self._handle_data(line, line[5:])
             return
         
-        cmd = parts[0].upper()
+        # Only the keyword is split off; each handler parses its own arguments
+        sp = line.find(b' ')
+        if sp < 0:
+            cmd, rest = line, b""
+        else:
+            cmd, rest = line[:sp], line[sp + 1:]
         
-        if cmd == "OK":
-            msg = " ".join(parts[1:]) if len(parts) > 1 else "OK"
-            if self.on_response:
-                self.on_response(msg)
-            
-        elif cmd == "ERROR":
-            msg = " ".join(parts[1:]) if len(parts) > 1 else "Error"
-            if self.on_error:
-                self.on_error(msg)
-            
-        elif cmd == "STATUS":
-            try:
-                state = parts[1] if len(parts) > 1 else "UNKNOWN"
-                force = 0.0
-                position = 0.0
-                running = False
-                
-                for part in parts[2:]:
-                    if part.startswith("F:"):
-                        force = float(part[2:])
-                    elif part.startswith("P:"):
-                        position = float(part[2:])
-                    elif part.startswith("R:"):
-                        running = part[2:] == "1"
-                
-                status = Status(state, force, position, running)
+        handler = self._HANDLERS.get(cmd.upper())
+        if handler:
+            handler(self, line, rest)
+    
+    def _handle_ok(self, line: bytes, rest: bytes):
+        parts = rest.split()
+        msg = _text(b" ".join(parts)) if parts else "OK"
+        if self.on_response:
+            self.on_response(msg)
+    
+    def _handle_error(self, line: bytes, rest: bytes):
+        parts = rest.split()
+        msg = _text(b" ".join(parts)) if parts else "Error"
+        if self.on_error:
+            self.on_error(msg)
+    
+    def _handle_status(self, line: bytes, rest: bytes):
+        try:
+            m = _STATUS_RE.fullmatch(line)
+            if m:
+                status = Status(_text(m[1]), float(m[2]), float(m[3]), m[4] == b"1")
                 if self.on_status:
                     self.on_status(status)
-            except (ValueError, IndexError):
-                pass
-                
-        elif cmd == "FORCE":
-            try:
-                force = float(parts[1])
-                if self.on_force:
-                    self.on_force(force)
-            except (ValueError, IndexError):
-                pass
-                
-        elif cmd == "POS":
-            try:
-                position = float(parts[1])
-                if self.on_position:
-                    self.on_position(position)
-            except (ValueError, IndexError):
-                pass
-                
-        elif cmd == "DATA":
-            try:
-                values = parts[1].split(',')
-                if len(values) >= 5:
-                    data = DataPoint(
-                        timestamp=float(values[0]),
-                        force=float(values[1]),
-                        extension=float(values[2]),
-                        stress=float(values[3]),
-                        strain=float(values[4])
-                    )
-                    if self.on_data:
-                        self.on_data(data)
-            except (ValueError, IndexError):
-                pass
-                
-        elif cmd == "ID":
-            if self.on_response:
-                self.on_response(line)
+                return
+            
+            # Any other layout: fields in any order, missing ones default
+            parts = rest.split()
+            state = _text(parts[0]) if parts else "UNKNOWN"
+            force = 0.0
+            position = 0.0
+            running = False
             
-        elif cmd == "CONFIG":
-            if self.on_response:
-                self.on_response(line)
+            for part in parts[1:]:
+                if part.startswith(b"F:"):
+                    force = float(part[2:])
+                elif part.startswith(b"P:"):
+                    position = float(part[2:])
+                elif part.startswith(b"R:"):
+                    running = part[2:] == b"1"
+            
+            status = Status(state, force, position, running)
+            if self.on_status:
+                self.on_status(status)
+        except (ValueError, IndexError):
+            pass
+    
+    def _handle_force(self, line: bytes, rest: bytes):
+        try:
+            force = float(rest.split()[0])
+            if self.on_force:
+                self.on_force(force)
+        except (ValueError, IndexError):
+            pass
+    
+    def _handle_pos(self, line: bytes, rest: bytes):
+        try:
+            position = float(rest.split()[0])
+            if self.on_position:
+                self.on_position(position)
+        except (ValueError, IndexError):
+            pass
+    
+    def _handle_data(self, line: bytes, rest: bytes):
+        try:
+            # timestamp, force, extension, stress, strain (extra fields ignored)
+            values = rest.split(b',', 5)
+            if len(values) >= 5 and self.on_data:
+                self.on_data(DataPoint(*map(float, values[:5])))
+        except (ValueError, IndexError):
+            pass
+    
+    def _handle_info(self, line: bytes, rest: bytes):
+        # ID and CONFIG replies are passed through whole
+        if self.on_response:
+            self.on_response(_text(line))
+    
+    # Response keyword -> handler
+    _HANDLERS = {
+        b"OK": _handle_ok,
+        b"ERROR": _handle_error,
+        b"STATUS": _handle_status,
+        b"FORCE": _handle_force,
+        b"POS": _handle_pos,
+        b"DATA": _handle_data,
+        b"ID": _handle_info,
+        b"CONFIG": _handle_info,
+    }
@@ -0,0 +1,45 @@
+"""
+Tests for the compiled CSV formatter
+
+format_rows must write the same bytes as printf "%.4f" for every value it
+accepts (abs(x) < MAX_EXACT_VALUE).
+"""
+
+import numpy as np
+
+from _csv_kernel import MAX_EXACT_VALUE, format_rows
+
+
+def _printf_rows(data):
+    """Reference output: each row joined with "," in "%.4f", one per line."""
+    return "".join(",".join(f"{v:.4f}" for v in row) + "\n" for row in data).encode()
+
+
+def test_matches_printf_on_ties_signs_and_range():
+    values = np.array([
+        0.00005, 0.00015, 1.00005, 2.5e-5, 0.12345, 123.45675, 1e-9,
+        -0.00004, -0.00005, -1.23456, -0.0, 0.0, -123.45675,
+        MAX_EXACT_VALUE * 0.999, -MAX_EXACT_VALUE * 0.999,
+    ])
+    data = values.reshape(-1, 1)
+    assert format_rows(data).tobytes() == _printf_rows(data)
+
+
+def test_matches_printf_on_random_values():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([
+        rng.integers(-10**8, 10**8, 5000) / 1e4 + 5e-5,  # near-ties
+        rng.uniform(-1, 1, 5000) * 10.0 ** rng.integers(-6, 11, 5000),
+    ])
+    data = values.reshape(-1, 1)
+    assert format_rows(data).tobytes() == _printf_rows(data)
+
+
+def test_rows_of_several_columns():
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(200, 5)) * 100
+    assert format_rows(data).tobytes() == _printf_rows(data)
+
+
+def test_no_rows():
+    assert format_rows(np.empty((0, 5))).tobytes() == b""